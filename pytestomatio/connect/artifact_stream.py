@@ -0,0 +1,131 @@
+import abc
+import io
+import zlib
+from typing import BinaryIO, Iterable
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSIONS = ('gzip', 'zstd')
+# artifacts worth compressing. Images, videos and archives are already compressed
+TEXT_CONTENT_TYPES = ('application/json', 'application/xml', 'application/javascript', 'application/x-ndjson')
+TEXT_EXTENSIONS = ('.log', '.har', '.json', '.txt', '.xml', '.html', '.csv', '.trace')
+
+
+class ArtifactTooLargeError(Exception):
+    pass
+
+
+def is_text_artifact(key: str, content_type: str) -> bool:
+    return content_type.startswith('text/') or content_type in TEXT_CONTENT_TYPES or \
+        key.lower().endswith(TEXT_EXTENSIONS)
+
+
+def as_stream(data: bytes | BinaryIO | Iterable[bytes]) -> BinaryIO:
+    """Returns readable binary stream for bytes, file-like object or iterator of byte chunks"""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return io.BytesIO(data)
+    if hasattr(data, 'read'):
+        return data
+    return io.BufferedReader(IteratorStream(iter(data)))
+
+
+class IteratorStream(io.RawIOBase):
+    """Read-only stream over iterator of byte chunks. Only one chunk is held in memory"""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buffer = b''
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = bytes(chunk)
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+class _ReaderStream(io.RawIOBase):
+    """Base for streams that transform data read from the source stream"""
+
+    def __new__(cls, *args, **kwargs):
+        # io base classes are implemented in C and do not check abstract methods on instantiation
+        if cls.__abstractmethods__:
+            raise TypeError(f"Can't instantiate abstract class {cls.__name__} "
+                            f"without {', '.join(sorted(cls.__abstractmethods__))}")
+        return super().__new__(cls)
+
+    def __init__(self, source: BinaryIO):
+        self.source = source
+        self._buffer = b''
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    @abc.abstractmethod
+    def _fill(self, size: int) -> bytes:
+        """Returns next transformed data read with at most size bytes from the source. Sets _eof at the end"""
+
+    def readinto(self, b) -> int:
+        while not self._buffer and not self._eof:
+            self._buffer = self._fill(len(b))
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+class LimitedStream(_ReaderStream):
+    """Raises ArtifactTooLargeError as soon as more than max_size bytes are read from the source"""
+
+    def __init__(self, source: BinaryIO, max_size: int):
+        super().__init__(source)
+        self.max_size = max_size
+        self.bytes_read = 0
+
+    def _fill(self, size: int) -> bytes:
+        data = self.source.read(size)
+        if not data:
+            self._eof = True
+            return b''
+        self.bytes_read += len(data)
+        if self.bytes_read > self.max_size:
+            raise ArtifactTooLargeError(f'artifact is larger than {self.max_size} bytes')
+        return data
+
+
+class CompressedStream(_ReaderStream):
+    """Compresses the source stream on the fly with gzip or zstd"""
+
+    def __init__(self, source: BinaryIO, compression: str):
+        super().__init__(source)
+        if compression == 'zstd':
+            if zstandard is None:
+                raise ImportError('zstd compression requires zstandard. Install it with: pip install pytestomatio[zstd]')
+            self._compressor = zstandard.ZstdCompressor().compressobj()
+        else:
+            # wbits=31 writes gzip header and trailer
+            self._compressor = zlib.compressobj(wbits=31)
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def _fill(self, size: int) -> bytes:
+        data = self.source.read(size)
+        if data:
+            self.bytes_in += len(data)
+            compressed = self._compressor.compress(data)
+        else:
+            self._eof = True
+            compressed = self._compressor.flush()
+        self.bytes_out += len(compressed)
+        return compressed
@@ -0,0 +1,76 @@
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+
+from pytestomatio.connect.s3_connector import S3Connector
+
+log = logging.getLogger('pytestomatio')
+
+
+class ArtifactUploader:
+    """Uploads test artifacts to S3 in background threads, so test teardown does not wait for S3.
+
+    Object keys are known before upload, so links are returned at once and reported with test results.
+    Uploads are awaited at the end of the session with wait(), which reports failed uploads in a summary.
+    Files must not be removed before the session ends.
+    """
+
+    def __init__(self, s3_connector: S3Connector, concurrency: int = None):
+        self.s3_connector = s3_connector
+        self._executor = ThreadPoolExecutor(max_workers=concurrency or s3_connector.upload_concurrency,
+                                            thread_name_prefix='testomatio-artifacts')
+        self._uploads: list[tuple[str, str, Future]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return sum(1 for _, _, future in self._uploads if not future.done())
+
+    def submit(self, file_list, bucket_name: str = None) -> list[str]:
+        """Schedules upload of (file_path, key) pairs. Returns links of scheduled files in the order of file_list"""
+        if not self.s3_connector._is_logged_in:
+            log.warning('s3 session is not created, artifacts upload skipped')
+            return []
+        links = []
+        for file_path, key in file_list:
+            if not os.path.isfile(file_path):
+                log.error(f'artifact {file_path} not found, upload skipped')
+                continue
+            # with content keys the file is hashed here, so the link is known before upload
+            try:
+                key = self.s3_connector.object_key(file_path, key)
+            except OSError as e:
+                log.error(f'failed to read artifact {file_path}, upload skipped: {e}')
+                continue
+            future = self._executor.submit(self.s3_connector.put_file, file_path, key, bucket_name)
+            with self._lock:
+                self._uploads.append((file_path, key, future))
+            links.append(self.s3_connector.object_url(key, bucket_name))
+        return links
+
+    def wait(self, timeout: float = None) -> dict:
+        """Waits for scheduled uploads and logs failed ones. Returns summary of uploads"""
+        with self._lock:
+            uploads = list(self._uploads)
+        done, not_done = wait([future for _, _, future in uploads], timeout)
+        failed = []
+        for file_path, key, future in uploads:
+            if future not in done:
+                failed.append((file_path, 'upload timed out'))
+            elif future.exception() is not None:
+                failed.append((file_path, str(future.exception())))
+        summary = {'scheduled': len(uploads), 'uploaded': len(uploads) - len(failed), 'failed': failed}
+        if failed:
+            log.error(f'{len(failed)} of {len(uploads)} artifacts were not uploaded to S3:\n' +
+                      '\n'.join(f'  {file_path}: {error}' for file_path, error in failed))
+        elif uploads:
+            log.info(f'{len(uploads)} artifacts uploaded to S3')
+        return summary
+
+    def close(self, timeout: float = None) -> dict:
+        """Waits for uploads and stops upload threads"""
+        summary = self.wait(timeout)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        return summary
@@ -0,0 +1,234 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+
+from pytestomatio.connect.exception import MaxRetriesException, ReportFailedException
+from pytestomatio.connect.retry import RetryPolicy
+from pytestomatio.connect.transport import CONNECT_TIMEOUT_DEFAULT, READ_TIMEOUT_DEFAULT
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+log = logging.getLogger('pytestomatio')
+CONCURRENCY_DEFAULT = 20
+
+
+class AsyncConnector:
+    """Asynchronous client for Testomat.io reporter API.
+
+    Requests are executed on an asyncio event loop running in a dedicated thread, so many of them can be in flight
+    at once without blocking the pytest main thread. Every API method returns concurrent.futures.Future
+    with the same result as the corresponding Connector method.
+    Proxy and SSL verification are given by the caller, usually as resolved by Connector.get_proxy_settings.
+    Requires aiohttp: pip install pytestomatio[async]
+    """
+
+    def __init__(self, base_url: str, api_key: str, retry_policy: RetryPolicy,
+                 concurrency: int = CONCURRENCY_DEFAULT,
+                 timeout: tuple[float, float] = (CONNECT_TIMEOUT_DEFAULT, READ_TIMEOUT_DEFAULT),
+                 proxy: str = None, verify_ssl: bool = True):
+        if aiohttp is None:
+            raise ImportError('Async reporting requires aiohttp. Install it with: pip install pytestomatio[async]')
+        self.base_url = base_url
+        self.api_key = api_key
+        self.retry_policy = retry_policy
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.proxy = proxy
+        self.verify_ssl = verify_ssl
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='testomatio-async', daemon=True)
+        self._session = None
+        # set when testomat.io rejected a report (ex. invalid token), reporting should be aborted
+        self.report_failed = False
+        self._pending: set[Future] = set()
+        self._pending_lock = threading.Lock()
+
+    def start(self) -> None:
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._open(), self._loop).result()
+
+    async def _open(self) -> None:
+        connect_timeout, read_timeout = self.timeout
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.concurrency),
+            timeout=aiohttp.ClientTimeout(connect=connect_timeout, sock_read=read_timeout)
+        )
+
+    @property
+    def pending(self) -> int:
+        with self._pending_lock:
+            return len(self._pending)
+
+    def _submit(self, coro) -> Future:
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._forget)
+        return future
+
+    def _forget(self, future: Future) -> None:
+        with self._pending_lock:
+            self._pending.discard(future)
+
+    def wait(self, timeout: float = None) -> list[Future]:
+        """Waits for all scheduled requests. Returns futures finished with an exception"""
+        with self._pending_lock:
+            futures = list(self._pending)
+        failed = []
+        for future in futures:
+            try:
+                future.result(timeout)
+            except Exception:
+                failed.append(future)
+        return failed
+
+    def close(self, timeout: float = None) -> None:
+        """Waits for scheduled requests, closes HTTP session and stops the event loop thread"""
+        if not self._thread.is_alive():
+            return
+        self.wait(timeout)
+        asyncio.run_coroutine_threadsafe(self._session.close(), self._loop).result(timeout)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._loop.close()
+
+    def _is_retryable_error(self, error: Exception, method: str = 'get') -> bool:
+        if isinstance(error, aiohttp.ClientSSLError):
+            return False
+        if not self.retry_policy.is_idempotent(method):
+            # non-idempotent requests are retried only if they were not sent.
+            # ConnectionTimeoutError is available since aiohttp 3.10
+            connect_timeout_error = getattr(aiohttp, 'ConnectionTimeoutError', aiohttp.ClientConnectorError)
+            return isinstance(error, (aiohttp.ClientConnectorError, connect_timeout_error))
+        return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+    async def _request(self, method: str, url: str, payload: dict) -> tuple[int, dict | None]:
+        """Sends request with retry policy. Returns status code and json body"""
+        policy = self.retry_policy
+        deadline = policy.get_deadline()
+        for attempt in range(policy.max_attempts):
+            last_attempt = attempt + 1 >= policy.max_attempts
+            try:
+                async with self._session.request(method, url, json=payload, proxy=self.proxy,
+                                                 ssl=self.verify_ssl) as response:
+                    if not policy.should_retry(response.status, method):
+                        body = await response.json(content_type=None) if response.status < 400 else None
+                        return response.status, body
+                    retry_after = policy.retry_after(response.headers)
+                    log.error(f'Request attempt failed. Response code: {response.status}')
+            except Exception as e:
+                if not self._is_retryable_error(e, method) or last_attempt:
+                    log.error(f'Failed to connect to {self.base_url}: {e}')
+                    raise
+                retry_after = None
+                log.error(f'Failed to connect to {self.base_url}: {e}')
+
+            if last_attempt:
+                break
+            delay = policy.backoff(attempt, retry_after)
+            if deadline is not None and self._loop.time() + delay > deadline:
+                log.error(f'Request deadline of {policy.deadline} seconds exceeded')
+                break
+            await asyncio.sleep(delay)
+
+        log.error(f'Retries attempts exceeded.')
+        raise MaxRetriesException()
+
+    def create_test_run(self, **run) -> Future:
+        request = {'api_key': self.api_key, **run}
+        return self._submit(self._run_request('post', f'{self.base_url}/api/reporter', request))
+
+    def update_test_run(self, id: str, **run) -> Future:
+        request = {'api_key': self.api_key, **run}
+        return self._submit(self._run_request('put', f'{self.base_url}/api/reporter/{id}', request))
+
+    async def _run_request(self, method: str, url: str, request: dict) -> dict | None:
+        filtered_request = {k: v for k, v in request.items() if v is not None}
+        try:
+            status, body = await self._request(method, url, filtered_request)
+        except Exception as e:
+            log.error(f'Failed to send test run request: {e}')
+            return
+        if status == 200:
+            log.info(f'Test run request succeeded {body.get("uid")}')
+            return body
+        log.error(f'Test run request failed. Status code: {status}')
+
+    def update_test_status(self, run_id: str, **test) -> Future:
+        return self._submit(self._update_test_status(run_id, test))
+
+    async def _update_test_status(self, run_id: str, test: dict) -> None:
+        log.info(f'Reporting test. Id: {test.get("test_id")}. Title: {test.get("title")}')
+        filtered_request = {k: v for k, v in test.items() if v is not None}
+        url = f'{self.base_url}/api/reporter/{run_id}/testrun?api_key={self.api_key}'
+        try:
+            status, _ = await self._request('post', url, filtered_request)
+        except Exception as e:
+            log.error(f'Failed to report test')
+            return
+        if status == 200:
+            log.info('Test status updated')
+            return
+        log.error(f"Failed to report test to Testomat.io. Status_code: {status}")
+        if status == 403:
+            self.report_failed = True
+            raise ReportFailedException
+
+    def send_batch(self, run_id: str, tests: list, batch_index: int) -> Future:
+        return self._submit(self._send_batch(run_id, tests, batch_index))
+
+    async def _send_batch(self, run_id: str, tests: list, batch_index: int) -> bool:
+        url = f'{self.base_url}/api/reporter/{run_id}/testrun?api_key={self.api_key}'
+        status, _ = await self._request('post', url, {'tests': tests, 'batch_index': batch_index})
+        if status == 200:
+            log.info(f'Tests status updated. Batch index: {batch_index}')
+            return True
+        log.error(f"Failed to report test to Testomat.io. Status_code: {status}")
+        if status == 403:
+            self.report_failed = True
+            raise ReportFailedException
+        return False
+
+    def batch_tests_upload(self, run_id: str, batch_size: int, tests: list, start_index: int = 1,
+                           index_step: int = 1) -> Future:
+        return self._submit(self._batch_tests_upload(run_id, batch_size, tests, start_index, index_step))
+
+    async def _batch_tests_upload(self, run_id: str, batch_size: int, tests: list,
+                                  start_index: int = 1, index_step: int = 1) -> dict | None:
+        if not tests:
+            log.info(f'No tests to report. Report skipped')
+            return
+        batches = [(i // batch_size * index_step + start_index, tests[i:i+batch_size])
+                   for i in range(0, len(tests), batch_size)]
+        results = await asyncio.gather(*(self._send_batch(run_id, batch, index) for index, batch in batches),
+                                       return_exceptions=True)
+        for result in results:
+            if isinstance(result, ReportFailedException):
+                raise result
+        return {
+            'batches': len(batches),
+            'sent': [index for (index, _), result in zip(batches, results) if result is True],
+            'failed': [index for (index, _), result in zip(batches, results) if result is not True],
+            'skipped': [],
+        }
+
+    def finish_test_run(self, run_id: str, is_final=False) -> Future:
+        return self._submit(self._finish_test_run(run_id, is_final))
+
+    async def _finish_test_run(self, run_id: str, is_final=False) -> None:
+        log.info(f'Finishing test run. Run id: {run_id}')
+        status_event = 'finish_parallel' if is_final else 'finish'
+        url = f'{self.base_url}/api/reporter/{run_id}?api_key={self.api_key}'
+        try:
+            status, _ = await self._request('put', url, {"status_event": status_event})
+        except Exception as e:
+            log.error(f'Failed to finish test run')
+            return
+        if status == 200:
+            log.info(f'Run successfully finished')
+        else:
+            log.error(f"Failed to finish testrun on Testomat.io. Status_code: {status}")
@@ -1,12 +1,23 @@
 import os
+import glob
+import json
+import hashlib
+import tempfile
+import threading
+from typing import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
-from requests.exceptions import HTTPError, ConnectionError
+from requests.exceptions import HTTPError
 import logging
 from os.path import join, normpath
 from os import getenv
 
 from pytestomatio.connect.exception import MaxRetriesException, ReportFailedException
+from pytestomatio.connect.response_cache import ResponseCache, CACHE_TTL_DEFAULT, CACHE_SIZE_DEFAULT
+from pytestomatio.connect.retry import RetryPolicy, MAX_DELAY_DEFAULT, DEADLINE_DEFAULT
+from pytestomatio.connect.transport import TestomatioAdapter, POOL_SIZE_DEFAULT, CONNECT_TIMEOUT_DEFAULT, \
+    READ_TIMEOUT_DEFAULT
 from pytestomatio.utils.helper import safe_string_list
 from pytestomatio.testing.testItem import TestItem
 import time
@@ -14,6 +25,9 @@ import time
 log = logging.getLogger('pytestomatio')
 MAX_RETRIES_DEFAULT = 5
 RETRY_INTERVAL_DEFAULT = 5
+UPLOAD_CONCURRENCY_DEFAULT = 1
+# tests are imported in one request by default
+LOAD_CHUNK_SIZE_DEFAULT = 0
 
 STATUS_MESSAGES = {
     403: "Authentication failed. Please check your Testomatio project token. It may be invalid or expired"
@@ -24,17 +38,71 @@ class Connector:
     def __init__(self, base_url: str = '', api_key: str = None):
         max_retries = os.environ.get('TESTOMATIO_MAX_REQUEST_FAILURES', '')
         retry_interval = os.environ.get('TESTOMATIO_REQUEST_INTERVAL', '')
+        max_retry_delay = os.environ.get('TESTOMATIO_MAX_REQUEST_INTERVAL', '')
+        retry_deadline = os.environ.get('TESTOMATIO_REQUEST_DEADLINE', '')
+        upload_concurrency = os.environ.get('TESTOMATIO_UPLOAD_CONCURRENCY', '')
+        proxy_check_ttl = os.environ.get('TESTOMATIO_PROXY_CHECK_TTL', '')
+        connect_timeout = os.environ.get('TESTOMATIO_CONNECT_TIMEOUT', '')
+        read_timeout = os.environ.get('TESTOMATIO_READ_TIMEOUT', '')
+        compress_requests = os.environ.get('TESTOMATIO_COMPRESS_REQUESTS') in ['True', 'true', '1']
+        load_chunk_size = os.environ.get('TESTOMATIO_LOAD_CHUNK_SIZE', '')
+        response_cache = os.environ.get('TESTOMATIO_RESPONSE_CACHE') in ['True', 'true', '1']
+        response_cache_ttl = os.environ.get('TESTOMATIO_RESPONSE_CACHE_TTL', '')
+        response_cache_size = os.environ.get('TESTOMATIO_RESPONSE_CACHE_SIZE', '')
         self.base_url = base_url
-        self._session = requests.Session()
         self.jwt: str = ''
         self.api_key = api_key
-        self.max_retries = int(max_retries) if max_retries.isdigit() else MAX_RETRIES_DEFAULT
-        self.retry_interval = int(retry_interval) if retry_interval.isdigit() else RETRY_INTERVAL_DEFAULT
+        self.retry_policy = RetryPolicy(
+            max_attempts=int(max_retries) if max_retries.isdigit() else MAX_RETRIES_DEFAULT,
+            base_delay=int(retry_interval) if retry_interval.isdigit() else RETRY_INTERVAL_DEFAULT,
+            max_delay=int(max_retry_delay) if max_retry_delay.isdigit() else MAX_DELAY_DEFAULT,
+            deadline=int(retry_deadline) if retry_deadline.isdigit() else DEADLINE_DEFAULT
+        )
+        self.upload_concurrency = int(upload_concurrency) if (upload_concurrency.isdigit() and int(upload_concurrency) > 0) \
+            else UPLOAD_CONCURRENCY_DEFAULT
+        self.load_chunk_size = int(load_chunk_size) if load_chunk_size.isdigit() else LOAD_CHUNK_SIZE_DEFAULT
+        self.response_cache = ResponseCache(
+            directory=os.environ.get('TESTOMATIO_RESPONSE_CACHE_DIR') or join(tempfile.gettempdir(), 'testomatio-cache'),
+            ttl=int(response_cache_ttl) if response_cache_ttl.isdigit() else CACHE_TTL_DEFAULT,
+            max_size=(int(response_cache_size) if response_cache_size.isdigit() else CACHE_SIZE_DEFAULT) * 1024 * 1024
+        ) if response_cache else None
+        # proxy settings are resolved once per connector. If TTL is set, they are re-checked after it expires
+        self.proxy_check_ttl = int(proxy_check_ttl) if proxy_check_ttl.isdigit() else None
+        self._proxy_checked_at: float | None = None
+        self._proxy_lock = threading.Lock()
+
+        self.timeout = (int(connect_timeout) if connect_timeout.isdigit() else CONNECT_TIMEOUT_DEFAULT,
+                        int(read_timeout) if read_timeout.isdigit() else READ_TIMEOUT_DEFAULT)
+        # main thread and streaming reporter use the pool together with concurrent batch uploads
+        self.adapter = TestomatioAdapter(pool_size=max(POOL_SIZE_DEFAULT, self.upload_concurrency + 2),
+                                         timeout=self.timeout, compress=compress_requests)
+        self._session = requests.Session()
+        self._session.mount('https://', self.adapter)
+        self._session.mount('http://', self.adapter)
+
+    @property
+    def max_retries(self) -> int:
+        return self.retry_policy.max_attempts
+
+    @max_retries.setter
+    def max_retries(self, value: int):
+        self.retry_policy.max_attempts = value
+
+    @property
+    def retry_interval(self) -> float:
+        return self.retry_policy.base_delay
+
+    @retry_interval.setter
+    def retry_interval(self, value: float):
+        self.retry_policy.base_delay = value
 
     @property
     def session(self):
-        """Get the session, creating it and applying proxy settings if necessary."""
-        self._apply_proxy_settings()
+        """Get the session, applying proxy settings on first access or when proxy check is expired."""
+        if self._proxy_check_expired():
+            with self._proxy_lock:
+                if self._proxy_check_expired():
+                    self._apply_proxy_settings()
         return self._session
 
     @session.setter
@@ -43,6 +111,11 @@ class Connector:
         self._session = value
         self._apply_proxy_settings()
 
+    def _proxy_check_expired(self) -> bool:
+        if self._proxy_checked_at is None:
+            return True
+        return self.proxy_check_ttl is not None and time.monotonic() - self._proxy_checked_at > self.proxy_check_ttl
+
     def _apply_proxy_settings(self):
         """Apply proxy settings based on environment variables, fallback to no proxy if unavailable."""
         http_proxy = getenv("HTTP_PROXY")
@@ -60,9 +133,18 @@ class Connector:
             log.debug("No proxy settings found. Using a direct connection.")
             self._session.proxies.clear()
             self._session.verify = True
-            self._test_proxy_connection()
-
-    def _test_proxy_connection(self, test_url="https://api.ipify.org?format=json", timeout=30, retry_interval=1):
+        self._proxy_checked_at = time.monotonic()
+
+    def get_proxy_settings(self) -> tuple[str | None, bool]:
+        """Returns proxy URL and SSL verification flag resolved for the session, so other clients
+        connect to Testomat.io the same way"""
+        session = self.session
+        return session.proxies.get('https') or session.proxies.get('http'), session.verify
+
+    def _test_proxy_connection(self, test_url: str = None, timeout=30, retry_interval=1):
+        """Checks that Testomat.io is reachable with current session settings.
+        Any HTTP response, including error status, means the proxy is reachable"""
+        test_url = test_url or self.base_url
         log.debug("Current session: %s", self._session.proxies)
         log.debug("Current verify: %s", self._session.verify)
 
@@ -70,14 +152,13 @@ class Connector:
         while time.time() - start_time < timeout:
             try:
                 response = self._session.get(test_url, timeout=5)
-                response.raise_for_status()
-                log.debug("Internet connection is available.")
+                log.debug(f"{test_url} is available. Status code: {response.status_code}")
                 return True
             except requests.exceptions.RequestException as e:
-                log.error("Internet connection is unavailable. Error: %s", e)
+                log.error("%s is unavailable. Error: %s", test_url, e)
                 time.sleep(retry_interval)
         
-        log.error("Internet connection check timed out after %d seconds.", timeout)
+        log.error("Connection check timed out after %d seconds.", timeout)
         return False
 
     def _show_status_message(self, status_code: int):
@@ -89,37 +170,60 @@ class Connector:
         if status_code == 403:
             raise ReportFailedException
 
-    def _should_retry(self, response: requests.Response) -> bool:
+    def _should_retry(self, response: requests.Response, method: str = 'get') -> bool:
         """Checks if request should be retried.
-        Retry only on 501+ status codes
+        Retry on 408, 429 and 501+ status codes. POST requests are retried on 429 and 503 only
         """
-        return response.status_code >= 501
+        return self.retry_policy.should_retry(response.status_code, method)
+
+    def _get_retry_delay(self, attempt: int, deadline: float | None, response: requests.Response = None) -> float | None:
+        """Returns delay before the next attempt or None if there are no attempts or time left"""
+        policy = self.retry_policy
+        if attempt + 1 >= policy.max_attempts:
+            return None
+        retry_after = policy.retry_after(response.headers) if response is not None else None
+        delay = policy.backoff(attempt, retry_after)
+        if deadline is not None and time.monotonic() + delay > deadline:
+            if retry_after is not None:
+                log.error(f'Server asked to retry in {retry_after:.0f} seconds, '
+                          f'after request deadline of {policy.deadline} seconds')
+            else:
+                log.error(f'Request deadline of {policy.deadline} seconds exceeded')
+            return None
+        return delay
 
     def _send_request_with_retry(self, method: str, url: str, **kwargs):
         """Send HTTP request with retry logic"""
+        deadline = self.retry_policy.get_deadline()
         for attempt in range(self.max_retries):
             log.debug(f'Trying to send request to {self.base_url}. Attempt {attempt+1}/{self.max_retries}')
             try:
                 request_func = getattr(self.session, method)
                 response = request_func(url, **kwargs)
-
-                if self._should_retry(response):
-                    if attempt < self.max_retries:
-                        log.error(f'Request attempt failed. Response code: {response.status_code}. '
-                                  f'Retrying in {self.retry_interval} seconds')
-                        time.sleep(self.retry_interval)
-                        continue
-
-                return response
-            except ConnectionError as ce:
-                log.error(f'Failed to connect to {self.base_url}: {ce}')
-                raise
             except HTTPError as he:
                 log.error(f'HTTP error occurred while connecting to {self.base_url}: {he}')
                 raise
             except Exception as e:
-                log.error(f'An unexpected exception occurred. Please report an issue: {e}')
-                raise
+                if not self.retry_policy.is_retryable_error(e, method):
+                    log.error(f'An unexpected exception occurred. Please report an issue: {e}')
+                    raise
+                delay = self._get_retry_delay(attempt, deadline)
+                if delay is None:
+                    log.error(f'Failed to connect to {self.base_url}: {e}')
+                    raise
+                log.error(f'Failed to connect to {self.base_url}: {e}. Retrying in {delay:.1f} seconds')
+                time.sleep(delay)
+                continue
+
+            if not self._should_retry(response, method):
+                return response
+
+            delay = self._get_retry_delay(attempt, deadline, response)
+            if delay is None:
+                break
+            log.error(f'Request attempt failed. Response code: {response.status_code}. '
+                      f'Retrying in {delay:.1f} seconds')
+            time.sleep(delay)
 
         log.error(f'Retries attempts exceeded.')
         raise MaxRetriesException()
@@ -132,9 +236,23 @@ class Connector:
             structure: bool = False,
             create: bool = False,
             directory: str = None
-    ):
+    ) -> dict:
+        """Imports tests into the project. With TESTOMATIO_LOAD_CHUNK_SIZE tests are sent in chunks of this size,
+        so the request body is bounded. Imported chunks are remembered until the whole import succeeds,
+        so sync of the same tests started again after a failure sends only the rest of the chunks.
+        Returns summary with number of loaded, skipped and failed chunks and number of loaded tests
+        """
         url = f'{self.base_url}/api/load?api_key={self.api_key}'
-        request = {
+        labels = safe_string_list(getenv('TESTOMATIO_SYNC_LABELS'))
+        chunk_size = self.load_chunk_size or max(len(tests), 1)
+        starts = range(0, max(len(tests), 1), chunk_size)
+        if len(starts) > 1 and not no_detach:
+            # each chunk is a separate import, tests of other chunks must not be detached by it
+            log.warning(f'Tests are imported in {len(starts)} chunks, detach of tests is disabled. '
+                        f'Tests removed from the code stay attached on testomat.io. '
+                        f'Sync them without TESTOMATIO_LOAD_CHUNK_SIZE to detach them')
+            no_detach = True
+        chunks = [{
             "framework": "pytest",
             "language": "python",
             "noempty": no_empty,
@@ -142,44 +260,130 @@ class Connector:
             "structure": structure if not no_empty else False,
             "create": create,
             "sync": True,
-            "tests": []
-        }
-        for test in tests:
-            request['tests'].append({
-                "name": test.sync_title,
-                "suites": [
-                    test.class_name
-                ],
-                "code": test.source_code,
-                "description": test.docstring,
-                "file": test.file_path if structure else (
-                    test.file_name if directory is None else normpath(join(directory, test.file_name))),
-                "labels": safe_string_list(getenv('TESTOMATIO_SYNC_LABELS')),
-            })
-
+            "tests": [self._load_test_payload(test, structure, directory, labels)
+                      for test in tests[start:start + chunk_size]]
+        } for start in starts]
+
+        progress_path, chunk_keys, loaded_chunks = None, [None] * len(chunks), set()
+        if len(chunks) > 1:
+            chunk_keys = [hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode()).hexdigest()
+                          for request in chunks]
+            # progress is kept per import, so sync of changed tests does not skip chunks of the previous one
+            progress_path = self._load_progress_path(hashlib.sha256(''.join(chunk_keys).encode()).hexdigest())
+            loaded_chunks = self._read_load_progress(progress_path)
+
+        summary = {'chunks': len(starts), 'loaded': 0, 'skipped': 0, 'failed': 0, 'tests': 0}
         log.info(f'Starting tests loading to {self.base_url}')
-        try:
-            response = self._send_request_with_retry('post', url, json=request)
-        except Exception as e:
-            log.error(f'Failed to load tests to {self.base_url}')
-            return
+        for number, (request, chunk_key) in enumerate(zip(chunks, chunk_keys), 1):
+            if chunk_key in loaded_chunks:
+                log.info(f'Chunk {number}/{len(starts)} was loaded before. Skipped')
+                summary['skipped'] += 1
+                continue
 
-        if response.status_code < 400:
-            log.info(f'Tests loaded to {self.base_url}')
+            try:
+                response = self._send_request_with_retry('post', url, json=request)
+            except Exception as e:
+                summary['failed'] += 1
+                log.error(f'Failed to load tests to {self.base_url}: {e}')
+                break
+
+            if response.status_code < 400:
+                summary['loaded'] += 1
+                summary['tests'] += len(request['tests'])
+                if progress_path:
+                    loaded_chunks.add(chunk_key)
+                    self._write_load_progress(progress_path, loaded_chunks)
+                    log.info(f'Chunk {number}/{len(starts)} loaded. Tests: {len(request["tests"])}')
+            else:
+                summary['failed'] += 1
+                self._show_status_message(response.status_code)
+                log.error(f'Failed to load tests to {self.base_url}. Status code: {response.status_code}')
+                if response.status_code == 403:
+                    break
+
+        if summary['failed']:
+            log.error(f"{summary['failed']} of {len(starts)} chunks were not loaded. "
+                      f"Run sync again to load them")
         else:
-            self._show_status_message(response.status_code)
-            log.error(f'Failed to load tests to {self.base_url}. Status code: {response.status_code}')
+            log.info(f'Tests loaded to {self.base_url}')
+            if progress_path and os.path.exists(progress_path):
+                os.remove(progress_path)
+        return summary
+
+    def _load_test_payload(self, test: TestItem, structure: bool, directory: str | None, labels: str | None) -> dict:
+        return {
+            "name": test.sync_title,
+            "suites": [
+                test.class_name
+            ],
+            "code": test.source_code,
+            "description": test.docstring,
+            "file": test.file_path if structure else (
+                test.file_name if directory is None else normpath(join(directory, test.file_name))),
+            "labels": labels,
+        }
+
+    def _load_progress_path(self, import_key: str) -> str:
+        """Returns progress file of the import. Progress of other imports into the project is removed"""
+        project = hashlib.sha256(f'{self.base_url}{self.api_key}'.encode()).hexdigest()[:16]
+        path = join(tempfile.gettempdir(), f'testomatio-load-{project}-{import_key[:16]}.json')
+        for stale_path in glob.glob(join(glob.escape(tempfile.gettempdir()), f'testomatio-load-{project}-*.json')):
+            if stale_path != path:
+                try:
+                    os.remove(stale_path)
+                except OSError:
+                    pass
+        return path
+
+    @staticmethod
+    def _read_load_progress(path: str) -> set:
+        try:
+            with open(path, encoding='utf-8') as file:
+                return set(json.load(file))
+        except (OSError, ValueError):
+            return set()
+
+    @staticmethod
+    def _write_load_progress(path: str, loaded_chunks: set) -> None:
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(sorted(loaded_chunks), file)
+
+    def _get_json(self, url: str, query: str, ttl: int = None) -> tuple[int, dict | None]:
+        """Sends GET request and returns status code with JSON body. If response cache is enabled, cached body
+        is returned while it is fresh, and revalidated with the server after that"""
+        if self.response_cache is None:
+            response = self._send_request_with_retry('get', url)
+            return response.status_code, response.json() if response.status_code < 400 else None
+
+        cache = self.response_cache
+        key = cache.make_key(self.base_url, self.api_key, query)
+        entry = cache.get(key)
+        if entry is not None and cache.is_fresh(entry, ttl):
+            log.debug(f'Using cached response of {query}')
+            return 200, entry['body']
+
+        response = self._send_request_with_retry('get', url, headers=cache.conditional_headers(entry))
+        if response.status_code == 304 and entry is not None:
+            log.debug(f'Cached response of {query} is not modified')
+            cache.touch(key)
+            return 200, entry['body']
+        if response.status_code >= 400:
+            return response.status_code, None
+        body = response.json()
+        cache.put(key, body, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return response.status_code, body
 
     def get_tests(self, test_metadata: list[TestItem]) -> dict:
         log.info('Trying to receive test ids from testomat.io')
         url = f'{self.base_url}/api/test_data?api_key={self.api_key}'
         try:
-            response = self._send_request_with_retry('get', url)
-            if response.status_code < 400:
+            # ids are requested right after tests are loaded, so cached response is always revalidated
+            status_code, body = self._get_json(url, 'test_data', ttl=0)
+            if status_code < 400:
                 log.info('Test ids received')
-                return response.json()
+                return body
             else:
-                self._show_status_message(response.status_code)
+                self._show_status_message(status_code)
                 log.error('Failed to get test ids from testomat.io')
         except Exception as e:
             log.error('Failed to get test ids from testomat.io')
@@ -188,15 +392,14 @@ class Connector:
         """
         Returns list of filtered tests from Testomat.io
         """
-        # TODO: add retry logic
         url = f'{self.base_url}/api/test_grep?api_key={self.api_key}&type={filter_type}&id={filter_value}'
         try:
-            response = self.session.get(url)
-            if response.status_code < 400:
+            status_code, body = self._get_json(url, f'test_grep?type={filter_type}&id={filter_value}')
+            if status_code < 400:
                 log.info(f'Received tests filtered by {filter_type}={filter_value} from {self.base_url}')
-                return response.json()
+                return body
             else:
-                log.error(f'Failed to receive tests from {self.base_url}. Status code: {response.status_code}')
+                log.error(f'Failed to receive tests from {self.base_url}. Status code: {status_code}')
         except Exception as e:
             log.error(f'An unexpected exception occurred. Please report an issue: {e}')
             return
@@ -321,37 +524,91 @@ class Connector:
 
             self._is_report_failed(response.status_code)
 
+    def send_batch(self, run_id: str, tests: list, batch_index: int) -> bool:
+        """Reports a single batch of test results into the test run.
+        Returns True if batch was accepted. Connection errors are propagated to the caller
+        """
+        url = f'{self.base_url}/api/reporter/{run_id}/testrun?api_key={self.api_key}'
+        request = {
+            'tests': tests,
+            'batch_index': batch_index
+        }
+        response = self._send_request_with_retry('post', url, json=request)
+        if response.status_code == 200:
+            log.info(f'Tests status updated. Batch index: {batch_index}')
+            return True
+
+        self._show_status_message(response.status_code)
+        log.error(f"Failed to report test to Testomat.io. Status_code: {response.status_code}")
+        self._is_report_failed(response.status_code)
+        return False
+
+    def _upload_batch(self, run_id: str, batch: list, batch_index: int, abort: threading.Event,
+                      on_sent: Callable[[int], None] = None) -> bool | None:
+        """Uploads a batch unless upload was aborted by a previous batch. Returns None for skipped batch"""
+        if abort.is_set():
+            return None
+        try:
+            sent = self.send_batch(run_id, batch, batch_index)
+            if sent and on_sent:
+                on_sent(batch_index)
+            return sent
+        except ReportFailedException:
+            abort.set()
+            raise
+        except Exception as e:
+            # retries are exhausted, server is not reachable - do not try the remaining batches
+            log.error(f'Failed to report test. Batch index: {batch_index}: {e}')
+            abort.set()
+            return False
+
     def batch_tests_upload(self, run_id: str,
                            batch_size: int,
-                           tests: list) -> None:
-        # TODO: add retry logic
+                           tests: list,
+                           concurrency: int = None,
+                           start_index: int = 1,
+                           on_sent: Callable[[int], None] = None,
+                           index_step: int = 1) -> dict | None:
+        """Reports tests into the test run split into batches of batch_size.
+        Up to `concurrency` batches are sent at the same time, each batch keeps batch_index by its position
+        counted from start_index with index_step. on_sent is called with index of each accepted batch as soon
+        as it is accepted, also when upload is aborted later by ReportFailedException.
+        Returns summary with indexes of sent, failed and skipped batches
+        """
         if not tests:
             log.info(f'No tests to report. Report skipped')
             return
 
+        concurrency = concurrency or self.upload_concurrency
+        batches = [(i // batch_size * index_step + start_index, tests[i:i+batch_size])
+                   for i in range(0, len(tests), batch_size)]
         log.info(f'Starting batch test report into test run. Run id: {run_id}, number of tests: {len(tests)}, '
-                 f'batch size: {batch_size}')
-        url = f'{self.base_url}/api/reporter/{run_id}/testrun?api_key={self.api_key}'
-
-        for i in range(0, len(tests), batch_size):
-            batch = tests[i:i+batch_size]
-            batch_index = i // batch_size + 1
-            request = {
-                'tests': batch,
-                'batch_index': batch_index
-            }
-            try:
-                response = self._send_request_with_retry('post', url, json=request)
-            except Exception as e:
-                log.error(f'Failed to report test')
-                return
-            if response.status_code == 200:
-                log.info(f'Tests status updated. Batch index: {batch_index}')
-            else:
-                self._show_status_message(response.status_code)
-                log.error(f"Failed to report test to Testomat.io. Status_code: {response.status_code}")
-
-                self._is_report_failed(response.status_code)
+                 f'batch size: {batch_size}, concurrency: {concurrency}')
+
+        abort = threading.Event()
+        results = {}
+        if concurrency > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='testomatio-upload') as executor:
+                futures = {executor.submit(self._upload_batch, run_id, batch, batch_index, abort, on_sent): batch_index
+                           for batch_index, batch in batches}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+        else:
+            for batch_index, batch in batches:
+                results[batch_index] = self._upload_batch(run_id, batch, batch_index, abort, on_sent)
+
+        summary = {
+            'batches': len(batches),
+            'sent': sorted(index for index, result in results.items() if result),
+            'failed': sorted(index for index, result in results.items() if result is False),
+            'skipped': sorted(index for index, result in results.items() if result is None),
+        }
+        if summary['failed'] or summary['skipped']:
+            log.error(f"Batch report finished with errors. Sent: {len(summary['sent'])}/{len(batches)}, "
+                      f"failed: {summary['failed']}, skipped: {summary['skipped']}")
+        else:
+            log.info(f'Batch report finished. Sent: {len(batches)}/{len(batches)}')
+        return summary
 
     # TODO: I guess this class should be just an API client and used within testRun (testRunConfig)
     def finish_test_run(self, run_id: str, is_final=False) -> None:
@@ -369,5 +626,11 @@ class Connector:
             log.error(f'Failed to finish test run')
             return
 
+    def transport_stats(self) -> dict:
+        """Returns connection reuse and compression stats of the Testomat.io API adapter"""
+        return self.adapter.stats()
+
     def disconnect(self):
-        self.session.close()
+        log.info(f'Closing connection to {self.base_url}. Transport stats: {self.transport_stats()}')
+        # the session property would check proxy again if the check is expired
+        self._session.close()
@@ -0,0 +1,140 @@
+import logging
+import queue
+import threading
+import time
+
+from pytestomatio.connect.connector import Connector
+from pytestomatio.connect.exception import ReportFailedException
+
+log = logging.getLogger('pytestomatio')
+
+QUEUE_SIZE_DEFAULT = 1000
+FLUSH_INTERVAL_DEFAULT = 5
+_STOP = object()
+
+
+class StreamingReporter:
+    """Uploads finished test results to testomat.io in batches from a background thread,
+    so upload time overlaps test execution instead of being added at the end of the session.
+
+    Results are buffered in a bounded queue. When the queue is full, put() blocks the test process
+    until the worker catches up. A batch is sent when it reaches batch_size or when the oldest result
+    in it waits longer than flush_interval seconds.
+    """
+
+    def __init__(self, connector: Connector, run_id: str, batch_size: int,
+                 queue_size: int = QUEUE_SIZE_DEFAULT, flush_interval: float = FLUSH_INTERVAL_DEFAULT,
+                 start_index: int = 1, index_step: int = 1):
+        self.connector = connector
+        self.run_id = run_id
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.error: Exception | None = None
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._run, name='testomatio-reporter', daemon=True)
+        # incremented before each batch is sent
+        self._index_step = index_step
+        self._batch_index = start_index - index_step
+        # counters
+        self.enqueued = 0
+        self.sent = 0
+        self.dropped = 0
+        self.flushes = 0
+        self.failed_batches = 0
+        self.max_queue_depth = 0
+        self.last_flush_latency = 0.0
+        self.total_flush_latency = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread.is_alive()
+
+    def start(self) -> None:
+        log.debug(f'Starting streaming reporter. Batch size: {self.batch_size}, flush interval: {self.flush_interval}s')
+        self._thread.start()
+
+    def put(self, result: dict) -> None:
+        """Add finished test result to the upload queue. Blocks while the queue is full"""
+        self._queue.put(result)
+        self.enqueued += 1
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+
+    def stop(self, timeout: float = None) -> None:
+        """Send all queued results and stop the worker thread"""
+        if not self.is_running:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        if self.is_running:
+            log.error(f'Streaming reporter did not finish in {timeout} seconds. '
+                      f'{self.queue_depth} test results were not reported')
+        log.info(f'Streaming reporter finished. {self.stats()}')
+
+    def stats(self) -> dict:
+        return {
+            'enqueued': self.enqueued,
+            'sent': self.sent,
+            'dropped': self.dropped,
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'flushes': self.flushes,
+            'failed_batches': self.failed_batches,
+            'last_flush_latency': round(self.last_flush_latency, 3),
+            'avg_flush_latency': round(self.total_flush_latency / self.flushes, 3) if self.flushes else 0.0,
+        }
+
+    def _run(self) -> None:
+        batch = []
+        deadline = None
+        while True:
+            timeout = max(deadline - time.monotonic(), 0) if batch else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._flush(batch)
+                batch = []
+                continue
+
+            if item is _STOP:
+                self._flush(batch)
+                return
+
+            if not batch:
+                deadline = time.monotonic() + self.flush_interval
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                self._flush(batch)
+                batch = []
+
+    def _flush(self, batch: list) -> None:
+        if not batch:
+            return
+        # reporting is not possible anymore (ex. invalid token), keep draining the queue to not block tests
+        if self.error:
+            self.dropped += len(batch)
+            return
+
+        self._batch_index += self._index_step
+        started = time.monotonic()
+        try:
+            accepted = self.connector.send_batch(self.run_id, batch, self._batch_index)
+        except ReportFailedException as e:
+            log.error('Streaming report aborted. Remaining test results will not be reported')
+            self.error = e
+            accepted = False
+        except Exception as e:
+            log.error(f'Failed to report batch {self._batch_index}: {e}')
+            accepted = False
+
+        self.last_flush_latency = time.monotonic() - started
+        self.total_flush_latency += self.last_flush_latency
+        self.flushes += 1
+        if accepted:
+            self.sent += len(batch)
+        else:
+            self.failed_batches += 1
+            self.dropped += len(batch)
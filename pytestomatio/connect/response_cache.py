@@ -0,0 +1,105 @@
+import hashlib
+import json
+import logging
+import os
+import time
+
+log = logging.getLogger('pytestomatio')
+# cached responses are trusted without a request for this number of seconds
+CACHE_TTL_DEFAULT = 300
+# total size of cached responses in megabytes. The least recently used responses are evicted above it
+CACHE_SIZE_DEFAULT = 50
+
+
+class ResponseCache:
+    """On-disk cache of JSON responses of Testomat.io.
+
+    Each response is stored in its own file named by hash of the project and the query, together with
+    ETag and Last-Modified headers it was received with. Entries younger than TTL are used without a request.
+    Older entries are revalidated with If-None-Match/If-Modified-Since, if the server sent these headers,
+    and fetched again otherwise. Files are written atomically, so processes running at once share the cache
+    """
+
+    def __init__(self, directory: str, ttl: int = CACHE_TTL_DEFAULT, max_size: int = CACHE_SIZE_DEFAULT * 1024 * 1024):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_size = max_size
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Key is a hash, so api key is not written to the file name"""
+        return hashlib.sha256('\n'.join(str(part) for part in parts).encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.json')
+
+    def get(self, key: str) -> dict | None:
+        """Returns entry with body, etag, last_modified and stored_at, or None if response is not cached"""
+        try:
+            with open(self._path(key), encoding='utf-8') as file:
+                entry = json.load(file)
+                # modification time of the file is the time response was stored or last revalidated
+                entry['stored_at'] = os.fstat(file.fileno()).st_mtime
+                return entry
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            log.debug(f'Cached response {key} is not readable: {e}')
+            return None
+
+    def is_fresh(self, entry: dict, ttl: int = None) -> bool:
+        ttl = self.ttl if ttl is None else ttl
+        return time.time() - entry.get('stored_at', 0) < ttl
+
+    @staticmethod
+    def conditional_headers(entry: dict | None) -> dict:
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def put(self, key: str, body, etag: str = None, last_modified: str = None) -> None:
+        entry = {'body': body, 'etag': etag, 'last_modified': last_modified}
+        path = self._path(key)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as file:
+                json.dump(entry, file)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log.warning(f'Failed to cache response in {self.directory}: {e}')
+            return
+        self.evict()
+
+    def touch(self, key: str) -> None:
+        """Marks entry as revalidated: moves it to the end of eviction order and restarts its TTL"""
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            # removed by another process
+            pass
+
+    def evict(self) -> None:
+        """Removes the least recently stored entries until the cache fits max size"""
+        try:
+            entries = []
+            with os.scandir(self.directory) as files:
+                for file in files:
+                    if file.name.endswith('.json'):
+                        stat = file.stat()
+                        entries.append((stat.st_mtime, stat.st_size, file.path))
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                # removed by another process
+                pass
+            total -= size
@@ -0,0 +1,95 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+from typing import Mapping
+
+from requests.exceptions import ConnectionError, ConnectTimeout, ProxyError, Timeout, SSLError
+from urllib3.exceptions import ConnectTimeoutError
+
+MAX_DELAY_DEFAULT = 60
+DEADLINE_DEFAULT = 300
+RETRY_STATUS_CODES = {408, 429}
+# repeated request of these methods has the same effect as a single one
+IDEMPOTENT_METHODS = {'get', 'head', 'options', 'put', 'delete'}
+# responses that guarantee the request was not processed, so it can be sent again with any method
+UNPROCESSED_STATUS_CODES = {429, 503}
+
+
+class RetryPolicy:
+    """Retry policy for Testomat.io API requests.
+
+    Waits between attempts grow exponentially from base_delay and are randomized in [0, delay] (full jitter),
+    so many processes that failed at the same moment do not retry at the same moment. Retry-After header
+    of the response has precedence over the computed delay and is not capped by max_delay.
+    All attempts together are limited by deadline seconds.
+
+    Requests of non-idempotent methods (POST) are retried only if the server did not get them: on failures
+    to connect and on 429 and 503 responses. Otherwise a retry could create a duplicate run or results.
+    """
+
+    def __init__(self, max_attempts: int, base_delay: float, max_delay: float = MAX_DELAY_DEFAULT,
+                 deadline: float | None = DEADLINE_DEFAULT):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+
+    @staticmethod
+    def is_idempotent(method: str) -> bool:
+        return method.lower() in IDEMPOTENT_METHODS
+
+    def should_retry(self, status_code: int, method: str = 'get') -> bool:
+        """Retry on request timeout, rate limit and 501+ status codes.
+        Non-idempotent requests are retried only on 429 and 503"""
+        if not self.is_idempotent(method):
+            return status_code in UNPROCESSED_STATUS_CODES
+        return status_code in RETRY_STATUS_CODES or status_code >= 501
+
+    @staticmethod
+    def is_connect_error(error: Exception) -> bool:
+        """Checks if request failed before it was sent: connection was not established"""
+        if isinstance(error, (ConnectTimeout, ProxyError)):
+            return True
+        if isinstance(error, ConnectionError) and not isinstance(error, SSLError) and error.args:
+            # requests wraps urllib3 MaxRetryError, its reason tells at which phase the request failed.
+            # NewConnectionError and NameResolutionError are subclasses of ConnectTimeoutError
+            return isinstance(getattr(error.args[0], 'reason', None), ConnectTimeoutError)
+        return False
+
+    def is_retryable_error(self, error: Exception, method: str = 'get') -> bool:
+        """Connection failures and timeouts are retried. SSL errors won't be fixed by retrying.
+        Non-idempotent requests are retried only if connection failed"""
+        if isinstance(error, SSLError):
+            return False
+        if not self.is_idempotent(method):
+            return self.is_connect_error(error)
+        return isinstance(error, (ConnectionError, Timeout))
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float:
+        """Returns delay before the next attempt. attempt is zero based number of failed attempt.
+        Retry-After is returned as is, caller gives up if it is past the deadline"""
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def retry_after(self, headers: Mapping) -> float | None:
+        """Parses Retry-After header given in seconds or as HTTP date"""
+        value = headers.get('Retry-After') if headers else None
+        if not isinstance(value, str):
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
+
+    def get_deadline(self) -> float | None:
+        """Returns monotonic time after which request must not be retried"""
+        return time.monotonic() + self.deadline if self.deadline is not None else None
@@ -1,12 +1,30 @@
 import os
-from typing import Optional
+import hashlib
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, BinaryIO, Iterable
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
 import logging
-from io import BytesIO
 import mimetypes
 
+from pytestomatio.connect.artifact_stream import as_stream, is_text_artifact, LimitedStream, CompressedStream, \
+    ArtifactTooLargeError, COMPRESSIONS
+
 log = logging.getLogger(__name__)
 log.setLevel('INFO')
+MB = 1024 * 1024
+UPLOAD_CONCURRENCY_DEFAULT = 8
+MULTIPART_THRESHOLD_DEFAULT = 8
+MULTIPART_CHUNKSIZE_DEFAULT = 8
+# threads used by boto3 for parts of a single multipart upload
+TRANSFER_MAX_CONCURRENCY = 4
+HASH_CHUNK_SIZE = MB
+# streams hashed for content keys are kept in memory up to this size, larger ones are spooled to disk
+SPOOL_MAX_MEMORY = 8 * MB
 
 
 def parse_endpoint(endpoint: str = None) -> Optional[str]:
@@ -38,6 +56,31 @@ class S3Connector:
         self.aws_secret_access_key = aws_secret_access_key
         self.acl = acl
 
+        upload_concurrency = os.environ.get('TESTOMATIO_ARTIFACT_UPLOAD_CONCURRENCY', '')
+        multipart_threshold = os.environ.get('TESTOMATIO_ARTIFACT_MULTIPART_THRESHOLD', '')
+        multipart_chunksize = os.environ.get('TESTOMATIO_ARTIFACT_MULTIPART_CHUNKSIZE', '')
+        self.upload_concurrency = int(upload_concurrency) if (upload_concurrency.isdigit() and int(upload_concurrency) > 0) \
+            else UPLOAD_CONCURRENCY_DEFAULT
+        # thresholds are set in MB. Files smaller than threshold are uploaded with a single request
+        self.transfer_config = TransferConfig(
+            multipart_threshold=(int(multipart_threshold) if multipart_threshold.isdigit() else MULTIPART_THRESHOLD_DEFAULT) * MB,
+            multipart_chunksize=(int(multipart_chunksize) if multipart_chunksize.isdigit() else MULTIPART_CHUNKSIZE_DEFAULT) * MB,
+            max_concurrency=TRANSFER_MAX_CONCURRENCY
+        )
+        # name objects by hash of their content: identical artifacts are uploaded once and
+        # different files with the same name do not overwrite each other
+        self.content_keys = os.environ.get('TESTOMATIO_ARTIFACT_CONTENT_KEYS') in ['True', 'true', '1']
+        self._uploaded_keys: set[tuple[str, str]] = set()
+        self._uploaded_keys_lock = threading.Lock()
+        self.skipped_uploads = 0
+
+        max_artifact_size = os.environ.get('TESTOMATIO_ARTIFACT_MAX_SIZE', '')
+        compression = os.environ.get('TESTOMATIO_ARTIFACT_COMPRESSION', '').lower()
+        # size is set in MB. Larger artifacts are not uploaded
+        self.max_artifact_size = int(max_artifact_size) * MB if max_artifact_size.isdigit() else None
+        # compression of text artifacts uploaded with upload_file_object
+        self.compression = compression if compression in COMPRESSIONS else None
+
     def login(self):
         log.debug('creating s3 session')
         self.client = boto3.client(
@@ -45,37 +88,63 @@ class S3Connector:
             endpoint_url=f'https://{self.endpoint}',
             aws_access_key_id=self.aws_access_key_id,
             aws_secret_access_key=self.aws_secret_access_key,
-            region_name=self.aws_region_name
+            region_name=self.aws_region_name,
+            # every file upload thread may use several connections for multipart upload
+            config=Config(max_pool_connections=max(10, self.upload_concurrency * TRANSFER_MAX_CONCURRENCY))
             )
 
         self._is_logged_in = True
         log.info('s3 session created')
 
-    # TODO: upload files async
-    def upload_files(self, file_list, bucket_name: str = None):
-        links = []
-        for file_path, key in file_list:
-            link = self.upload_file(file_path=file_path, key=key, bucket_name=bucket_name)
-            links.append(link)
+    def upload_files(self, file_list, bucket_name: str = None) -> list[str]:
+        """Uploads files in parallel. Returns links of uploaded files in the order of file_list"""
+        file_list = list(file_list)
+        if len(file_list) <= 1 or self.upload_concurrency == 1:
+            links = [self.upload_file(file_path=file_path, key=key, bucket_name=bucket_name)
+                     for file_path, key in file_list]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.upload_concurrency, len(file_list)),
+                                    thread_name_prefix='testomatio-s3') as executor:
+                # map keeps results in the order of file_list
+                links = list(executor.map(
+                    lambda file: self.upload_file(file_path=file[0], key=file[1], bucket_name=bucket_name),
+                    file_list
+                ))
         return [link for link in links if link is not None]
 
 
-    def upload_file(self, file_path: str, key: str = None, bucket_name: str = None) -> Optional[str]:
-        if not self._is_logged_in:
-            log.warning('s3 session is not created, creating new one')
-            return
+    def object_key(self, file_path: str, key: str = None) -> str:
+        """Returns key of the file in the bucket. It is known before upload, so is the link to the file"""
         if not key:
             key = os.path.basename(file_path)
-        key = f"{self.bucker_prefix}/{key}"
+        if self.content_keys:
+            return self.content_key(file_digest(file_path), key)
+        return f"{self.bucker_prefix}/{key}"
+
+    def content_key(self, digest: str, name: str) -> str:
+        """Key made of content hash. Extension of the name is kept, so content type is detected by it"""
+        _, extension = os.path.splitext(name)
+        return f"{self.bucker_prefix}/{digest}{extension}"
+
+    def object_url(self, key: str, bucket_name: str = None) -> str:
+        return f'https://{bucket_name or self.bucket_name}.{self.endpoint}/{key}'
+
+    def put_file(self, file_path: str, key: str, bucket_name: str = None) -> str:
+        """Uploads file to the full object key. Unlike upload_file, errors are raised"""
         if not bucket_name:
             bucket_name = self.bucket_name
+        if self.max_artifact_size is not None and os.path.getsize(file_path) > self.max_artifact_size:
+            raise ArtifactTooLargeError(f'artifact is larger than {self.max_artifact_size // MB} MB')
+        if self.content_keys and not self._claim_key(key, bucket_name):
+            log.info(f'artifact {file_path} is already uploaded to s3://{bucket_name}/{key}')
+            return self.object_url(key, bucket_name)
 
         content_type, _ = mimetypes.guess_type(key)
         if content_type is None:
             content_type = 'application/octet-stream'
 
+        log.info(f'uploading artifact {file_path} to s3://{bucket_name}/{key}')
         try:
-            log.info(f'uploading artifact {file_path} to s3://{bucket_name}/{key}')
             self.client.upload_file(
                 file_path,
                 bucket_name,
@@ -84,39 +153,132 @@ class S3Connector:
                     'ACL': self.acl,
                     'ContentType': content_type,
                     'ContentDisposition': 'inline'
-                }
+                },
+                Config=self.transfer_config
             )
-            log.info(f'artifact {file_path} uploaded to s3://{bucket_name}/{key}')
-            return f'https://{bucket_name}.{self.endpoint}/{key}'
+        except Exception:
+            self._release_key(key, bucket_name)
+            raise
+        log.info(f'artifact {file_path} uploaded to s3://{bucket_name}/{key}')
+        return self.object_url(key, bucket_name)
+
+    def _claim_key(self, key: str, bucket_name: str) -> bool:
+        """Returns True if content key must be uploaded: it was not uploaded in this run and does not exist in bucket"""
+        with self._uploaded_keys_lock:
+            if (bucket_name, key) in self._uploaded_keys:
+                self.skipped_uploads += 1
+                return False
+            # claimed before upload, so the same content uploaded from parallel threads is sent once
+            self._uploaded_keys.add((bucket_name, key))
+        if self._object_exists(key, bucket_name):
+            with self._uploaded_keys_lock:
+                self.skipped_uploads += 1
+            return False
+        return True
+
+    def _release_key(self, key: str, bucket_name: str) -> None:
+        with self._uploaded_keys_lock:
+            self._uploaded_keys.discard((bucket_name, key))
+
+    def _object_exists(self, key: str, bucket_name: str) -> bool:
+        try:
+            self.client.head_object(Bucket=bucket_name, Key=key)
+            return True
+        except ClientError:
+            # missing object or no permission to read it, upload anyway
+            return False
+
+    def upload_file(self, file_path: str, key: str = None, bucket_name: str = None) -> Optional[str]:
+        if not self._is_logged_in:
+            log.warning('s3 session is not created, creating new one')
+            return
+        if not bucket_name:
+            bucket_name = self.bucket_name
+
+        try:
+            key = self.object_key(file_path, key)
+            return self.put_file(file_path, key, bucket_name)
         except Exception as e:
             log.error(f'failed to upload file {file_path} to s3://{bucket_name}/{key}: {e}')
 
-    def upload_file_object(self, file_bytes: bytes, key: str, bucket_name: str = None) -> Optional[str]:
+    def upload_file_object(self, file_bytes: bytes | BinaryIO | Iterable[bytes], key: str,
+                           bucket_name: str = None) -> Optional[str]:
+        """Uploads bytes, file-like object or iterator of byte chunks. Streams are read by parts,
+        so the whole artifact is never held in memory. Text artifacts are compressed if compression is enabled"""
         if not self._is_logged_in:
             log.warning('s3 session is not created, creating new one')
             return
-        file = BytesIO(file_bytes)
         if not bucket_name:
             bucket_name = self.bucket_name
-        key = f"{self.bucker_prefix}/{key}"
-
-        content_type, _ = mimetypes.guess_type(key)
-        if content_type is None:
-            content_type = 'application/octet-stream'
 
+        file = as_stream(file_bytes)
+        spooled = None
         try:
+            if self.content_keys:
+                spooled, digest = self._spool(file)
+                file = spooled
+                key = self.content_key(digest, key)
+                if not self._claim_key(key, bucket_name):
+                    log.info(f'artifact {key} is already uploaded to s3://{bucket_name}/{key}')
+                    return self.object_url(key, bucket_name)
+            else:
+                key = f"{self.bucker_prefix}/{key}"
+
+            content_type, _ = mimetypes.guess_type(key)
+            if content_type is None:
+                content_type = 'application/octet-stream'
+            extra_args = {
+                'ACL': self.acl,
+                'ContentType': content_type,
+                'ContentDisposition': 'inline'
+            }
+            if self.max_artifact_size is not None and spooled is None:
+                file = LimitedStream(file, self.max_artifact_size)
+            if self.compression and is_text_artifact(key, content_type):
+                # browsers decode content encoding, so link opens the original artifact
+                file = CompressedStream(file, self.compression)
+                extra_args['ContentEncoding'] = self.compression
+
             log.info(f'uploading artifact {key} to s3://{bucket_name}/{key}')
             self.client.upload_fileobj(
                 file,
                 bucket_name,
                 key,
-                ExtraArgs={
-                    'ACL': self.acl,
-                    'ContentType': content_type,
-                    'ContentDisposition': 'inline'
-                }
+                ExtraArgs=extra_args,
+                Config=self.transfer_config
             )
             log.info(f'artifact {key} uploaded to s3://{bucket_name}/{key}')
             return f'https://{bucket_name}.{self.endpoint}/{key}'
         except Exception as e:
+            self._release_key(key, bucket_name)
             log.error(f'failed to upload file {key} to s3://{bucket_name}/{key}: {e}')
+        finally:
+            if spooled is not None:
+                spooled.close()
+
+    def _spool(self, file: BinaryIO) -> tuple[BinaryIO, str]:
+        """Copies stream to a temporary file while hashing it. Content key must be known before upload"""
+        digest = hashlib.sha256()
+        size = 0
+        spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+        try:
+            for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b''):
+                size += len(chunk)
+                if self.max_artifact_size is not None and size > self.max_artifact_size:
+                    raise ArtifactTooLargeError(f'artifact is larger than {self.max_artifact_size // MB} MB')
+                digest.update(chunk)
+                spooled.write(chunk)
+        except Exception:
+            spooled.close()
+            raise
+        spooled.seek(0)
+        return spooled, digest.hexdigest()
+
+
+def file_digest(file_path: str) -> str:
+    """Returns sha256 of the file. File is read by chunks, so large videos are not loaded into memory"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
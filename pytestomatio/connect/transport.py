@@ -0,0 +1,68 @@
+import gzip
+import re
+from urllib.parse import urlparse
+
+from requests.adapters import HTTPAdapter
+
+POOL_SIZE_DEFAULT = 10
+CONNECT_TIMEOUT_DEFAULT = 10
+READ_TIMEOUT_DEFAULT = 120
+COMPRESS_MIN_SIZE = 1024
+# endpoints that receive large payloads: test import with source code and batch report
+COMPRESSED_PATHS = re.compile(r'^/api/load$|^/api/reporter/[^/]+/testrun$')
+
+
+class TestomatioAdapter(HTTPAdapter):
+    """HTTP adapter for Testomat.io API. Keeps a connection pool sized for concurrent uploads,
+    applies default connect/read timeouts and optionally gzips large request bodies"""
+
+    def __init__(self, pool_size: int = POOL_SIZE_DEFAULT,
+                 timeout: tuple[float, float] = (CONNECT_TIMEOUT_DEFAULT, READ_TIMEOUT_DEFAULT),
+                 compress: bool = False, compress_min_size: int = COMPRESS_MIN_SIZE):
+        self.timeout = timeout
+        self.compress = compress
+        self.compress_min_size = compress_min_size
+        self.requests_sent = 0
+        self.bytes_before_compression = 0
+        self.bytes_after_compression = 0
+        # pool_block makes threads wait for a free connection instead of opening connections that are thrown away
+        super().__init__(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        if self.compress:
+            self._compress_body(request)
+        self.requests_sent += 1
+        return super().send(request, **kwargs)
+
+    def _compress_body(self, request) -> None:
+        body = request.body
+        if not body or 'Content-Encoding' in request.headers:
+            return
+        if not COMPRESSED_PATHS.match(urlparse(request.url).path):
+            return
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        if not isinstance(body, bytes) or len(body) < self.compress_min_size:
+            return
+
+        compressed = gzip.compress(body)
+        self.bytes_before_compression += len(body)
+        self.bytes_after_compression += len(compressed)
+        request.body = compressed
+        request.headers['Content-Encoding'] = 'gzip'
+        request.headers['Content-Length'] = str(len(compressed))
+
+    def stats(self) -> dict:
+        """Returns number of sent requests and opened connections. Requests that did not open
+        a new connection reused a kept-alive one"""
+        pools = [self.poolmanager.pools.get(key) for key in self.poolmanager.pools.keys()]
+        connections = sum(pool.num_connections for pool in pools if pool)
+        return {
+            'requests': self.requests_sent,
+            'connections': connections,
+            'reused': max(self.requests_sent - connections, 0),
+            'bytes_before_compression': self.bytes_before_compression,
+            'bytes_after_compression': self.bytes_after_compression,
+        }
@@ -1,7 +1,14 @@
 import os
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from pytestomatio.decor.pep8 import update_tests as update_tests_pep8
 from pytestomatio.decor.default import update_tests as update_tests_default
 
+log = logging.getLogger('pytestomatio')
+# process pool is started only when there are enough files to pay off its start up
+PARALLEL_MIN_FILES = 20
+
 
 def update_tests(file: str,
                  mapped_tests: list[tuple[str, int, str]],
@@ -10,6 +17,51 @@ def update_tests(file: str,
                  remove=False):
     code_style = os.getenv('TESTOMATIO_CODE_STYLE', 'default')
     if code_style == 'pep8':
-        update_tests_pep8(file, mapped_tests, all_tests, decorator_name, remove)
+        return update_tests_pep8(file, mapped_tests, all_tests, decorator_name, remove)
     else:
-        update_tests_default(file, mapped_tests, all_tests, decorator_name, remove)
+        return update_tests_default(file, mapped_tests, all_tests, decorator_name, remove)
+
+
+def _update_file(args: tuple) -> bool:
+    return update_tests(*args)
+
+
+def update_files(files,
+                 mapped_tests: list[tuple[str, int, str]],
+                 all_tests: list[str],
+                 decorator_name: str,
+                 remove=False) -> dict:
+    """Adds or removes decorators in all test files.
+
+    Mapping is split by file name, so each file gets only ids of its own tests. On sync, files without tests
+    that have an id are not parsed. Files are written only if their content changed.
+    Files are processed by a process pool if TESTOMATIO_SYNC_WORKERS is not 1
+    """
+    mapping_by_file = {}
+    if not remove:
+        names = set(all_tests)
+        for title, test_id, file_name in mapped_tests:
+            if test_id is not None and title in names:
+                mapping_by_file.setdefault(file_name, []).append((title, test_id, file_name))
+
+    tasks = []
+    for file in files:
+        if remove:
+            tasks.append((file, [], [], decorator_name, True))
+            continue
+        file_mapping = mapping_by_file.get(Path(file).name)
+        if file_mapping:
+            tasks.append((file, file_mapping, [title for title, _, _ in file_mapping], decorator_name, False))
+
+    workers = os.environ.get('TESTOMATIO_SYNC_WORKERS', '')
+    workers = int(workers) if workers.isdigit() and int(workers) > 0 else os.cpu_count() or 1
+    if workers > 1 and len(tasks) >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            updated = list(executor.map(_update_file, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+    else:
+        updated = [_update_file(task) for task in tasks]
+
+    stats = {'files': len(files), 'skipped': len(files) - len(tasks), 'updated': sum(updated)}
+    log.info(f"Test files updated: {stats['updated']}, unchanged: {len(tasks) - stats['updated']}, "
+             f"skipped without changes: {stats['skipped']}")
+    return stats
@@ -9,11 +9,14 @@ class DecoratorUpdater(cst.CSTTransformer):
         self.all_tests = all_tests
         self.decorator_name = decorator_name
         self.filename = Path(file_path).name
+        # ids of tests from this file by title. The first mapping of the title is used
+        self._ids = {}
+        for title, test_id, filename in mapped_tests:
+            if filename == self.filename:
+                self._ids.setdefault(title, test_id)
 
     def _get_id_by_title(self, title: str):
-        for pair in self.mapped_tests:
-            if pair[0] == title and pair[2] == self.filename:
-                return pair[1]
+        return self._ids.get(title)
 
     def _remove_decorator(self, node: cst.FunctionDef) -> cst.FunctionDef:
         node.decorator_list = [decorator for decorator in node.decorator_list if
@@ -69,9 +72,12 @@ def update_tests(file: str,
                  mapped_tests: List[Tuple[str, int, str]],
                  all_tests: List[str],
                  decorator_name: str,
-                 remove=False):
+                 remove=False) -> bool:
+    """Adds or removes decorators in the file. Returns True if the file was changed"""
     with open(file, 'r') as f:
         source_code = f.read()
+    if remove and decorator_name not in source_code:
+        return False
 
     tree = cst.parse_module(source_code)
     transform = DecoratorUpdater(mapped_tests, all_tests, decorator_name, file)
@@ -82,6 +88,9 @@ def update_tests(file: str,
         transform = DecoratorUpdater(mapped_tests, all_tests, decorator_name, file)
         tree = tree.visit(transform)
     updated_source_code = tree.code
+    if updated_source_code == source_code:
+        return False
 
     with open(file, "w") as file:
-        file.write(updated_source_code)
\ No newline at end of file
+        file.write(updated_source_code)
+    return True
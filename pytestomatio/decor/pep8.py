@@ -12,15 +12,23 @@ class DecoratorUpdater(ast.NodeTransformer):
         self.all_tests = all_tests
         self.decorator_name = decorator_name
         self.filename = Path(file_path).name
+        # ids of tests from this file by title. The first mapping of the title is used
+        self._ids = {}
+        for title, test_id, filename in mapped_tests:
+            if filename == self.filename:
+                self._ids.setdefault(title, test_id)
+        # source is regenerated from the tree only if decorators were added or removed
+        self.changed = False
 
     def _get_id_by_title(self, title: str):
-        for pair in self.mapped_tests:
-            if pair[0] == title and pair[2] == self.filename:
-                return pair[1]
+        return self._ids.get(title)
 
     def _remove_decorator(self, node: ast.FunctionDef) -> ast.FunctionDef:
-        node.decorator_list = [decorator for decorator in node.decorator_list if
-                               not (isinstance(decorator, ast.Call) and decorator.func.attr == self.decorator_name)]
+        decorators = [decorator for decorator in node.decorator_list if
+                      not (isinstance(decorator, ast.Call) and decorator.func.attr == self.decorator_name)]
+        if len(decorators) != len(node.decorator_list):
+            node.decorator_list = decorators
+            self.changed = True
         return node
 
     def remove_decorators(self, tree: ast.Module) -> ast.Module:
@@ -38,9 +46,13 @@ class DecoratorUpdater(ast.NodeTransformer):
                            decorator.func.attr == self.decorator_name
                            for decorator in node.decorator_list):
                     test_id = self._get_id_by_title(node.name)
+                    # test is not synced with testomat.io
+                    if test_id is None:
+                        return node
                     deco_name = f'mark.{self.decorator_name}(\'{test_id}\')'
                     decorator = ast.Name(id=deco_name, ctx=ast.Load())
                     node.decorator_list = [decorator] + node.decorator_list
+                    self.changed = True
         return node
 
     def insert_pytest_mark_import(self, tree: ast.Module, module_name: str, decorator_name: str) -> None:
@@ -63,9 +75,12 @@ def update_tests(file: str,
                  mapped_tests: list[tuple[str, int, str]],
                  all_tests: list[str],
                  decorator_name: str,
-                 remove=False):
+                 remove=False) -> bool:
+    """Adds or removes decorators in the file. Returns True if the file was changed"""
     with open(file, 'r') as f:
         source_code = f.read()
+    if remove and decorator_name not in source_code:
+        return False
 
     tree = ast.parse(source_code)
     transform = DecoratorUpdater(mapped_tests, all_tests, decorator_name, file)
@@ -74,9 +89,15 @@ def update_tests(file: str,
     else:
         tree = transform.visit(tree)
         transform.insert_pytest_mark_import(tree, *pytest_mark)
+    # unparse reformats the whole file, so it is not written when there is nothing to change
+    if not transform.changed:
+        return False
     updated_source_code = ast.unparse(tree)
 
     pep8_source_code = autopep8.fix_code(updated_source_code)
+    if pep8_source_code == source_code:
+        return False
 
     with open(file, "w") as file:
-        file.write(pep8_source_code)
\ No newline at end of file
+        file.write(pep8_source_code)
+    return True
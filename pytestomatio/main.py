@@ -4,19 +4,26 @@ from os.path import join, normpath
 
 from pytest import Parser, Session, Config, Item, CallInfo
 from pytestomatio.connect.connector import Connector
+from pytestomatio.connect.async_connector import AsyncConnector
 from pytestomatio.connect.exception import ReportFailedException
 from pytestomatio.connect.s3_connector import S3Connector
+from pytestomatio.connect.reporter import StreamingReporter
+from pytestomatio.connect.artifact_uploader import ArtifactUploader
 from pytestomatio.testing.testItem import TestItem
-from pytestomatio.decor.decorator_updater import update_tests
+from pytestomatio.decor.decorator_updater import update_files
 
 from pytestomatio.utils.helper import add_and_enrich_tests, get_test_mapping, collect_tests, read_env_s3_keys
 from pytestomatio.utils.parser_setup import parser_options
 from pytestomatio.utils.logging import get_test_logs, clear_test_logs
 from pytestomatio.utils.steps import _step_managers
+from pytestomatio.utils.sync_manifest import SyncManifest, MANIFEST_FILE
 from pytestomatio.utils import validations
 
 from pytestomatio.testomatio.testRunConfig import TestRunConfig
 from pytestomatio.testomatio.testomatio import Testomatio
+from pytestomatio.testomatio.result_record import ResultRecord
+from pytestomatio.testomatio.result_journal import ResultJournal
+from pytestomatio.testomatio.result_transport import WorkerResultSender, ResultReceiver, worker_batch_indexes
 from pytestomatio.testomatio.filter_plugin import TestomatioFilterPlugin
 
 from pytestomatio.services.artifact_storage import artifact_storage
@@ -80,6 +87,13 @@ def pytest_configure(config: Config):
     project = os.environ.get('TESTOMATIO')
 
     pytest.testomatio.connector = Connector(url, project)
+    if option == 'report' and pytest.testomatio.test_run_config.async_report:
+        connector = pytest.testomatio.connector
+        proxy, verify_ssl = connector.get_proxy_settings()
+        pytest.testomatio.async_connector = AsyncConnector(url, project, connector.retry_policy,
+                                                           timeout=connector.timeout,
+                                                           proxy=proxy, verify_ssl=verify_ssl)
+        pytest.testomatio.async_connector.start()
     run_env = config.getoption('testRunEnv')
     if run_env:
         pytest.testomatio.test_run_config.set_env(run_env)
@@ -90,6 +104,24 @@ def pytest_configure(config: Config):
         run.clear_run_id()
         pytest.exit('Finish command executed. Exiting without test execution...')
 
+    if option == 'resend':
+        run: TestRunConfig = pytest.testomatio.test_run_config
+        journals = ResultJournal.find(run.journal_dir, run.test_run_id)
+        if not journals:
+            pytest.exit(f'No results of run {run.test_run_id} found in {run.journal_dir}. Nothing to resend')
+        try:
+            uploaded = [journal.upload(pytest.testomatio.connector, run.test_run_id, run.batch_size)
+                        for journal in journals]
+        except ReportFailedException:
+            pytest.exit("Aborting resend")
+        if not all(uploaded):
+            pytest.exit('Some results were not uploaded and are kept for the next resend', returncode=1)
+        # run was not finished by the interrupted session
+        if not run.proceed:
+            pytest.testomatio.connector.finish_test_run(run.test_run_id, True)
+        run.clear_run_id()
+        pytest.exit('Resend command executed. Exiting without test execution...')
+
     if option and option in {'report', 'launch'}:
         run: TestRunConfig = pytest.testomatio.test_run_config
 
@@ -112,6 +144,25 @@ def pytest_configure(config: Config):
                 if option == 'launch':
                     pytest.exit(f'Empty run successfully created. Run ID: {run_id}')
 
+            # results of this process and of xdist workers are written to the journal as tests finish
+            if option == 'report' and run.result_journal:
+                pytest.testomatio.journal = ResultJournal.for_run(run.journal_dir, run_id)
+            # results of this process and of xdist workers are uploaded as they are received.
+            # Collection hooks do not run in xdist main process, so the reporter is started here
+            if option == 'report' and run.stream_report and not run.worker_upload:
+                _start_reporter(run)
+
+        # xdist workers send each result to the main process with the teardown report of the test
+        # or upload results themselves in worker upload mode
+        if option == 'report' and not run.disable_batch:
+            if hasattr(config, 'workerinput') and run.worker_upload:
+                run.batch_start_index, run.batch_index_step = worker_batch_indexes(
+                    config.workerinput['workerid'], int(config.workerinput.get('workercount', 1)))
+            elif hasattr(config, 'workerinput'):
+                config.pluginmanager.register(WorkerResultSender(run), 'testomatio_result_sender')
+            else:
+                config.pluginmanager.register(ResultReceiver(_collect_result), 'testomatio_result_receiver')
+
     # Mark our pytest_collection_modifyitems hook to run last,
     # so that it sees the effect of all built-in and other filters first.
     # This ensures we only apply our OR logic after other filters have done their job.
@@ -150,9 +201,27 @@ def pytest_collection_modifyitems(session: Session, config: Config, items: list[
     # they may modify `items` (removing some tests). We run after them by using a hook wrapper
     # or a trylast marker to ensure our logic runs after most filters.
 
-    meta, test_files, test_names = collect_tests(items)
+    sync_manifest = _load_sync_manifest(config) if config.getoption(testomatio) == 'sync' else None
+    # incremental sync leaves test files that did not change since the last sync alone
+    meta, test_files, test_names = collect_tests(sync_manifest.changed_items(items) if sync_manifest else items)
     match config.getoption(testomatio):
         case 'sync':
+            no_detach = config.getoption('no_detach')
+            partial = bool(sync_manifest and sync_manifest.files)
+            if partial:
+                removed = sync_manifest.removed_tests(meta)
+                if removed and not no_detach:
+                    # tests are detached on testomat.io only when all tests are synced
+                    log.info(f'{len(removed)} tests were removed since the last sync. All tests will be synced')
+                    meta, test_files, test_names = collect_tests(items)
+                    partial = False
+                elif not meta:
+                    sync_manifest.update(test_files, meta)
+                    sync_manifest.save()
+                    pytest.exit('No changes since the last sync')
+                elif not no_detach:
+                    log.info('Only changed test files are synced, detach of tests is disabled')
+
             tests = [item for item in meta if item.type != 'bdd']
             if not len(tests) == len(meta):
                 warnings.warn('BDD tests excluded from sync. You need to sync them separately into another project '
@@ -160,7 +229,8 @@ def pytest_collection_modifyitems(session: Session, config: Config, items: list[
             pytest.testomatio.connector.load_tests(
                 tests,
                 no_empty=config.getoption('no_empty'),
-                no_detach=config.getoption('no_detach'),
+                # tests of unchanged files are not sent, they must not be detached
+                no_detach=no_detach or partial,
                 structure=config.getoption('keep_structure'),
                 create=config.getoption('create'),
                 directory=config.getoption('directory')
@@ -169,11 +239,13 @@ def pytest_collection_modifyitems(session: Session, config: Config, items: list[
             if not testomatio_tests:
                 pytest.exit('Failed to update tests ids')
             add_and_enrich_tests(meta, test_files, test_names, testomatio_tests, decorator_name)
+            if sync_manifest:
+                sync_manifest.update(test_files, meta)
+                sync_manifest.save()
             pytest.exit('Sync completed without test execution')
         case 'remove':
             mapping = get_test_mapping(meta)
-            for test_file in test_files:
-                update_tests(test_file, mapping, test_names, decorator_name, remove=True)
+            update_files(test_files, mapping, test_names, decorator_name, remove=True)
             pytest.exit('Sync completed without test execution')
         case 'report':
             # for xdist workers - get run id from the main process
@@ -196,6 +268,13 @@ def pytest_collection_modifyitems(session: Session, config: Config, items: list[
             if all(s3_details):
                 pytest.testomatio.s3_connector = S3Connector(*s3_details)
                 pytest.testomatio.s3_connector.login()
+                if run.defer_artifacts:
+                    pytest.testomatio.artifact_uploader = ArtifactUploader(pytest.testomatio.s3_connector)
+
+            # in worker upload mode each worker streams its own results. Otherwise the reporter is started
+            # in pytest_configure of the main process
+            if run.stream_report and run.worker_upload and hasattr(config, 'workerinput'):
+                _start_reporter(run)
 
         case 'debug':
             with open(metadata_file, 'w') as file:
@@ -206,6 +285,32 @@ def pytest_collection_modifyitems(session: Session, config: Config, items: list[
             raise Exception('Unknown pytestomatio parameter. Use one of: report, remove, sync, debug')
 
 
+def _start_reporter(run: TestRunConfig) -> None:
+    if os.environ.get('TESTOMATIO_RESULT_JOURNAL') in ['True', 'true', '1']:
+        log.warning('TESTOMATIO_RESULT_JOURNAL is not used with TESTOMATIO_STREAM_REPORT. '
+                    'Results that were not streamed can not be sent with --testomatio resend')
+    pytest.testomatio.reporter = StreamingReporter(pytest.testomatio.connector, run.test_run_id,
+                                                   run.batch_size, run.stream_queue_size,
+                                                   run.stream_flush_interval, run.batch_start_index,
+                                                   run.batch_index_step)
+    pytest.testomatio.reporter.start()
+
+
+def _load_sync_manifest(config: Config) -> SyncManifest | None:
+    if not config.getoption('incremental'):
+        return None
+    # manifest is valid only for the same project and the same way tests are imported
+    fingerprint = SyncManifest.make_fingerprint(
+        project=os.environ.get('TESTOMATIO'),
+        url=os.environ.get('TESTOMATIO_URL') or config.getini('testomatio_url') or TESTOMATIO_URL,
+        structure=config.getoption('keep_structure'),
+        directory=config.getoption('directory'),
+        create=config.getoption('create'),
+        labels=os.environ.get('TESTOMATIO_SYNC_LABELS'),
+    )
+    return SyncManifest.load(join(str(config.rootpath), MANIFEST_FILE), fingerprint)
+
+
 def pytest_runtest_makereport(item: Item, call: CallInfo):
     pytest.testomatio_config_option = item.config.getoption(testomatio)
     if pytest.testomatio_config_option is None or pytest.testomatio_config_option != 'report':
@@ -213,7 +318,8 @@ def pytest_runtest_makereport(item: Item, call: CallInfo):
     elif not pytest.testomatio.test_run_config.test_run_id:
         return
 
-    test_item = TestItem(item)
+    # the same instance is used in setup, call and teardown phases
+    test_item = TestItem.from_item(item)
     if test_item.id is None:
         test_id = None
     else:
@@ -237,31 +343,25 @@ def pytest_runtest_makereport(item: Item, call: CallInfo):
         artifacts = test_item.artifacts
         attached_artifacts = artifact_storage.get(item.nodeid)
         if attached_artifacts and pytest.testomatio.s3_connector:
-            urls = pytest.testomatio.s3_connector.upload_files([(path, None) for path in attached_artifacts])
+            files = [(path, None) for path in attached_artifacts]
+            if pytest.testomatio.artifact_uploader:
+                # links are returned at once, files are uploaded in background
+                urls = pytest.testomatio.artifact_uploader.submit(files)
+            else:
+                urls = pytest.testomatio.s3_connector.upload_files(files)
             artifacts.extend(urls)
             artifact_storage.clear(item.nodeid)
 
-    request = {
-        'status': None,
-        'title': test_item.exec_title,
-        'create': None,
-        'run_time': call.duration,
-        'file': None,
-        'suite_title': test_item.suite_title,
-        'suite_id': None,
-        'test_id': test_id,
-        'message': None,
-        'stack': None,
-        'example': None,
-        'artifacts': artifacts,
-        'steps': None,
-        'code': None,
-        'timestamp': None,
-        'overwrite': None,
-        'rid': rid,
-        'meta': meta,
-        'links': links
-    }
+    request = ResultRecord(
+        title=test_item.exec_title,
+        run_time=call.duration,
+        suite_title=test_item.suite_title,
+        test_id=test_id,
+        artifacts=artifacts,
+        rid=rid,
+        meta=meta,
+        links=links
+    )
 
     if pytest.testomatio.test_run_config.update_code and test_item.type != 'bdd':
         request['code'] = test_item.source_code
@@ -307,17 +407,26 @@ def pytest_runtest_makereport(item: Item, call: CallInfo):
     if item.nodeid not in pytest.testomatio.test_run_config.status_request:
         pytest.testomatio.test_run_config.status_request[item.nodeid] = request
     else:
-        for key, value in request.items():
-            if key == 'title' and call.when == 'teardown':
-                continue
-            if value is not None:
-                pytest.testomatio.test_run_config.status_request[item.nodeid][key] = value
+        exclude = ('title',) if call.when == 'teardown' else ()
+        pytest.testomatio.test_run_config.status_request[item.nodeid].merge(request, exclude)
 
     # exclude skipped test if TESTOMATIO_EXCLUDE_SKIPPED is enabled
     if call.when == 'teardown' and (pytest.testomatio.test_run_config.status_request[item.nodeid].get('status') == 'skipped'
                                     and pytest.testomatio.test_run_config.exclude_skipped):
         pytest.testomatio.test_run_config.status_request.pop(item.nodeid)
 
+    # test is finished - hand over its result to the streaming reporter
+    reporter = pytest.testomatio.reporter
+    # testomat.io rejected a batch (ex. invalid token or finished run), abort the same way as batch upload does
+    if call.when == 'teardown' and reporter and reporter.error:
+        pytest.exit("Aborting test run")
+    if call.when == 'teardown' and reporter and item.nodeid in pytest.testomatio.test_run_config.status_request:
+        reporter.put(pytest.testomatio.test_run_config.status_request.pop(item.nodeid).to_dict())
+
+    journal = pytest.testomatio.journal
+    if call.when == 'teardown' and journal and item.nodeid in pytest.testomatio.test_run_config.status_request:
+        journal.append(pytest.testomatio.test_run_config.status_request.pop(item.nodeid).to_dict())
+
 
 def pytest_runtest_logfinish(nodeid, location):
     if not hasattr(pytest, 'testomatio_config_option'):
@@ -329,16 +438,32 @@ def pytest_runtest_logfinish(nodeid, location):
     if not pytest.testomatio.test_run_config.disable_batch:
         return
 
+    # async client reports tests in background, each call returns future instead of waiting for response
+    async_connector = pytest.testomatio.async_connector
+    if async_connector and async_connector.report_failed:
+        pytest.exit("Aborting test run")
+    connector = async_connector or pytest.testomatio.connector
+
     try:
         for nodeid, request in pytest.testomatio.test_run_config.status_request.items():
             if request['status']:
-                pytest.testomatio.connector.update_test_status(run_id=pytest.testomatio.test_run_config.test_run_id,
-                                                               **request)
+                connector.update_test_status(run_id=pytest.testomatio.test_run_config.test_run_id, **request)
         pytest.testomatio.test_run_config.status_request = {}
     except ReportFailedException:
         pytest.exit("Aborting test run")
 
 
+def _collect_result(nodeid: str, result: dict) -> None:
+    """Passes result received from xdist worker to the streaming reporter or the journal if enabled,
+    otherwise keeps it for batch upload at the end of the session"""
+    if pytest.testomatio.reporter:
+        pytest.testomatio.reporter.put(result)
+    elif pytest.testomatio.journal:
+        pytest.testomatio.journal.append(result)
+    else:
+        pytest.testomatio.test_run_config.status_request[nodeid] = ResultRecord.from_dict(result)
+
+
 @pytest.hookimpl(optionalhook=True)
 def pytest_testnodedown(node, error):
     if not hasattr(node, 'workeroutput') or not hasattr(pytest, 'testomatio') or \
@@ -347,10 +472,12 @@ def pytest_testnodedown(node, error):
     if pytest.testomatio.test_run_config.disable_batch:
         return
 
-    log.info(f"Collecting test results from worker '{node.workerinfo.get('id')}'")
+    # results of tests interrupted before teardown, others were received with test reports
     worker_results = node.workeroutput.get('testrun_results', {})
-    pytest.testomatio.test_run_config.status_request.update(worker_results)
-    log.info(f"{len(worker_results)} test results added to the master test run")
+    for nodeid, result in worker_results.items():
+        _collect_result(nodeid, result)
+    if worker_results:
+        log.info(f"{len(worker_results)} test results collected from worker '{node.workerinfo.get('id')}'")
 
 
 def pytest_sessionfinish(session, exitstatus):
@@ -360,17 +487,69 @@ def pytest_sessionfinish(session, exitstatus):
     elif not pytest.testomatio.test_run_config.test_run_id:
         return
 
+    try:
+        _report_results(session)
+    finally:
+        # xdist reports the worker as finished to the main process only after this hook. So when the main process
+        # finishes the run, uploads of all workers are already done
+        _wait_for_uploads()
+
+    # results sent by the streaming reporter after it failed are dropped
+    if pytest.testomatio.reporter and pytest.testomatio.reporter.error:
+        log.error(f'Streaming report failed: {pytest.testomatio.reporter.dropped} test results were not reported')
+        pytest.exit("Aborting test run")
+
+
+def _wait_for_uploads() -> None:
+    """Returns when results reported in background are uploaded"""
+    # final drain of the streaming reporter
+    if pytest.testomatio.reporter:
+        pytest.testomatio.reporter.stop()
+    # wait for test statuses reported in background
+    if pytest.testomatio.async_connector:
+        pytest.testomatio.async_connector.close()
+
+
+def _report_results(session) -> None:
     run: TestRunConfig = pytest.testomatio.test_run_config
+    # links to deferred artifacts are already in results, make sure files are uploaded before results are sent
+    if pytest.testomatio.artifact_uploader:
+        pytest.testomatio.artifact_uploader.close()
+
     if not run.disable_batch:
 
         # xdist worker process - write test results to worker output. They will be reported from master process
-        if hasattr(session.config, 'workerinput'):
-            session.config.workeroutput['testrun_results'] = run.status_request
+        if hasattr(session.config, 'workerinput') and not run.worker_upload:
+            # worker output is sent to the controller by execnet, which accepts only builtin types
+            session.config.workeroutput['testrun_results'] = {nodeid: result.to_dict()
+                                                              for nodeid, result in run.status_request.items()}
+            return
+
+        # results of tests interrupted before teardown. They are uploaded by the reporter on its final drain
+        if pytest.testomatio.reporter:
+            for request in run.status_request.values():
+                pytest.testomatio.reporter.put(request.to_dict())
+            run.status_request = {}
             return
 
         try:
-            pytest.testomatio.connector.batch_tests_upload(run.test_run_id, run.batch_size,
-                                                           list(run.status_request.values()))
+            # results of tests interrupted before teardown are added to the journal and it is uploaded by chunks
+            if pytest.testomatio.journal:
+                for request in run.status_request.values():
+                    pytest.testomatio.journal.append(request.to_dict())
+                run.status_request = {}
+                pytest.testomatio.journal.upload(pytest.testomatio.connector, run.test_run_id, run.batch_size)
+                return
+
+            results = [result.to_dict() for result in run.status_request.values()]
+            if pytest.testomatio.async_connector:
+                pytest.testomatio.async_connector.batch_tests_upload(run.test_run_id, run.batch_size, results,
+                                                                     start_index=run.batch_start_index,
+                                                                     index_step=run.batch_index_step).result()
+            else:
+                pytest.testomatio.connector.batch_tests_upload(run.test_run_id, run.batch_size, results,
+                                                               start_index=run.batch_start_index,
+                                                               index_step=run.batch_index_step)
         except ReportFailedException:
             pytest.exit("Aborting test run")
 
@@ -382,17 +561,18 @@ def pytest_unconfigure(config: Config):
     run: TestRunConfig = pytest.testomatio.test_run_config
     if config.getoption(testomatio) != 'report':
         run.clear_run_id()
+        pytest.testomatio.connector.disconnect()
         return
-    elif run.proceed:
-        if not hasattr(config, 'workerinput'):  # for xdist, only master clear run id
-            run.clear_run_id()
+
+    # results are uploaded in pytest_sessionfinish. Waiting again in case the session was not finished
+    _wait_for_uploads()
+
+    # xdist worker - the run is finished by the main process once for all workers
+    if hasattr(config, 'workerinput'):
+        pytest.testomatio.connector.disconnect()
         return
-    # for xdist - main process
-    if not hasattr(config, 'workerinput'):
-        time.sleep(1)
-        pytest.testomatio.connector.finish_test_run(run.test_run_id, True)
-        run.clear_run_id()
 
-    # for xdist - worker process
-    else:
-        pytest.testomatio.connector.finish_test_run(run.test_run_id, False)
+    if not run.proceed:
+        pytest.testomatio.connector.finish_test_run(run.test_run_id, True)
+    run.clear_run_id()
+    pytest.testomatio.connector.disconnect()
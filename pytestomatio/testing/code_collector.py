@@ -1,15 +1,38 @@
-import importlib.util
-import inspect
+import ast
+import os
+import tokenize
+from functools import lru_cache
+
+FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
 
 
 def get_functions_source_by_name(abs_file_path: str, all_tests: list[str]):
-    spec = importlib.util.spec_from_file_location('name', abs_file_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    functions = inspect.getmembers(module, inspect.isfunction)
-    classes = inspect.getmembers(module, inspect.isclass)
-    for class_name, cls in classes:
-        functions += inspect.getmembers(cls, inspect.isfunction)
-    for function_name, function in functions:
-        if function_name in all_tests:
-            yield function_name, inspect.getsource(function)
+    """Yields (name, source code) of module functions and class methods with names from all_tests.
+    File is parsed statically, test module is not imported and executed"""
+    abs_file_path = str(abs_file_path)
+    names = set(all_tests)
+    for function_name, source in _get_functions_source(abs_file_path, os.stat(abs_file_path).st_mtime_ns):
+        if function_name in names:
+            yield function_name, source
+
+
+@lru_cache(maxsize=1024)
+def _get_functions_source(abs_file_path: str, mtime: int) -> tuple[tuple[str, str], ...]:
+    """Returns source of functions and methods defined in the file. Cached until file is modified"""
+    with tokenize.open(abs_file_path) as file:
+        source = file.read()
+    lines = source.splitlines(keepends=True)
+    tree = ast.parse(source, filename=abs_file_path)
+
+    # module function redefined later in the file is replaced, as it is on import
+    functions = {node.name: node for node in tree.body if isinstance(node, FUNCTION_NODES)}
+    nodes = list(functions.values())
+    for cls in (node for node in tree.body if isinstance(node, ast.ClassDef)):
+        nodes.extend(node for node in cls.body if isinstance(node, FUNCTION_NODES))
+    return tuple((node.name, _node_source(node, lines)) for node in nodes)
+
+
+def _node_source(node: ast.FunctionDef | ast.AsyncFunctionDef, lines: list[str]) -> str:
+    # source starts with decorators, same as inspect.getsource
+    start = min([node.lineno] + [decorator.lineno for decorator in node.decorator_list])
+    return ''.join(lines[start - 1:node.end_lineno])
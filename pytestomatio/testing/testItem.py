@@ -3,7 +3,8 @@ from typing import Iterable
 from os import getenv
 import uuid
 import json
-from pytest import Item
+from functools import cached_property
+from pytest import Item, StashKey
 import inspect
 
 MARKER = 'testomatio'
@@ -11,27 +12,87 @@ TEST_TYPES = [
     (lambda f: hasattr(f, '__scenario__'), 'bdd'),
     (lambda f: True, 'regular')
 ]
+test_item_key = StashKey['TestItem']()
 
 
 class TestItem:
+    """Test metadata of pytest item. Attributes are computed on first access, so reporting
+    computes only what it sends. Use from_item to get the instance shared by all phases of the test"""
+
     def __init__(self, item: Item):
-        self.uid = uuid.uuid4()
+        self._item = item
         self.type = self._get_test_type(item.function)
         self.id: str = self.get_test_id(item)
-        self.title = self._get_pytest_title(item.name)
-        self.sync_title = self._get_sync_test_title(item)
-        self.resync_title = self._get_resync_test_title(item)
-        self.exec_title = self._get_execution_test_title(item)
-        self.parameters = self._get_test_parameter_key(item)
-        self.file_name = item.path.name
-        self.suite_title = self._get_suite_title(item.function)
-        self.abs_path = str(item.path)
-        self.file_path = item.location[0]
-        self.module = item.module.__name__
-        self.source_code = inspect.getsource(item.function)
-        self.docstring = inspect.getdoc(item.function)
-        self.class_name = item.cls.__name__ if item.cls else None
-        self.artifacts = item.stash.get("artifact_urls", [])
+
+    @classmethod
+    def from_item(cls, item: Item) -> 'TestItem':
+        """Returns TestItem cached in the item stash for the session"""
+        test_item = item.stash.get(test_item_key, None)
+        if test_item is None:
+            test_item = cls(item)
+            item.stash[test_item_key] = test_item
+        return test_item
+
+    @cached_property
+    def uid(self) -> uuid.UUID:
+        return uuid.uuid4()
+
+    @cached_property
+    def title(self) -> str:
+        return self._get_pytest_title(self._item.name)
+
+    @cached_property
+    def sync_title(self) -> str:
+        return self._get_sync_test_title(self._item)
+
+    @cached_property
+    def resync_title(self) -> str:
+        return self._get_resync_test_title(self._item)
+
+    @cached_property
+    def exec_title(self) -> str:
+        return self._get_execution_test_title(self._item)
+
+    @cached_property
+    def parameters(self) -> list:
+        return self._get_test_parameter_key(self._item)
+
+    @cached_property
+    def file_name(self) -> str:
+        return self._item.path.name
+
+    @cached_property
+    def suite_title(self) -> str:
+        return self._get_suite_title(self._item.function)
+
+    @cached_property
+    def abs_path(self) -> str:
+        return str(self._item.path)
+
+    @cached_property
+    def file_path(self) -> str:
+        return self._item.location[0]
+
+    @cached_property
+    def module(self) -> str:
+        return self._item.module.__name__
+
+    @cached_property
+    def source_code(self) -> str:
+        return inspect.getsource(self._item.function)
+
+    @cached_property
+    def docstring(self) -> str | None:
+        return inspect.getdoc(self._item.function)
+
+    @cached_property
+    def class_name(self) -> str | None:
+        return self._item.cls.__name__ if self._item.cls else None
+
+    @property
+    def artifacts(self) -> list:
+        # not cached, artifacts are added to the stash while test is running
+        return self._item.stash.get("artifact_urls", [])
 
     def to_dict(self) -> dict:
         result = dict()
@@ -182,7 +243,7 @@ class TestItem:
         return param_names
     
     def _resolve_parameter_key_in_test_name(self, item: Item, test_name: str) -> str:
-        test_params = self._get_test_parameter_key(item)
+        test_params = self.parameters
         if not test_params:
             return test_name
         # Remove parameters from test name
@@ -194,13 +255,12 @@ class TestItem:
         return test_name
     
     def _resolve_parameter_value_in_test_name(self, item: Item, test_name: str) -> str:
-        param_keys = self._get_test_parameter_key(item)
-        sync_title = self._get_sync_test_title(item)
-
+        param_keys = self.parameters
         if not param_keys:
             return test_name
         if not item.callspec:
             return test_name
+        sync_title = self.sync_title
 
         pattern = r'\$\{(.*?)\}'
 
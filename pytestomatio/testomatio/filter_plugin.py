@@ -8,7 +8,7 @@ class TestomatioFilterPlugin:
     # todo: check multiple values for filter, apply several filters
     allowed_filters = {'test_id', 'jira', 'label', 'plan', 'tag'}
 
-    def get_matched_test_ids(self, f_type, f_value) -> list:
+    def get_matched_test_ids(self, f_type, f_value) -> set:
         """
         Returns test ids that matches given filter
         :param f_type: filter type(test_id, label)
@@ -19,7 +19,7 @@ class TestomatioFilterPlugin:
         else:
             test_ids = f_value.split("|")
         # Remove "@" from the start of test IDs if present
-        cleared_ids = [test_id.lstrip("@T") for test_id in test_ids]
+        cleared_ids = {test_id.lstrip("@T") for test_id in test_ids}
         return cleared_ids
 
     def filter_by_testomatio_related_fields(self, filter_type, filter_value):
@@ -28,18 +28,17 @@ class TestomatioFilterPlugin:
         tests = connector.get_filtered_tests(filter_type, filter_value)
         return tests.get('tests') if tests else []
 
-    def match_tests_by_id(self, test_ids, items) -> list:
-        matched_tests = []
-
-        for item in items:
-            # Check for testomatio marker
-            for marker in item.iter_markers(name="testomatio"):
+    @staticmethod
+    def get_item_test_ids(item) -> list:
+        """Returns ids of testomatio markers of the item"""
+        # Strip "@" from the marker argument
+        return [marker.args[0].lstrip("@T") for marker in item.iter_markers(name="testomatio")]
 
-                marker_id = marker.args[0].lstrip("@T")  # Strip "@" from the marker argument
-                if marker_id in test_ids:
-                    matched_tests.append(item)
-                    break
-        return matched_tests
+    def match_tests_by_id(self, test_ids, items) -> list:
+        """Returns items with any of given ids in original order. Ids are looked up in a set,
+        so matching takes time linear to the number of items"""
+        test_ids = set(test_ids)
+        return [item for item in items if not test_ids.isdisjoint(self.get_item_test_ids(item))]
 
     def filter_tests(self, filter_opts, original_items):
         try:
@@ -102,14 +101,16 @@ class TestomatioFilterPlugin:
             # If a "not" keyword filter exist - it means we have exclusion filter applied.
             # In such scenario we respect the exclusion filters in a way
             # that we accept tests with requested test ids as long as such tests do not fall into exclusion filter
-            items[:] = [item for item in testomatio_matched if item in items]
+            selected = set(items)
+            items[:] = [item for item in testomatio_matched if item in selected]
             return
 
         if other_filters_active:
             # If other filters are applied, use OR logic:
             # the final set is all items that passed previous filters plus those matched by test-ids
             # preserving original order of test
-            items[:] = items + [item for item in testomatio_matched if item not in items]
+            selected = set(items)
+            items[:] = items + [item for item in testomatio_matched if item not in selected]
             return
 
         # If no other filters are applied, test-ids filter acts as an exclusive filter:
@@ -0,0 +1,145 @@
+import glob
+import json
+import logging
+import os
+import threading
+
+log = logging.getLogger('pytestomatio')
+# number of batches read from the journal and uploaded at once
+CHUNK_BATCHES = 20
+
+
+class ResultJournal:
+    """Append-only JSON Lines file with finished test results.
+
+    Results are written as soon as tests finish instead of being kept in memory until the end of the session,
+    and are read back in chunks for batch upload. The file stays on disk if upload did not succeed,
+    so results are not lost when the process crashes.
+
+    Batches acknowledged by Testomat.io are recorded in the .ack file next to the journal. Upload of the kept
+    journal, e.g. by `--testomatio resend`, sends only batches that were not acknowledged.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.ack_path = path + '.ack'
+        self.count = 0
+        self._file = None
+        # batches are acknowledged from upload threads
+        self._ack_lock = threading.Lock()
+
+    @classmethod
+    def for_run(cls, directory: str, run_id: str) -> 'ResultJournal':
+        os.makedirs(directory, exist_ok=True)
+        return cls(os.path.join(directory, f'testomatio-results-{run_id}-{os.getpid()}.jsonl'))
+
+    @classmethod
+    def find(cls, directory: str, run_id: str) -> list['ResultJournal']:
+        """Returns journals of the run kept in the directory by all processes"""
+        paths = glob.glob(os.path.join(glob.escape(directory), f'testomatio-results-{glob.escape(run_id)}-*.jsonl'))
+        return [cls(path) for path in sorted(paths)]
+
+    def append(self, result: dict) -> None:
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(json.dumps(result, default=str) + '\n')
+        # flushed line by line, so a crash loses at most the result being written
+        self._file.flush()
+        self.count += 1
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def read_chunks(self, chunk_size: int):
+        """Yields lists of up to chunk_size results. Only one chunk is kept in memory"""
+        self.close()
+        if not os.path.exists(self.path):
+            return
+        chunk = []
+        with open(self.path, encoding='utf-8') as file:
+            for line_number, line in enumerate(file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    chunk.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # the last line is incomplete if the process crashed while writing it
+                    log.warning(f'Skipped broken line {line_number} of result journal {self.path}')
+                    continue
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+        if chunk:
+            yield chunk
+
+    def read_acks(self) -> tuple[set, int | None]:
+        """Returns indexes of acknowledged batches and batch size the journal was split with"""
+        acked, batch_size = set(), None
+        if not os.path.exists(self.ack_path):
+            return acked, batch_size
+        with open(self.ack_path, encoding='utf-8') as file:
+            for line in file:
+                try:
+                    ack = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                acked.update(ack['batches'])
+                batch_size = ack['batch_size']
+        return acked, batch_size
+
+    def _ack(self, batches: list, batch_size: int) -> None:
+        if not batches:
+            return
+        with self._ack_lock, open(self.ack_path, 'a', encoding='utf-8') as file:
+            file.write(json.dumps({'batch_size': batch_size, 'batches': batches}) + '\n')
+
+    @staticmethod
+    def _pending_ranges(chunk: list, first_index: int, batch_size: int, acked: set) -> list:
+        """Splits chunk into runs of consecutive batches that were not acknowledged"""
+        ranges = []
+        for offset in range(0, len(chunk), batch_size):
+            index = first_index + offset // batch_size
+            if index in acked:
+                continue
+            batch = chunk[offset:offset + batch_size]
+            # only the last batch of the chunk can be incomplete, so previous ranges hold whole batches
+            if ranges and ranges[-1][0] + len(ranges[-1][1]) // batch_size == index:
+                ranges[-1][1].extend(batch)
+            else:
+                ranges.append((index, list(batch)))
+        return ranges
+
+    def upload(self, connector, run_id: str, batch_size: int) -> bool:
+        """Uploads batches that were not acknowledged yet. Journal is removed if all batches were sent.
+        Each batch is acknowledged as soon as it is accepted, so batches sent before ReportFailedException
+        is propagated are not sent again"""
+        acked, acked_batch_size = self.read_acks()
+        if acked_batch_size:
+            # batch indexes are valid only for the size journal was split with before
+            batch_size = acked_batch_size
+        sent = failed = 0
+        chunk_size = batch_size * CHUNK_BATCHES
+        for number, chunk in enumerate(self.read_chunks(chunk_size)):
+            # batch indexes continue from the previous chunk
+            for start_index, tests in self._pending_ranges(chunk, number * CHUNK_BATCHES + 1, batch_size, acked):
+                summary = connector.batch_tests_upload(run_id, batch_size, tests, start_index=start_index,
+                                                       on_sent=lambda index: self._ack([index], batch_size))
+                if summary:
+                    sent += len(summary['sent'])
+                    failed += len(summary['failed']) + len(summary['skipped'])
+        if failed:
+            log.error(f'{failed} batches of results were not uploaded. Results are kept in {self.path}. '
+                      f'Send them with: TESTOMATIO_RUN_ID={run_id} pytest --testomatio resend')
+            return False
+        self.remove()
+        skipped = f', {len(acked)} batches were sent before' if acked else ''
+        log.info(f'Results uploaded from journal in {sent} batches{skipped}')
+        return True
+
+    def remove(self) -> None:
+        self.close()
+        for path in (self.path, self.ack_path):
+            if os.path.exists(path):
+                os.remove(path)
@@ -0,0 +1,73 @@
+class ResultRecord:
+    """Result of a single test kept until it is reported.
+
+    Stores fields in slots instead of a dict per test. Supports read and write by key, so it can be used
+    as the request dict it replaces and unpacked with **. to_dict returns only fields that are set
+    """
+    FIELDS = ('status', 'title', 'create', 'run_time', 'file', 'suite_title', 'suite_id', 'test_id', 'message',
+              'stack', 'example', 'artifacts', 'steps', 'code', 'timestamp', 'overwrite', 'rid', 'meta', 'links')
+    __slots__ = FIELDS
+
+    def __init__(self, **fields):
+        for name in self.FIELDS:
+            setattr(self, name, fields.pop(name, None))
+        if fields:
+            raise TypeError(f'Unknown result fields: {", ".join(fields)}')
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ResultRecord':
+        return cls(**data)
+
+    def to_dict(self) -> dict:
+        """Serializes fields that are not None"""
+        result = {}
+        for name in self.FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                result[name] = value
+        return result
+
+    def merge(self, other: 'ResultRecord', exclude: tuple = ()) -> None:
+        """Copies fields set in the other record"""
+        for name in self.FIELDS:
+            value = getattr(other, name)
+            if value is not None and name not in exclude:
+                setattr(self, name, value)
+
+    def keys(self) -> tuple:
+        return self.FIELDS
+
+    def items(self):
+        return ((name, getattr(self, name)) for name in self.FIELDS)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default) if key in self.FIELDS else default
+
+    def __getitem__(self, key: str):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value) -> None:
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.FIELDS
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ResultRecord):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == {key: value for key, value in other.items() if value is not None}
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'ResultRecord({self.to_dict()})'
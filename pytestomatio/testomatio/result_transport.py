@@ -0,0 +1,55 @@
+import logging
+import pytest
+from typing import Callable
+
+log = logging.getLogger('pytestomatio')
+
+# name of the user property that carries test result from xdist worker to the main process
+RESULT_PROPERTY = 'testomatio_result'
+
+
+def worker_batch_indexes(worker_id: str, worker_count: int) -> tuple[int, int]:
+    """Returns first batch index and step between batch indexes of xdist worker, e.g. gw0, when workers upload
+    results themselves. Indexes of workers are interleaved: gw0 of 4 workers sends batches 1, 5, 9...,
+    gw1 sends 2, 6, 10... So batches of different workers never share an index, and all indexes of the run
+    stay as small and dense as if one process uploaded them, with gaps only when workers upload different
+    numbers of batches. The main process does not upload results in this mode, it runs no tests
+    """
+    number = int(''.join(char for char in worker_id if char.isdigit()) or 0)
+    return number + 1, max(worker_count, number + 1)
+
+
+class WorkerResultSender:
+    """Registered in xdist worker. Moves result of the finished test to user properties of its teardown report.
+
+    xdist sends every report to the main process as soon as it is logged, so results are delivered one by one
+    while tests are running instead of all at once in workeroutput when the worker goes down.
+    """
+
+    def __init__(self, test_run_config):
+        self.test_run_config = test_run_config
+
+    # must run before xdist serializes the report
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_logreport(self, report):
+        status_request = self.test_run_config.status_request
+        if report.when == 'teardown' and report.nodeid in status_request:
+            report.user_properties.append((RESULT_PROPERTY, status_request.pop(report.nodeid).to_dict()))
+
+
+class ResultReceiver:
+    """Registered in xdist main process. Takes results sent by workers out of reports and passes them to handler"""
+
+    def __init__(self, handler: Callable[[str, dict], None]):
+        self.handler = handler
+        self.received = 0
+
+    # must run before junitxml writes user properties of the report
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_logreport(self, report):
+        for index, (name, value) in enumerate(report.user_properties):
+            if name == RESULT_PROPERTY:
+                del report.user_properties[index]
+                self.received += 1
+                self.handler(report.nodeid, value)
+                return
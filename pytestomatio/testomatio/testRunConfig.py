@@ -9,6 +9,8 @@ load_dotenv()
 
 TESTOMATIO_TEST_RUN_LOCK_FILE = ".testomatio_test_run_id_lock"
 DEFAULT_BATCH_SIZE = 50
+DEFAULT_STREAM_QUEUE_SIZE = 1000
+DEFAULT_STREAM_FLUSH_INTERVAL = 5
 
 
 class TestRunConfig:
@@ -18,6 +20,12 @@ class TestRunConfig:
         create_tests = os.environ.get('TESTOMATIO_CREATE', False) in ['True', 'true', '1']
         disable_batch_upload = os.environ.get('TESTOMATIO_DISABLE_BATCH_UPLOAD') in ['True', 'true', '1']
         batch_size = os.environ.get('TESTOMATIO_BATCH_SIZE', '')
+        stream_report = os.environ.get('TESTOMATIO_STREAM_REPORT') in ['True', 'true', '1']
+        stream_queue_size = os.environ.get('TESTOMATIO_STREAM_QUEUE_SIZE', '')
+        stream_flush_interval = os.environ.get('TESTOMATIO_STREAM_FLUSH_INTERVAL', '')
+        async_report = os.environ.get('TESTOMATIO_ASYNC_REPORT') in ['True', 'true', '1']
+        result_journal = os.environ.get('TESTOMATIO_RESULT_JOURNAL') in ['True', 'true', '1']
+        worker_upload = os.environ.get('TESTOMATIO_WORKER_UPLOAD') in ['True', 'true', '1']
         shared_run = os.environ.get('TESTOMATIO_SHARED_RUN') in ['True', 'true', '1']
         disable_steps = os.environ.get('TESTOMATIO_NO_STEPS') in ['True', 'true', '1']
         enable_steps_for_passed_test = os.environ.get('TESTOMATIO_STEPS_PASSED') in ['True', 'true', '1']
@@ -27,8 +35,11 @@ class TestRunConfig:
         stack_passed = os.environ.get('TESTOMATIO_STACK_PASSED', False) in ['True', 'true', '1']
         shared_run_timeout = os.environ.get('TESTOMATIO_SHARED_RUN_TIMEOUT', '')
         disable_artifacts_upload = os.environ.get('TESTOMATIO_DISABLE_ARTIFACTS')
+        defer_artifacts = os.environ.get('TESTOMATIO_DEFER_ARTIFACTS') in ['True', 'true', '1']
         self.access_event = 'publish' if os.environ.get("TESTOMATIO_PUBLISH") else None
         self.disable_artifacts = disable_artifacts_upload in ['True', 'true', '1']
+        # Upload artifacts in background and wait for them at the end of the session
+        self.defer_artifacts = defer_artifacts
         self.test_run_id = run_id
         self.title = title
         self.enable_steps_for_passed_test = enable_steps_for_passed_test
@@ -36,6 +47,21 @@ class TestRunConfig:
         self.kind = kind
         self.disable_batch = disable_batch_upload
         self.batch_size = int(batch_size) if (batch_size.isdigit() and int(batch_size) <= 100) else DEFAULT_BATCH_SIZE
+        # Upload results from a background thread while tests are running. Works only with batch upload
+        self.stream_report = stream_report and not disable_batch_upload
+        self.stream_queue_size = int(stream_queue_size) if (stream_queue_size.isdigit() and int(stream_queue_size) > 0) \
+            else DEFAULT_STREAM_QUEUE_SIZE
+        self.stream_flush_interval = int(stream_flush_interval) if stream_flush_interval.isdigit() \
+            else DEFAULT_STREAM_FLUSH_INTERVAL
+        self.async_report = async_report
+        # Write finished results to a file instead of keeping them in memory. Streaming upload doesn't keep them either
+        self.result_journal = result_journal and not disable_batch_upload and not self.stream_report
+        self.journal_dir = os.environ.get('TESTOMATIO_RESULT_JOURNAL_DIR') or tempfile.gettempdir()
+        # xdist workers upload their results themselves, main process only creates and finishes the run
+        self.worker_upload = worker_upload and not disable_batch_upload
+        # index of the first batch uploaded by this process and step between indexes. Workers interleave indexes
+        self.batch_start_index = 1
+        self.batch_index_step = 1
         self.environment = safe_string_list(os.environ.get('TESTOMATIO_ENV'))
         self.disable_timestamp = disable_timestamp
         self.exclude_skipped = exclude_skipped
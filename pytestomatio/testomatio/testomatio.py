@@ -2,7 +2,12 @@ from _pytest.python import Function
 from .testRunConfig import TestRunConfig
 from pytestomatio.connect.s3_connector import S3Connector
 from pytestomatio.connect.connector import Connector
+from pytestomatio.connect.async_connector import AsyncConnector
+from pytestomatio.connect.reporter import StreamingReporter
+from pytestomatio.connect.artifact_uploader import ArtifactUploader
+from pytestomatio.testomatio.result_journal import ResultJournal
 import logging
+from typing import BinaryIO, Iterable
 
 log = logging.getLogger(__name__)
 
@@ -13,6 +18,10 @@ class Testomatio:
         self.s3_connector: S3Connector = s3_connector
         self.test_run_config: TestRunConfig = test_run_config
         self.connector: Connector = None
+        self.reporter: StreamingReporter = None
+        self.async_connector: AsyncConnector = None
+        self.artifact_uploader: ArtifactUploader = None
+        self.journal: ResultJournal = None
 
     def upload_files(self, files_list, bucket_name: str = None) -> str:
         if self.test_run_config.test_run_id is None:
@@ -26,7 +35,8 @@ class Testomatio:
             return ""
         return self.s3_connector.upload_file(file_path, key, bucket_name)
 
-    def upload_file_object(self, file_bytes: bytes, key: str, bucket_name: str = None) -> str:
+    def upload_file_object(self, file_bytes: bytes | BinaryIO | Iterable[bytes], key: str,
+                           bucket_name: str = None) -> str:
         if self.test_run_config.test_run_id is None:
             log.debug("Skipping file upload when testomatio test run is not created")
             return ""
@@ -1,20 +1,26 @@
+import logging
 import pytest
+from collections import Counter, deque
 from os import getenv
 from os.path import basename
 
 from pytest import Item
 from pytestomatio.testomatio.testomat_item import TestomatItem
 from pytestomatio.testing.testItem import TestItem
-from pytestomatio.decor.decorator_updater import update_tests
+from pytestomatio.decor.decorator_updater import update_files
 from pytestomatio.testing.code_collector import get_functions_source_by_name
 from re import sub
 
+log = logging.getLogger('pytestomatio')
+
 
 def collect_tests(items: list[Item]):
     meta: list[TestItem] = list()
     test_files: set = set()
     test_names: list = list()
     parameter_filter: set[Item] = set()
+    # tests grouped by file and title, so source of each test is resolved with a single lookup
+    tests_by_file: dict[str, dict[str, list[TestItem]]] = dict()
     for item in items:
         if item.function not in parameter_filter:
             parameter_filter.add(item.function)
@@ -22,14 +28,16 @@ def collect_tests(items: list[Item]):
             test_files.add(ti.abs_path)
             test_names.append(ti.title)
             meta.append(ti)
-
-    for test_file in test_files:
-        pairs = [p for p in get_functions_source_by_name(test_file, test_names)]
-        for ti in meta:
-            for name, source_code in pairs:
-                if ti.title == name and ti.abs_path == test_file:
-                    ti.source_code = source_code
-                    break
+            tests_by_file.setdefault(ti.abs_path, {}).setdefault(ti.title, []).append(ti)
+
+    for test_file, tests in tests_by_file.items():
+        sources: dict[str, str] = dict()
+        for name, source_code in get_functions_source_by_name(test_file, list(tests)):
+            # the first function with the name is used, e.g. for methods with the same name in different classes
+            sources.setdefault(name, source_code)
+        for name, source_code in sources.items():
+            for ti in tests.get(name, ()):
+                ti.source_code = source_code
     return meta, test_files, test_names
 
 
@@ -63,27 +71,41 @@ def parse_test_list(raw_response: dict) -> list[TestomatItem]:
 
 
 def add_and_enrich_tests(meta: list[TestItem], test_files: set,
-                         test_names: list, testomatio_tests: dict, decorator_name: str):
+                         test_names: list, testomatio_tests: dict, decorator_name: str) -> dict:
     # set test ids from testomatio to test metadata
     tcm_test_data = parse_test_list(testomatio_tests)
-    for test in meta:
-        for tcm_test in tcm_test_data:
-            if not tcm_test.file_name:
-                continue
-            # Test that are synced into user specified folder - might end up with altered file path in testomatio
-            # making file path not match between source code and testomatio
-            # to mitigate this we compare only file names, skipping the path
-            # while it works it might not be the most reliable approach
-            # however, the underlying issue is the ability to alter the file path in testomatio
-            # https://github.com/testomatio/check-tests?tab=readme-ov-file#import-into-a-specific-suite
-            if test.resync_title == tcm_test.title and basename(test.file_name) == basename(tcm_test.file_name):
-                test.id = tcm_test.id
-                tcm_test_data.remove(tcm_test)
-                break
-
+    # Test that are synced into user specified folder - might end up with altered file path in testomatio
+    # making file path not match between source code and testomatio
+    # to mitigate this we compare only file names, skipping the path
+    # while it works it might not be the most reliable approach
+    # however, the underlying issue is the ability to alter the file path in testomatio
+    # https://github.com/testomatio/check-tests?tab=readme-ov-file#import-into-a-specific-suite
+    index: dict[tuple[str, str], deque[TestomatItem]] = dict()
+    for tcm_test in tcm_test_data:
+        if not tcm_test.file_name:
+            continue
+        index.setdefault((tcm_test.title, basename(tcm_test.file_name)), deque()).append(tcm_test)
+
+    stats = {'matched': 0, 'unmatched': 0, 'ambiguous': 0}
+    keys = [(test.resync_title, basename(test.file_name)) for test in meta]
+    local_counts = Counter(keys)
+    for test, key in zip(meta, keys):
+        candidates = index.get(key)
+        if not candidates:
+            stats['unmatched'] += 1
+            continue
+        # tests with the same title in the same file are matched to server tests in order
+        if len(candidates) > 1 or local_counts[key] > 1:
+            stats['ambiguous'] += 1
+        tcm_test = candidates.popleft()
+        test.id = tcm_test.id
+        stats['matched'] += 1
+
+    log.info(f'Test ids matched: {stats["matched"]}, not found on testomat.io: {stats["unmatched"]}, '
+             f'matched by order of duplicated titles: {stats["ambiguous"]}')
     mapping = get_test_mapping(meta)
-    for test_file in test_files:
-        update_tests(test_file, mapping, test_names, decorator_name)
+    update_files(test_files, mapping, test_names, decorator_name)
+    return stats
 
 
 def read_env_s3_keys(testRunConfig: dict) -> tuple:
@@ -6,6 +6,9 @@ help_text = """
             remove - removes testomat.io ids from the ALL test
             report - report tests into testomat.io
             debug - saves analysed test metadata to the json in the test project root
+            launch - creates empty test run
+            finish - finishes test run with TESTOMATIO_RUN_ID
+            resend - uploads results of TESTOMATIO_RUN_ID kept in result journal after interrupted report
             """
 
 
@@ -60,6 +63,16 @@ def parser_options(parser: Parser, testomatio='testomatio') -> None:
                         Use --testomatio sync together with --structure option to enable this behaviour.
                         """
                      )
+    group.addoption('--incremental',
+                     action='store_true',
+                     default=False,
+                     dest="incremental",
+                     help="""
+                        Sync only tests from files changed since the last sync.
+                        Content hashes, titles and ids of synced tests are kept in .testomatio_sync.json in the project root.
+                        Use --testomatio sync together with --incremental option to enable this behaviour.
+                        """
+                     )
     group.addoption('--directory',
                      default=None,
                      dest="directory",
@@ -0,0 +1,111 @@
+import hashlib
+import json
+import logging
+import os
+from pytest import Item
+from pytestomatio.testing.testItem import TestItem
+
+log = logging.getLogger('pytestomatio')
+
+MANIFEST_FILE = '.testomatio_sync.json'
+# bump when the way tests are synced changes, so manifests of older versions are not trusted
+MANIFEST_VERSION = 1
+
+
+class SyncManifest:
+    """State of the last sync kept in the project root: content hash, titles and ids of tests of each file.
+
+    Incremental sync uses it to skip test files that did not change since the last sync. The manifest is
+    dropped when sync settings it was built with (project, structure, directory) change
+    """
+
+    def __init__(self, path: str, fingerprint: str, files: dict = None):
+        self.path = path
+        self.root = os.path.dirname(path)
+        self.fingerprint = fingerprint
+        # relative file path -> {'hash': str, 'tests': [[title, id], ...]}
+        self.files = files or {}
+        self._hashes = {}
+
+    @classmethod
+    def load(cls, path: str, fingerprint: str) -> 'SyncManifest':
+        try:
+            with open(path, encoding='utf-8') as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return cls(path, fingerprint)
+        except (OSError, ValueError) as e:
+            log.warning(f'Sync manifest {path} is not readable and will be rebuilt: {e}')
+            return cls(path, fingerprint)
+        if data.get('version') != MANIFEST_VERSION or data.get('fingerprint') != fingerprint:
+            log.info('Sync settings changed since the last sync. All tests will be synced')
+            return cls(path, fingerprint)
+        return cls(path, fingerprint, data.get('files'))
+
+    @staticmethod
+    def make_fingerprint(**settings) -> str:
+        return hashlib.sha256(json.dumps(settings, sort_keys=True, default=str).encode()).hexdigest()
+
+    def save(self) -> None:
+        data = {'version': MANIFEST_VERSION, 'fingerprint': self.fingerprint, 'files': self.files}
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+        # replaced at once, so interrupted sync does not leave a broken manifest
+        os.replace(tmp_path, self.path)
+
+    def _key(self, abs_path: str) -> str:
+        return os.path.relpath(abs_path, self.root)
+
+    def _hash(self, abs_path: str) -> str:
+        if abs_path not in self._hashes:
+            with open(abs_path, 'rb') as file:
+                self._hashes[abs_path] = hashlib.sha256(file.read()).hexdigest()
+        return self._hashes[abs_path]
+
+    def is_changed(self, abs_path: str) -> bool:
+        """File is changed if it is new, its content differs or some of its tests did not get an id"""
+        entry = self.files.get(self._key(abs_path))
+        if entry is None or entry['hash'] != self._hash(abs_path):
+            return True
+        return any(test_id is None for _, test_id in entry['tests'])
+
+    def changed_items(self, items: list[Item]) -> list[Item]:
+        changed = {}
+        result = []
+        for item in items:
+            path = str(item.path)
+            if path not in changed:
+                changed[path] = self.is_changed(path)
+            if changed[path]:
+                result.append(item)
+        log.info(f'Test files changed since the last sync: {sum(changed.values())} of {len(changed)}')
+        return result
+
+    def deleted_files(self) -> list[str]:
+        return [key for key in self.files if not os.path.exists(os.path.join(self.root, key))]
+
+    def removed_tests(self, meta: list[TestItem]) -> list[str]:
+        """Returns titles of tests removed from changed files and from deleted files since the last sync"""
+        titles = {}
+        for test in meta:
+            titles.setdefault(self._key(test.abs_path), set()).add(test.title)
+        removed = []
+        for key, current in titles.items():
+            entry = self.files.get(key)
+            if entry:
+                removed.extend(title for title, _ in entry['tests'] if title not in current)
+        for key in self.deleted_files():
+            removed.extend(title for title, _ in self.files[key]['tests'])
+        return removed
+
+    def update(self, test_files, meta: list[TestItem]) -> None:
+        """Stores synced files. Files are hashed again, as ids are written into them during sync"""
+        tests = {}
+        for test in meta:
+            tests.setdefault(test.abs_path, []).append([test.title, test.id])
+        for abs_path in test_files:
+            self._hashes.pop(abs_path, None)
+            self.files[self._key(abs_path)] = {'hash': self._hash(abs_path), 'tests': tests.get(abs_path, [])}
+        for key in self.deleted_files():
+            del self.files[key]
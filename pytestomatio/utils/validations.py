@@ -6,14 +6,14 @@ from _pytest.config.exceptions import UsageError
 
 
 
-def validate_option(config: Config) -> Literal['sync', 'report', 'remove', 'debug', 'launch', 'finish', None]:
+def validate_option(config: Config) -> Literal['sync', 'report', 'remove', 'debug', 'launch', 'finish', 'resend', None]:
     option = config.getoption('testomatio')
     option = option.lower() if option else None
-    if option in ('sync', 'report', 'remove', 'launch', 'finish'):
+    if option in ('sync', 'report', 'remove', 'launch', 'finish', 'resend'):
         if os.getenv('TESTOMATIO') is None:
             raise ValueError('TESTOMATIO env variable is not set')
 
-    if option == 'finish' and not (os.getenv('TESTOMATIO_RUN_ID') or os.getenv('TESTOMATIO_RUN')):
+    if option in ('finish', 'resend') and not (os.getenv('TESTOMATIO_RUN_ID') or os.getenv('TESTOMATIO_RUN')):
         raise ValueError('TESTOMATIO_RUN_ID env variable is not set')
     if option == 'launch' and (os.getenv('TESTOMATIO_RUN_ID') or os.getenv('TESTOMATIO_RUN')):
         raise ValueError('Test Run id was passed. Please unset TESTOMATIO_RUN_ID or '
@@ -0,0 +1,115 @@
+import gzip
+import io
+import pytest
+
+from pytestomatio.connect.artifact_stream import as_stream, is_text_artifact, IteratorStream, LimitedStream, \
+    CompressedStream, ArtifactTooLargeError, _ReaderStream
+
+
+class TestAsStream:
+    """Tests for as_stream function"""
+
+    def test_bytes(self):
+        """Test bytes wrapped into stream"""
+        assert as_stream(b'data').read() == b'data'
+
+    def test_file_object_returned_as_is(self):
+        """Test file-like object used without copying"""
+        file = io.BytesIO(b'data')
+        assert as_stream(file) is file
+
+    def test_iterator_of_chunks(self):
+        """Test chunks joined into stream"""
+        assert as_stream(iter([b'ab', b'', b'cd', b'e'])).read() == b'abcde'
+
+    def test_generator_read_by_parts(self):
+        """Test chunks are pulled from generator only when stream is read"""
+        pulled = []
+
+        def chunks():
+            for i in range(3):
+                pulled.append(i)
+                yield b'x' * 10
+
+        stream = IteratorStream(chunks())
+
+        assert stream.read(5) == b'x' * 5
+        assert pulled == [0]
+
+
+class TestIsTextArtifact:
+    """Tests for is_text_artifact function"""
+
+    @pytest.mark.parametrize('key, content_type', [
+        ('run.log', 'application/octet-stream'),
+        ('network.har', 'application/octet-stream'),
+        ('data.json', 'application/json'),
+        ('page.html', 'text/html'),
+    ])
+    def test_text(self, key, content_type):
+        """Test logs, HAR, JSON and text types are compressed"""
+        assert is_text_artifact(key, content_type)
+
+    @pytest.mark.parametrize('key, content_type', [
+        ('screen.png', 'image/png'),
+        ('video.webm', 'video/webm'),
+        ('trace.zip', 'application/zip'),
+    ])
+    def test_binary(self, key, content_type):
+        """Test media and archives are not compressed"""
+        assert not is_text_artifact(key, content_type)
+
+
+class TestReaderStream:
+    """Tests for base of transforming streams"""
+
+    def test_fill_must_be_defined(self):
+        """Test stream without _fill can not be created"""
+        class NoFillStream(_ReaderStream):
+            pass
+
+        with pytest.raises(TypeError, match='_fill'):
+            NoFillStream(io.BytesIO(b'data'))
+
+
+class TestLimitedStream:
+    """Tests for LimitedStream"""
+
+    def test_within_limit(self):
+        """Test stream within limit read completely"""
+        assert LimitedStream(io.BytesIO(b'x' * 10), 10).read() == b'x' * 10
+
+    def test_over_limit(self):
+        """Test error raised once limit exceeded"""
+        stream = LimitedStream(io.BytesIO(b'x' * 11), 10)
+
+        with pytest.raises(ArtifactTooLargeError):
+            while stream.read(4):
+                pass
+
+
+class TestCompressedStream:
+    """Tests for CompressedStream"""
+
+    def test_gzip(self):
+        """Test stream compressed by parts into valid gzip"""
+        data = b'GET /api/login 200\n' * 10000
+        stream = CompressedStream(io.BytesIO(data), 'gzip')
+
+        parts = []
+        while part := stream.read(1024):
+            parts.append(part)
+        compressed = b''.join(parts)
+
+        assert gzip.decompress(compressed) == data
+        assert stream.bytes_in == len(data)
+        assert stream.bytes_out == len(compressed) < len(data)
+
+    def test_zstd(self):
+        """Test zstd compression"""
+        zstandard = pytest.importorskip('zstandard')
+        data = b'{"status": "passed"}' * 1000
+
+        compressed = CompressedStream(io.BytesIO(data), 'zstd').read()
+
+        assert zstandard.ZstdDecompressor().decompressobj().decompress(compressed) == data
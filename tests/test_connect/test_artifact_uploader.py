@@ -0,0 +1,73 @@
+import threading
+import pytest
+from unittest.mock import Mock
+
+from pytestomatio.connect.artifact_uploader import ArtifactUploader
+from pytestomatio.connect.s3_connector import S3Connector
+
+
+class TestArtifactUploader:
+    """Tests for ArtifactUploader"""
+
+    @pytest.fixture
+    def s3_connector(self):
+        connector = S3Connector("us-east-1", "key", "secret", "https://s3.amazonaws.com", "test-bucket", "prefix")
+        connector._is_logged_in = True
+        connector.client = Mock()
+        return connector
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        paths = []
+        for name in ['screenshot.png', 'video.mp4']:
+            path = tmp_path / name
+            path.write_bytes(b'data')
+            paths.append(str(path))
+        return paths
+
+    def test_links_returned_before_upload(self, s3_connector, files):
+        """Test links returned at once while uploads are still running"""
+        release = threading.Event()
+        s3_connector.client.upload_file.side_effect = lambda *args, **kwargs: release.wait(5)
+        uploader = ArtifactUploader(s3_connector, concurrency=2)
+
+        links = uploader.submit([(path, None) for path in files])
+
+        assert links == ['https://test-bucket.s3.amazonaws.com/prefix/screenshot.png',
+                         'https://test-bucket.s3.amazonaws.com/prefix/video.mp4']
+        assert uploader.pending == 2
+        release.set()
+        summary = uploader.close(timeout=5)
+        assert summary == {'scheduled': 2, 'uploaded': 2, 'failed': []}
+        assert s3_connector.client.upload_file.call_count == 2
+
+    def test_failed_uploads_in_summary(self, s3_connector, files):
+        """Test failed uploads are reported in summary"""
+        def upload(file_path, *args, **kwargs):
+            if file_path.endswith('.mp4'):
+                raise Exception('Access Denied')
+        s3_connector.client.upload_file.side_effect = upload
+        uploader = ArtifactUploader(s3_connector, concurrency=2)
+
+        uploader.submit([(path, None) for path in files])
+        summary = uploader.close(timeout=5)
+
+        assert summary['uploaded'] == 1
+        assert summary['failed'] == [(files[1], 'Access Denied')]
+
+    def test_missing_file_skipped(self, s3_connector, files):
+        """Test missing files are not scheduled and have no link"""
+        uploader = ArtifactUploader(s3_connector)
+
+        links = uploader.submit([('missing.png', None), (files[0], 'custom.png')])
+
+        assert links == ['https://test-bucket.s3.amazonaws.com/prefix/custom.png']
+        assert uploader.close(timeout=5)['scheduled'] == 1
+
+    def test_not_logged_in(self, s3_connector, files):
+        """Test nothing scheduled without s3 session"""
+        s3_connector._is_logged_in = False
+        uploader = ArtifactUploader(s3_connector)
+
+        assert uploader.submit([(files[0], None)]) == []
+        assert not s3_connector.client.upload_file.called
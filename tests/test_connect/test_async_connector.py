@@ -0,0 +1,153 @@
+import json
+import threading
+import pytest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from pytestomatio.connect.exception import ReportFailedException
+from pytestomatio.connect.retry import RetryPolicy
+
+pytest.importorskip('aiohttp')
+from pytestomatio.connect.async_connector import AsyncConnector
+
+
+class StubServer(ThreadingHTTPServer):
+    """Local Testomat.io API stub. Records requests and replies with queued status codes, 200 by default"""
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.requests = []
+        self.statuses = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+    def next_status(self):
+        with self.lock:
+            return self.statuses.pop(0) if self.statuses else 200
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def _handle(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = json.loads(self.rfile.read(length)) if length else None
+        with self.server.lock:
+            self.server.requests.append((self.command, self.path, body))
+        status = self.server.next_status()
+        payload = json.dumps({'uid': 'run_123'}).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_POST = do_PUT = _handle
+
+    def log_message(self, *args):
+        pass
+
+
+class TestAsyncConnector:
+    """Tests for AsyncConnector"""
+
+    @pytest.fixture
+    def server(self):
+        server = StubServer()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture
+    def connector(self, server):
+        connector = AsyncConnector(server.url, 'api_key', RetryPolicy(max_attempts=3, base_delay=0))
+        connector.start()
+        yield connector
+        connector.close(timeout=5)
+
+    def test_create_test_run(self, server, connector):
+        """Test create test run returns response body"""
+        result = connector.create_test_run(title='Test Run', env=None).result(5)
+
+        assert result == {'uid': 'run_123'}
+        method, path, body = server.requests[0]
+        assert (method, path) == ('POST', '/api/reporter')
+        assert body == {'api_key': 'api_key', 'title': 'Test Run'}
+
+    def test_many_status_updates_in_flight(self, server, connector):
+        """Test status updates are scheduled without waiting and all are delivered"""
+        futures = [connector.update_test_status('run_123', title=f'Test {i}', status='passed', message=None)
+                   for i in range(20)]
+        connector.wait(5)
+
+        assert all(future.done() for future in futures)
+        assert connector.pending == 0
+        assert len(server.requests) == 20
+        method, path, body = server.requests[0]
+        assert path == '/api/reporter/run_123/testrun?api_key=api_key'
+        assert 'message' not in body
+
+    def test_request_retried(self, server, connector):
+        """Test request retried on retryable status code"""
+        server.statuses = [503, 200]
+
+        connector.finish_test_run('run_123', is_final=True).result(5)
+
+        assert len(server.requests) == 2
+        assert server.requests[-1] == ('PUT', '/api/reporter/run_123?api_key=api_key',
+                                       {'status_event': 'finish_parallel'})
+
+    def test_post_not_retried_on_bad_gateway(self, server, connector):
+        """Test POST not sent again on response server may have processed it with"""
+        server.statuses = [502, 200]
+
+        result = connector.send_batch('run_123', [{'title': 'Test'}], 1).result(5)
+
+        assert result is False
+        assert len(server.requests) == 1
+
+    def test_batch_tests_upload(self, server, connector):
+        """Test all batches sent concurrently with batch index by position"""
+        tests = [{'title': str(i)} for i in range(5)]
+
+        summary = connector.batch_tests_upload('run_123', 2, tests).result(5)
+
+        assert summary == {'batches': 3, 'sent': [1, 2, 3], 'failed': [], 'skipped': []}
+        batches = sorted(body['batch_index'] for _, _, body in server.requests)
+        assert batches == [1, 2, 3]
+
+    def test_report_failed_on_403(self, server, connector):
+        """Test 403 status marks reporting as failed"""
+        server.statuses = [403]
+
+        future = connector.update_test_status('run_123', title='Test', status='passed')
+
+        with pytest.raises(ReportFailedException):
+            future.result(5)
+        assert connector.report_failed is True
+
+    def test_close_waits_for_pending_requests(self, server):
+        """Test close delivers scheduled requests before stopping"""
+        connector = AsyncConnector(server.url, 'api_key', RetryPolicy(max_attempts=3, base_delay=0))
+        connector.start()
+        for i in range(5):
+            connector.update_test_status('run_123', title=f'Test {i}', status='passed')
+
+        connector.close(timeout=5)
+
+        assert len(server.requests) == 5
+
+    def test_requests_sent_through_proxy(self, server):
+        """Test requests sent through given proxy"""
+        connector = AsyncConnector('http://testomatio.invalid', 'api_key', RetryPolicy(max_attempts=1, base_delay=0),
+                                   proxy=server.url, verify_ssl=False)
+        connector.start()
+
+        result = connector.create_test_run(title='Test Run').result(5)
+        connector.close(timeout=5)
+
+        assert result == {'uid': 'run_123'}
+        method, path, _ = server.requests[0]
+        assert (method, path) == ('POST', 'http://testomatio.invalid/api/reporter')
@@ -1,10 +1,11 @@
 import pytest
 from unittest.mock import Mock, patch
 import requests
-from requests.exceptions import HTTPError, ConnectionError
+from requests.exceptions import HTTPError, ConnectionError, ConnectTimeout, ReadTimeout
 import os
 
-from pytestomatio.connect.connector import Connector, MAX_RETRIES_DEFAULT, RETRY_INTERVAL_DEFAULT
+from pytestomatio.connect.connector import Connector, MAX_RETRIES_DEFAULT, RETRY_INTERVAL_DEFAULT, \
+    UPLOAD_CONCURRENCY_DEFAULT
 from pytestomatio.connect.exception import MaxRetriesException, ReportFailedException
 from pytestomatio.testing.testItem import TestItem
 
@@ -91,6 +92,32 @@ class TestConnector:
             assert connector.retry_interval != value
             assert connector.retry_interval == RETRY_INTERVAL_DEFAULT
 
+    @pytest.mark.parametrize('value, expected', [('4', 4), ('0', UPLOAD_CONCURRENCY_DEFAULT),
+                                                 ('word', UPLOAD_CONCURRENCY_DEFAULT)])
+    def test_init_upload_concurrency(self, value, expected):
+        """Test values for TESTOMATIO_UPLOAD_CONCURRENCY"""
+        with patch.dict(os.environ, {'TESTOMATIO_UPLOAD_CONCURRENCY': value}, clear=True):
+            connector = Connector("https://example.com", "api_key")
+
+            assert connector.upload_concurrency == expected
+
+    def test_init_transport_settings(self):
+        """Test adapter configured from env vars"""
+        env_vars = {
+            'TESTOMATIO_CONNECT_TIMEOUT': '3',
+            'TESTOMATIO_READ_TIMEOUT': '30',
+            'TESTOMATIO_COMPRESS_REQUESTS': 'true',
+            'TESTOMATIO_UPLOAD_CONCURRENCY': '16'
+        }
+        with patch.dict(os.environ, env_vars, clear=True):
+            connector = Connector("https://example.com", "api_key")
+
+            assert connector.timeout == (3, 30)
+            assert connector.adapter.timeout == (3, 30)
+            assert connector.adapter.compress is True
+            assert connector.adapter._pool_maxsize == 18
+            assert connector._session.get_adapter("https://example.com") is connector.adapter
+
     @patch.dict(os.environ, {}, clear=True)
     def test_apply_proxy_settings_no_proxy(self, connector):
         """Test config without proxy"""
@@ -122,40 +149,98 @@ class TestConnector:
             assert connector._session.proxies == {}
             assert connector._session.verify is True
 
+    @patch.dict(os.environ, {}, clear=True)
+    def test_apply_proxy_settings_no_proxy_skips_connection_check(self, connector):
+        """Test direct connection is used without network check"""
+        with patch.object(connector, '_test_proxy_connection') as mock_check:
+            connector._apply_proxy_settings()
+
+            mock_check.assert_not_called()
+
+    @patch.dict(os.environ, {'HTTP_PROXY': 'http://proxy.example.com:8080'})
+    def test_proxy_settings_applied_once(self, connector):
+        """Test proxy is checked only on first session access"""
+        with patch.object(connector, '_test_proxy_connection', return_value=True) as mock_check:
+            for _ in range(3):
+                session = connector.session
+
+            assert session is connector._session
+            assert mock_check.call_count == 1
+
+    @patch.dict(os.environ, {'HTTP_PROXY': 'http://proxy.example.com:8080'})
+    @patch('pytestomatio.connect.connector.time.monotonic')
+    def test_proxy_settings_rechecked_after_ttl(self, mock_monotonic, connector):
+        """Test proxy is checked again when TESTOMATIO_PROXY_CHECK_TTL expired"""
+        connector.proxy_check_ttl = 60
+        with patch.object(connector, '_test_proxy_connection', return_value=True) as mock_check:
+            mock_monotonic.return_value = 100
+            connector.session
+            mock_monotonic.return_value = 150
+            connector.session
+            assert mock_check.call_count == 1
+
+            mock_monotonic.return_value = 161
+            connector.session
+            assert mock_check.call_count == 2
+
+    @patch('requests.Session.get')
+    def test_test_proxy_connection_uses_base_url(self, mock_get, connector):
+        """Test connection is checked against testomat.io url"""
+        connector._test_proxy_connection(timeout=1)
+
+        assert mock_get.call_args[0][0] == connector.base_url
+
     @patch('requests.Session.get')
     def test_test_proxy_connection_success(self, mock_get, connector):
         """Test successful connection check"""
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = Mock(status_code=200)
 
         result = connector._test_proxy_connection(timeout=1)
 
         assert result is True
         assert mock_get.call_count == 1
 
+    @pytest.mark.parametrize("status_code", [401, 404, 500])
+    @patch('requests.Session.get')
+    def test_test_proxy_connection_error_status(self, mock_get, status_code, connector):
+        """Test error status received through proxy means proxy is reachable"""
+        mock_get.return_value = Mock(status_code=status_code)
+
+        assert connector._test_proxy_connection(timeout=1) is True
+        assert mock_get.call_count == 1
+
     @patch('requests.Session.get')
     @patch('time.sleep')
     def test_test_proxy_connection_timeout(self, mock_sleep, mock_get, connector):
         """Test check connection timeout"""
-        mock_get.side_effect = requests.exceptions.RequestException("Connection failed")
+        mock_get.side_effect = requests.exceptions.ProxyError("Connection failed")
 
         result = connector._test_proxy_connection(timeout=1, retry_interval=0.1)
 
         assert result is False
         assert mock_get.call_count > 1
 
-    @pytest.mark.parametrize("status_code", [400, 403, 404, 429, 500])
+    @pytest.mark.parametrize("error", [requests.exceptions.TooManyRedirects, requests.exceptions.InvalidURL,
+                                       requests.exceptions.MissingSchema])
+    @patch('requests.Session.get')
+    @patch('time.sleep')
+    def test_test_proxy_connection_request_error(self, mock_sleep, mock_get, error, connector):
+        """Test any request error means connection through proxy is not available"""
+        mock_get.side_effect = error("Request failed")
+
+        assert connector._test_proxy_connection(timeout=1, retry_interval=0.1) is False
+
+    @pytest.mark.parametrize("status_code", [400, 403, 404, 500])
     def test_should_not_retry_with_status_codes(self, status_code, connector):
-        """Should not retry on status codes lower than 501"""
+        """Should not retry on status codes lower than 501 except 408 and 429"""
         response = Mock()
         response.status_code = status_code
 
         assert connector._should_retry(response) is False
 
-    @pytest.mark.parametrize("status_code", [501, 502, 503, 504])
+    @pytest.mark.parametrize("status_code", [408, 429, 501, 502, 503, 504])
     def test_should_retry_on_error_codes(self, status_code, connector):
-        """Should retry on status codes >= 501"""
+        """Should retry on 408, 429 and status codes >= 501"""
         response = Mock()
         response.status_code = status_code
 
@@ -197,7 +282,8 @@ class TestConnector:
         with pytest.raises(MaxRetriesException):
             connector._send_request_with_retry(method, url)
 
-        assert mock_sleep.call_count == 2
+        # no wait after the last attempt
+        assert mock_sleep.call_count == 1
 
     def test_send_request_no_retry_on_non_retryable_status_code(self, connector, mock_response):
         """send_request method should not retry on status codes in skip list"""
@@ -270,14 +356,109 @@ class TestConnector:
         assert len(payload['tests']) == 1
         assert payload['tests'][0]['name'] == 'Test Login'
 
+    def make_tests(self, count):
+        tests = []
+        for i in range(count):
+            test = Mock(spec=TestItem)
+            test.sync_title = f"Test {i}"
+            test.class_name = None
+            test.source_code = f"def test_{i}(): pass"
+            test.file_path = test.file_name = "test_file.py"
+            test.docstring = None
+            tests.append(test)
+        return tests
+
+    @patch('requests.Session.post')
+    @patch.object(Connector, '_apply_proxy_settings')
+    def test_load_tests_in_chunks(self, mock_apply_proxy, mock_post, connector, mock_response, tmp_path):
+        """Test tests loaded in chunks without detaching and progress removed after import"""
+        mock_post.return_value = mock_response(200)
+        connector.load_chunk_size = 2
+
+        with patch('tempfile.gettempdir', return_value=str(tmp_path)):
+            summary = connector.load_tests(self.make_tests(5))
+
+        assert [len(c[1]['json']['tests']) for c in mock_post.call_args_list] == [2, 2, 1]
+        assert all(c[1]['json']['no-detach'] is True for c in mock_post.call_args_list)
+        assert summary == {'chunks': 3, 'loaded': 3, 'skipped': 0, 'failed': 0, 'tests': 5}
+        assert list(tmp_path.iterdir()) == []
+
+    @patch('requests.Session.post')
+    @patch.object(Connector, '_apply_proxy_settings')
+    def test_load_tests_resumed_after_failed_chunk(self, mock_apply_proxy, mock_post, connector, mock_response,
+                                                   tmp_path):
+        """Test chunks loaded before are skipped when import is started again"""
+        mock_post.side_effect = [mock_response(200), mock_response(400), mock_response(200),
+                                 mock_response(200)]
+        connector.load_chunk_size = 2
+        tests = self.make_tests(5)
+
+        with patch('tempfile.gettempdir', return_value=str(tmp_path)):
+            first = connector.load_tests(tests)
+            second = connector.load_tests(tests)
+
+        assert first == {'chunks': 3, 'loaded': 2, 'skipped': 0, 'failed': 1, 'tests': 3}
+        assert second == {'chunks': 3, 'loaded': 1, 'skipped': 2, 'failed': 0, 'tests': 2}
+        assert mock_post.call_args_list[3][1]['json']['tests'][0]['name'] == 'Test 2'
+
+    @patch('requests.Session.post')
+    @patch.object(Connector, '_apply_proxy_settings')
+    def test_load_tests_progress_kept_after_connection_error(self, mock_apply_proxy, mock_post, connector,
+                                                             mock_response, tmp_path):
+        """Test chunks loaded before connection error are skipped when import is started again"""
+        mock_post.side_effect = [mock_response(200), requests.exceptions.InvalidURL("Invalid url"),
+                                 mock_response(200), mock_response(200)]
+        connector.load_chunk_size = 2
+        tests = self.make_tests(5)
+
+        with patch('tempfile.gettempdir', return_value=str(tmp_path)):
+            first = connector.load_tests(tests)
+            second = connector.load_tests(tests)
+
+        assert first == {'chunks': 3, 'loaded': 1, 'skipped': 0, 'failed': 1, 'tests': 2}
+        assert second == {'chunks': 3, 'loaded': 2, 'skipped': 1, 'failed': 0, 'tests': 3}
+        assert not list(tmp_path.rglob('*.json'))
+
+    @patch('requests.Session.post')
+    @patch.object(Connector, '_apply_proxy_settings')
+    def test_load_tests_progress_not_reused_for_changed_tests(self, mock_apply_proxy, mock_post, connector,
+                                                              mock_response, tmp_path, caplog):
+        """Test progress of a failed import not used when different tests are loaded"""
+        mock_post.side_effect = [mock_response(200), mock_response(400), mock_response(200),
+                                 mock_response(200), mock_response(200), mock_response(200)]
+        connector.load_chunk_size = 2
+        tests = self.make_tests(6)
+
+        with patch('tempfile.gettempdir', return_value=str(tmp_path)), caplog.at_level('WARNING'):
+            connector.load_tests(tests[:5])
+            assert len(list(tmp_path.iterdir())) == 1
+            summary = connector.load_tests(tests)
+
+        assert summary == {'chunks': 3, 'loaded': 3, 'skipped': 0, 'failed': 0, 'tests': 6}
+        assert list(tmp_path.iterdir()) == []
+        assert 'detach of tests is disabled' in caplog.text
+
+    @patch('requests.Session.post')
+    @patch.object(Connector, '_apply_proxy_settings')
+    def test_load_tests_single_request_by_default(self, mock_apply_proxy, mock_post, connector, mock_response):
+        """Test all tests loaded in one request and detaching is not changed"""
+        mock_post.return_value = mock_response(200)
+
+        summary = connector.load_tests(self.make_tests(5))
+
+        assert mock_post.call_count == 1
+        assert mock_post.call_args[1]['json']['no-detach'] is False
+        assert summary['tests'] == 5
+
+    @patch('time.sleep')
     @patch('requests.Session.post')
-    def test_load_tests_connection_error(self, mock_post, connector):
+    def test_load_tests_connection_error(self, mock_post, mock_sleep, connector):
         """Test handling connection error on load_tests"""
         mock_post.side_effect = ConnectionError("Connection failed")
 
         result = connector.load_tests([])
 
-        assert result is None
+        assert result == {'chunks': 1, 'loaded': 0, 'skipped': 0, 'failed': 1, 'tests': 0}
 
     @patch('requests.Session.get')
     @patch.object(Connector, '_apply_proxy_settings')
@@ -529,6 +710,278 @@ class TestConnector:
         with pytest.raises(ReportFailedException):
             connector.batch_tests_upload(run_id, batch_size, tests)
 
+    @patch('requests.Session.post')
+    @patch.object(Connector, '_apply_proxy_settings')
+    def test_batch_upload_concurrent(self, mock_apply_proxy, mock_post, connector):
+        """Test concurrent batch upload keeps batch index of each batch"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_post.return_value = mock_response
+
+        tests = [{'title': str(i)} for i in range(0, 10)]
+        summary = connector.batch_tests_upload('AS23Fd', 3, tests, concurrency=4)
+
+        assert mock_post.call_count == 4
+        sent = {c[1]['json']['batch_index']: c[1]['json']['tests'] for c in mock_post.call_args_list}
+        assert sent[1] == tests[0:3]
+        assert sent[4] == tests[9:10]
+        assert summary == {'batches': 4, 'sent': [1, 2, 3, 4], 'failed': [], 'skipped': []}
+
+    @patch('requests.Session.post')
+    @patch.object(Connector, '_apply_proxy_settings')
+    def test_batch_upload_start_index(self, mock_apply_proxy, mock_post, connector):
+        """Test batch indexes counted from start index"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_post.return_value = mock_response
+
+        tests = [{'title': str(i)} for i in range(0, 5)]
+        summary = connector.batch_tests_upload('AS23Fd', 2, tests, start_index=21)
+
+        assert [c[1]['json']['batch_index'] for c in mock_post.call_args_list] == [21, 22, 23]
+        assert summary == {'batches': 3, 'sent': [21, 22, 23], 'failed': [], 'skipped': []}
+
+    @patch('time.sleep')
+    @patch('requests.Session.post')
+    @patch.object(Connector, '_apply_proxy_settings')
+    def test_batch_upload_aborted_on_connection_error(self, mock_apply_proxy, mock_post, mock_sleep, connector):
+        """Test remaining batches are skipped when server is not reachable"""
+        mock_post.side_effect = ConnectTimeout("Connection failed")
+
+        tests = [{} for i in range(0, 100)]
+        summary = connector.batch_tests_upload('AS23Fd', 50, tests)
+
+        assert mock_post.call_count == connector.max_retries
+        assert summary == {'batches': 2, 'sent': [], 'failed': [1], 'skipped': [2]}
+
+    @patch('requests.Session.post')
+    @patch.object(Connector, '_apply_proxy_settings')
+    def test_batch_upload_reports_sent_batches_before_abort(self, mock_apply_proxy, mock_post, connector):
+        """Test each accepted batch reported to on_sent before upload is aborted by 403"""
+        mock_post.side_effect = [Mock(status_code=200), Mock(status_code=403)]
+        sent = []
+
+        with pytest.raises(ReportFailedException):
+            connector.batch_tests_upload('AS23Fd', 10, [{} for i in range(0, 30)], start_index=5,
+                                         on_sent=sent.append)
+
+        assert sent == [5]
+
+    @patch('requests.Session.post')
+    @patch.object(Connector, '_apply_proxy_settings')
+    def test_batch_upload_concurrent_should_raise_report_failed_on_403(self, mock_apply_proxy, mock_post,
+                                                                       connector):
+        """Test concurrent batch upload raises ReportFailedException on 403 status code"""
+        mock_response = Mock()
+        mock_response.status_code = 403
+        mock_post.return_value = mock_response
+
+        tests = [{} for i in range(0, 100)]
+        with pytest.raises(ReportFailedException):
+            connector.batch_tests_upload('AS23Fd', 10, tests, concurrency=3)
+
+    @patch('time.sleep')
+    def test_send_request_retry_on_connection_error(self, mock_sleep, connector, mock_response):
+        """send_request method should retry when connection failed"""
+        connector.max_retries = 3
+        mock_session = Mock()
+        mock_session.get = Mock(side_effect=[ConnectionError("Connection failed"), mock_response(200)])
+        connector._session = mock_session
+        connector._apply_proxy_settings = Mock()
+
+        result = connector._send_request_with_retry('get', 'https://api.example.com/test')
+
+        assert result.status_code == 200
+        assert mock_sleep.call_count == 1
+
+    @patch('time.sleep')
+    def test_send_request_raises_connection_error_after_retries(self, mock_sleep, connector):
+        """send_request method should raise original error when all attempts failed"""
+        connector.max_retries = 2
+        mock_session = Mock()
+        mock_session.get = Mock(side_effect=ConnectionError("Connection failed"))
+        connector._session = mock_session
+        connector._apply_proxy_settings = Mock()
+
+        with pytest.raises(ConnectionError):
+            connector._send_request_with_retry('get', 'https://api.example.com/test')
+
+        assert mock_session.get.call_count == 2
+
+    @patch('time.sleep')
+    def test_send_request_honors_retry_after(self, mock_sleep, connector, mock_response):
+        """send_request method should wait as long as Retry-After header requests"""
+        throttled = mock_response(429)
+        throttled.headers = {'Retry-After': '7'}
+        mock_session = Mock()
+        mock_session.get = Mock(side_effect=[throttled, mock_response(200)])
+        connector._session = mock_session
+        connector._apply_proxy_settings = Mock()
+
+        result = connector._send_request_with_retry('get', 'https://api.example.com/test')
+
+        assert result.status_code == 200
+        mock_sleep.assert_called_once_with(7.0)
+
+    @patch('time.sleep')
+    def test_post_not_retried_on_read_timeout(self, mock_sleep, connector):
+        """POST request should not be sent again when server may have processed it"""
+        mock_session = Mock()
+        mock_session.post = Mock(side_effect=ReadTimeout("Read timed out"))
+        connector._session = mock_session
+        connector._apply_proxy_settings = Mock()
+
+        with pytest.raises(ReadTimeout):
+            connector._send_request_with_retry('post', 'https://api.example.com/test', json={})
+
+        assert mock_session.post.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch('time.sleep')
+    def test_post_retried_on_connect_timeout(self, mock_sleep, connector, mock_response):
+        """POST request should be retried when connection was not established"""
+        mock_session = Mock()
+        mock_session.post = Mock(side_effect=[ConnectTimeout("Connect timed out"), mock_response(200)])
+        connector._session = mock_session
+        connector._apply_proxy_settings = Mock()
+
+        result = connector._send_request_with_retry('post', 'https://api.example.com/test', json={})
+
+        assert result.status_code == 200
+        assert mock_session.post.call_count == 2
+
+    @pytest.mark.parametrize("status_code, expected", [(429, True), (503, True), (408, False), (502, False),
+                                                       (504, False)])
+    def test_should_retry_post(self, status_code, expected, connector, mock_response):
+        """POST request should be retried only on responses that guarantee it was not processed"""
+        assert connector._should_retry(mock_response(status_code), 'post') is expected
+
+    @patch('time.sleep')
+    def test_send_request_honors_retry_after_above_max_delay(self, mock_sleep, connector, mock_response):
+        """send_request method should wait for Retry-After longer than max delay within deadline"""
+        connector.retry_policy.max_delay = 10
+        throttled = mock_response(429)
+        throttled.headers = {'Retry-After': '90'}
+        mock_session = Mock()
+        mock_session.get = Mock(side_effect=[throttled, mock_response(200)])
+        connector._session = mock_session
+        connector._apply_proxy_settings = Mock()
+
+        result = connector._send_request_with_retry('get', 'https://api.example.com/test')
+
+        assert result.status_code == 200
+        mock_sleep.assert_called_once_with(90.0)
+
+    @patch('time.sleep')
+    @patch('pytestomatio.connect.connector.time.monotonic')
+    def test_send_request_stops_on_deadline(self, mock_monotonic, mock_sleep, connector, mock_response):
+        """send_request method should not retry when request deadline would be exceeded"""
+        connector.retry_policy.deadline = 10
+        mock_monotonic.return_value = 0
+        throttled = mock_response(503)
+        throttled.headers = {'Retry-After': '30'}
+        mock_session = Mock()
+        mock_session.get = Mock(return_value=throttled)
+        connector._session = mock_session
+        connector._apply_proxy_settings = Mock()
+
+        with pytest.raises(MaxRetriesException):
+            connector._send_request_with_retry('get', 'https://api.example.com/test')
+
+        assert mock_session.get.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch('time.sleep')
+    def test_get_filtered_tests_retried(self, mock_sleep, connector, mock_response):
+        """Test filtered tests request is retried"""
+        response = mock_response(200)
+        response.json.return_value = {'tests': ['T1']}
+        mock_session = Mock()
+        mock_session.get = Mock(side_effect=[mock_response(503), response])
+        connector._session = mock_session
+        connector._apply_proxy_settings = Mock()
+
+        result = connector.get_filtered_tests('tag', 'smoke')
+
+        assert result == {'tests': ['T1']}
+        assert mock_session.get.call_count == 2
+
+    @pytest.fixture
+    def cached_connector(self, tmp_path, mock_response):
+        with patch.dict(os.environ, {'TESTOMATIO_RESPONSE_CACHE': '1',
+                                     'TESTOMATIO_RESPONSE_CACHE_DIR': str(tmp_path),
+                                     'TESTOMATIO_RESPONSE_CACHE_TTL': '60'}):
+            connector = Connector("https://api.testomat.io", "test_api_key_123")
+        connector._session = Mock()
+        connector._apply_proxy_settings = Mock()
+        response = mock_response(200)
+        response.json.return_value = {'tests': ['T1']}
+        response.headers = {'ETag': '"v1"'}
+        connector._session.get.return_value = response
+        return connector
+
+    def test_get_proxy_settings(self, connector):
+        """Test proxy and SSL verification of the session returned"""
+        with patch.dict(os.environ, {'HTTP_PROXY': 'http://proxy:8080'}), \
+                patch.object(Connector, '_test_proxy_connection', return_value=True):
+            assert connector.get_proxy_settings() == ('http://proxy:8080', False)
+
+    def test_get_proxy_settings_without_proxy(self, connector):
+        """Test direct connection with SSL verification returned without proxy"""
+        with patch.dict(os.environ, {}, clear=True):
+            assert connector.get_proxy_settings() == (None, True)
+
+    def test_response_cache_disabled_by_default(self, connector):
+        """Test responses not cached without TESTOMATIO_RESPONSE_CACHE"""
+        assert connector.response_cache is None
+
+    def test_get_filtered_tests_cached_within_ttl(self, cached_connector):
+        """Test filtered tests requested once while cached response is fresh"""
+        first = cached_connector.get_filtered_tests('tag', 'smoke')
+        second = cached_connector.get_filtered_tests('tag', 'smoke')
+
+        assert first == second == {'tests': ['T1']}
+        assert cached_connector._session.get.call_count == 1
+        assert cached_connector._session.get.call_args.kwargs['headers'] == {}
+
+    def test_get_filtered_tests_revalidated_after_ttl(self, cached_connector, mock_response):
+        """Test expired response revalidated with ETag and reused on 304"""
+        cached_connector.get_filtered_tests('tag', 'smoke')
+        cached_connector.response_cache.ttl = 0
+        cached_connector._session.get.return_value = mock_response(304)
+
+        result = cached_connector.get_filtered_tests('tag', 'smoke')
+
+        assert result == {'tests': ['T1']}
+        assert cached_connector._session.get.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+
+    def test_get_tests_always_revalidated(self, cached_connector, mock_response):
+        """Test test ids revalidated even if cached response is fresh, and replaced when modified"""
+        cached_connector.get_tests([])
+        modified = mock_response(200)
+        modified.json.return_value = {'tests': ['T2']}
+        modified.headers = {}
+        cached_connector._session.get.return_value = modified
+
+        result = cached_connector.get_tests([])
+
+        assert result == {'tests': ['T2']}
+        assert cached_connector._session.get.call_count == 2
+        assert cached_connector._session.get.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+
+    @patch('requests.Session.post')
+    @patch.object(Connector, '_apply_proxy_settings')
+    def test_send_batch(self, mock_apply_proxy, mock_post, connector):
+        """Test single batch sent with given batch index"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_post.return_value = mock_response
+
+        result = connector.send_batch('AS23Fd', [{'title': 'test'}], 3)
+
+        assert result is True
+        assert mock_post.call_args[1]['json'] == {'tests': [{'title': 'test'}], 'batch_index': 3}
+
     @patch('requests.Session.post')
     def test_update_test_status_filters_none_values(self, mock_post, connector):
         """Test update test status filters keys with none value"""
@@ -596,19 +1049,24 @@ class TestConnector:
             json={"status_event": "finish"}
         )
 
+    @patch('time.sleep')
     @patch('requests.Session.put')
-    def test_finish_test_run_connection_error(self, mock_put, connector):
+    def test_finish_test_run_connection_error(self, mock_put, mock_sleep, connector):
         """Test handling connection error when finish test run"""
         mock_put.side_effect = ConnectionError("Connection failed")
 
         result = connector.finish_test_run("run_123")
         assert result is None
 
-    def test_disconnect(self, connector):
-        """Test session closed"""
-        with patch.object(connector._session, 'close') as mock_close:
+    def test_disconnect(self, connector, caplog):
+        """Test session closed and transport stats logged"""
+        with patch.object(connector._session, 'close') as mock_close, \
+                patch.object(connector, '_apply_proxy_settings') as mock_apply, \
+                caplog.at_level('INFO'):
             connector.disconnect()
             assert mock_close.call_count == 1
+            mock_apply.assert_not_called()
+        assert "Transport stats: {'requests': 0" in caplog.text
 
     def test_session_property_getter(self, connector):
         """Test getter for session property"""
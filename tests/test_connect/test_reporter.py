@@ -0,0 +1,109 @@
+import pytest
+import threading
+from unittest.mock import Mock
+
+from pytestomatio.connect.exception import ReportFailedException
+from pytestomatio.connect.reporter import StreamingReporter
+
+
+class TestStreamingReporter:
+    """Tests for StreamingReporter"""
+
+    @pytest.fixture
+    def connector(self):
+        connector = Mock()
+        connector.send_batch.return_value = True
+        return connector
+
+    def test_sends_batch_when_batch_size_reached(self, connector):
+        """Test full batches are sent while reporter is running"""
+        sent = threading.Event()
+        connector.send_batch.side_effect = lambda *args: sent.set() or True
+        reporter = StreamingReporter(connector, 'run_123', batch_size=2, flush_interval=60)
+        reporter.start()
+
+        reporter.put({'title': 'first'})
+        reporter.put({'title': 'second'})
+
+        assert sent.wait(5)
+        connector.send_batch.assert_called_once_with('run_123', [{'title': 'first'}, {'title': 'second'}], 1)
+        reporter.stop()
+
+    def test_batch_index_counted_from_start_index(self, connector):
+        """Test batch index starts from given start index"""
+        reporter = StreamingReporter(connector, 'run_123', batch_size=1, flush_interval=60, start_index=100001)
+        reporter.start()
+
+        reporter.put({'title': 'first'})
+        reporter.put({'title': 'second'})
+        reporter.stop(5)
+
+        assert [c[0][2] for c in connector.send_batch.call_args_list] == [100001, 100002]
+
+    def test_sends_partial_batch_after_flush_interval(self, connector):
+        """Test incomplete batch is sent when flush interval elapsed"""
+        sent = threading.Event()
+        connector.send_batch.side_effect = lambda *args: sent.set() or True
+        reporter = StreamingReporter(connector, 'run_123', batch_size=50, flush_interval=0)
+        reporter.start()
+
+        reporter.put({'title': 'first'})
+
+        assert sent.wait(5)
+        assert reporter.is_running
+        reporter.stop()
+        assert connector.send_batch.call_count == 1
+
+    def test_stop_drains_queue(self, connector):
+        """Test stop sends remaining results with increasing batch index"""
+        reporter = StreamingReporter(connector, 'run_123', batch_size=2, flush_interval=60)
+        reporter.start()
+
+        for i in range(5):
+            reporter.put({'title': f'test {i}'})
+        reporter.stop()
+
+        assert not reporter.is_running
+        assert [c.args[2] for c in connector.send_batch.call_args_list] == [1, 2, 3]
+        stats = reporter.stats()
+        assert stats['enqueued'] == 5
+        assert stats['sent'] == 5
+        assert stats['flushes'] == 3
+        assert stats['queue_depth'] == 0
+
+    def test_failed_batch_counted(self, connector):
+        """Test failed batches are counted as dropped results"""
+        connector.send_batch.side_effect = [ConnectionError('Connection failed'), True]
+        reporter = StreamingReporter(connector, 'run_123', batch_size=1, flush_interval=60)
+        reporter.start()
+
+        reporter.put({'title': 'first'})
+        reporter.put({'title': 'second'})
+        reporter.stop()
+
+        stats = reporter.stats()
+        assert stats['sent'] == 1
+        assert stats['dropped'] == 1
+        assert stats['failed_batches'] == 1
+
+    def test_report_failed_stops_uploading(self, connector):
+        """Test results are dropped without requests after ReportFailedException"""
+        connector.send_batch.side_effect = ReportFailedException()
+        reporter = StreamingReporter(connector, 'run_123', batch_size=1, flush_interval=60)
+        reporter.start()
+
+        for i in range(3):
+            reporter.put({'title': f'test {i}'})
+        reporter.stop()
+
+        assert isinstance(reporter.error, ReportFailedException)
+        assert connector.send_batch.call_count == 1
+        assert reporter.stats()['dropped'] == 3
+
+    def test_stop_without_start(self, connector):
+        """Test stop does nothing if reporter was not started"""
+        reporter = StreamingReporter(connector, 'run_123', batch_size=1)
+
+        reporter.stop()
+
+        connector.send_batch.assert_not_called()
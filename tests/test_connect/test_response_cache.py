@@ -0,0 +1,71 @@
+import os
+import time
+
+from pytestomatio.connect.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """Tests for ResponseCache"""
+
+    def test_put_and_get(self, tmp_path):
+        """Test cached body stored with validators"""
+        cache = ResponseCache(str(tmp_path / 'cache'))
+        key = cache.make_key('https://app.testomat.io', 'api_key', 'test_data')
+
+        cache.put(key, {'tests': ['T1']}, etag='"abc"', last_modified='Mon, 01 Jan 2024 00:00:00 GMT')
+        entry = cache.get(key)
+
+        assert entry['body'] == {'tests': ['T1']}
+        assert cache.conditional_headers(entry) == {'If-None-Match': '"abc"',
+                                                    'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'}
+
+    def test_missing_and_broken_entry(self, tmp_path):
+        """Test missing or broken entry treated as not cached"""
+        cache = ResponseCache(str(tmp_path))
+        (tmp_path / 'broken.json').write_text('{"body": ')
+
+        assert cache.get('missing') is None
+        assert cache.get('broken') is None
+        assert cache.conditional_headers(None) == {}
+
+    def test_key_depends_on_project_and_query(self):
+        """Test different projects and queries do not share cached responses"""
+        key = ResponseCache.make_key('https://app.testomat.io', 'key_1', 'test_grep?type=tag&id=smoke')
+
+        assert key != ResponseCache.make_key('https://app.testomat.io', 'key_2', 'test_grep?type=tag&id=smoke')
+        assert key != ResponseCache.make_key('https://app.testomat.io', 'key_1', 'test_grep?type=tag&id=slow')
+        assert 'key_1' not in key
+
+    def test_is_fresh(self, tmp_path):
+        """Test entry fresh within TTL"""
+        cache = ResponseCache(str(tmp_path), ttl=60)
+
+        assert cache.is_fresh({'stored_at': time.time() - 10})
+        assert not cache.is_fresh({'stored_at': time.time() - 120})
+        assert not cache.is_fresh({'stored_at': time.time()}, ttl=0)
+
+    def test_evict_least_recently_stored(self, tmp_path):
+        """Test the oldest entries removed when cache exceeds max size"""
+        cache = ResponseCache(str(tmp_path), max_size=10 ** 9)
+        for i in range(3):
+            cache.put(f'key{i}', {'data': 'x' * 100})
+            os.utime(tmp_path / f'key{i}.json', (1000 + i, 1000 + i))
+
+        cache.max_size = os.path.getsize(tmp_path / 'key1.json') + os.path.getsize(tmp_path / 'key2.json')
+        cache.evict()
+
+        assert cache.get('key0') is None
+        assert cache.get('key1') is not None
+        assert cache.get('key2') is not None
+
+    def test_touch_restarts_ttl(self, tmp_path):
+        """Test revalidated entry fresh again and moved to the end of eviction order"""
+        cache = ResponseCache(str(tmp_path), ttl=60)
+        cache.put('key', {'tests': []})
+        os.utime(tmp_path / 'key.json', (1000, 1000))
+        assert not cache.is_fresh(cache.get('key'))
+
+        cache.touch('key')
+
+        assert cache.is_fresh(cache.get('key'))
+        assert cache.get('key')['body'] == {'tests': []}
@@ -0,0 +1,83 @@
+import pytest
+from unittest.mock import patch
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+from requests.exceptions import ConnectionError, ConnectTimeout, ReadTimeout, SSLError, HTTPError
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from pytestomatio.connect.retry import RetryPolicy
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy"""
+
+    @pytest.fixture
+    def policy(self):
+        return RetryPolicy(max_attempts=5, base_delay=2, max_delay=20, deadline=100)
+
+    @pytest.mark.parametrize('attempt, upper_bound', [(0, 2), (1, 4), (2, 8), (3, 16), (4, 20), (10, 20)])
+    def test_backoff_exponential_with_full_jitter(self, policy, attempt, upper_bound):
+        """Test delay randomized between zero and capped exponential delay"""
+        with patch('pytestomatio.connect.retry.random.uniform', side_effect=lambda a, b: b) as mock_uniform:
+            assert policy.backoff(attempt) == upper_bound
+            mock_uniform.assert_called_once_with(0, upper_bound)
+
+    def test_backoff_uses_retry_after(self, policy):
+        """Test Retry-After is used without jitter and not capped by max delay"""
+        assert policy.backoff(0, retry_after=7) == 7
+        assert policy.backoff(0, retry_after=70) == 70
+
+    def test_retry_after_seconds(self, policy):
+        """Test Retry-After header in seconds"""
+        assert policy.retry_after({'Retry-After': '12'}) == 12.0
+
+    def test_retry_after_http_date(self, policy):
+        """Test Retry-After header as HTTP date"""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        delay = policy.retry_after({'Retry-After': format_datetime(retry_at, usegmt=True)})
+
+        assert 28 <= delay <= 30
+
+    @pytest.mark.parametrize('headers', [{}, {'Retry-After': 'soon'}])
+    def test_retry_after_missing_or_invalid(self, policy, headers):
+        """Test missing or invalid Retry-After header ignored"""
+        assert policy.retry_after(headers) is None
+
+    @pytest.mark.parametrize('error, expected', [
+        (ConnectionError(), True),
+        (ReadTimeout(), True),
+        (SSLError(), False),
+        (HTTPError(), False),
+        (ValueError(), False),
+    ])
+    def test_is_retryable_error(self, policy, error, expected):
+        """Test only connection errors and timeouts are retried"""
+        assert policy.is_retryable_error(error) is expected
+
+    @pytest.mark.parametrize('error, expected', [
+        (ConnectTimeout(), True),
+        (ConnectionError(MaxRetryError(None, '/', NewConnectionError(None, 'refused'))), True),
+        (ConnectionError(ProtocolError('Connection aborted')), False),
+        (ConnectionError(), False),
+        (ReadTimeout(), False),
+        (SSLError(), False),
+    ])
+    def test_is_retryable_error_post(self, policy, error, expected):
+        """Test POST retried only if connection was not established"""
+        assert policy.is_retryable_error(error, 'post') is expected
+
+    @pytest.mark.parametrize('method, status_code, expected', [
+        ('put', 502, True), ('get', 408, True), ('post', 502, False), ('post', 408, False),
+        ('post', 429, True), ('POST', 503, True),
+    ])
+    def test_should_retry_by_method(self, policy, method, status_code, expected):
+        """Test non-idempotent requests retried only on responses they were not processed with"""
+        assert policy.should_retry(status_code, method) is expected
+
+    @patch('pytestomatio.connect.retry.time.monotonic', return_value=50)
+    def test_get_deadline(self, mock_monotonic, policy):
+        """Test deadline counted from now"""
+        assert policy.get_deadline() == 150
+        policy.deadline = None
+        assert policy.get_deadline() is None
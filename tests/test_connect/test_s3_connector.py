@@ -1,8 +1,13 @@
+import gzip
+import hashlib
+import threading
+import time
 import pytest
-from unittest.mock import Mock, patch, call
+from unittest.mock import Mock, patch, call, ANY
 from io import BytesIO
+from botocore.exceptions import ClientError
 
-from pytestomatio.connect.s3_connector import S3Connector, parse_endpoint
+from pytestomatio.connect.s3_connector import S3Connector, parse_endpoint, TRANSFER_MAX_CONCURRENCY, MB
 
 
 class TestParseEndpoint:
@@ -69,8 +74,11 @@ class TestS3Connector:
             endpoint_url='https://s3.amazonaws.com',
             aws_access_key_id='test_access_key',
             aws_secret_access_key='test_secret_key',
-            region_name='us-east-1'
+            region_name='us-east-1',
+            config=ANY
         )
+        config = mock_boto_client.call_args[1]['config']
+        assert config.max_pool_connections == s3_connector.upload_concurrency * TRANSFER_MAX_CONCURRENCY
 
         assert s3_connector.client is mock_client
         assert s3_connector._is_logged_in is True
@@ -98,7 +106,8 @@ class TestS3Connector:
                 'ACL': 'public-read',
                 'ContentType': 'text/plain',
                 'ContentDisposition': 'inline'
-            }
+            },
+            Config=s3_connector.transfer_config
         )
 
         expected_url = "https://test-bucket.s3.amazonaws.com/test-prefix/test_key"
@@ -121,7 +130,8 @@ class TestS3Connector:
                 'ACL': 'public-read',
                 'ContentType': 'image/png',
                 'ContentDisposition': 'inline'
-            }
+            },
+            Config=s3_connector.transfer_config
         )
 
     @patch('mimetypes.guess_type')
@@ -218,11 +228,12 @@ class TestS3Connector:
         s3_connector._is_logged_in = True
 
         with patch.object(s3_connector, 'upload_file') as mock_upload:
-            mock_upload.side_effect = [
-                "https://bucket.s3.com/file1.txt",
-                "https://bucket.s3.com/file2.txt",
-                None
-            ]
+            links = {
+                "file1.txt": "https://bucket.s3.com/file1.txt",
+                "file2.txt": "https://bucket.s3.com/file2.txt",
+                "file3.txt": None
+            }
+            mock_upload.side_effect = lambda file_path, key, bucket_name: links[file_path]
 
             file_list = [
                 ("file1.txt", "key1"),
@@ -237,7 +248,7 @@ class TestS3Connector:
                 call(file_path="file2.txt", key="key2", bucket_name="custom-bucket"),
                 call(file_path="file3.txt", key="key3", bucket_name="custom-bucket")
             ]
-            mock_upload.assert_has_calls(expected_calls)
+            mock_upload.assert_has_calls(expected_calls, any_order=True)
 
             assert result == [
                 "https://bucket.s3.com/file1.txt",
@@ -249,6 +260,67 @@ class TestS3Connector:
         result = s3_connector.upload_files([])
         assert result == []
 
+    def test_upload_files_in_parallel_keeps_order(self, s3_connector):
+        """Test files uploaded concurrently and links returned in input order"""
+        s3_connector._is_logged_in = True
+        s3_connector.upload_concurrency = 4
+        in_flight, max_in_flight = [0], [0]
+        lock = threading.Lock()
+
+        def upload(file_path, key, bucket_name):
+            with lock:
+                in_flight[0] += 1
+                max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            # first files finish last
+            time.sleep(0.05 * (4 - int(file_path[4])))
+            with lock:
+                in_flight[0] -= 1
+            return f"https://bucket.s3.com/{file_path}"
+
+        with patch.object(s3_connector, 'upload_file', side_effect=upload):
+            result = s3_connector.upload_files([(f"file{i}.txt", None) for i in range(4)])
+
+        assert result == [f"https://bucket.s3.com/file{i}.txt" for i in range(4)]
+        assert max_in_flight[0] > 1
+
+    def test_upload_files_sequential(self, s3_connector):
+        """Test concurrency 1 uploads files one by one in the calling thread"""
+        s3_connector._is_logged_in = True
+        s3_connector.upload_concurrency = 1
+        threads = []
+
+        def upload(file_path, key, bucket_name):
+            threads.append(threading.current_thread())
+            return file_path
+
+        with patch.object(s3_connector, 'upload_file', side_effect=upload):
+            result = s3_connector.upload_files([("file1.txt", None), ("file2.txt", None)])
+
+        assert result == ["file1.txt", "file2.txt"]
+        assert threads == [threading.current_thread()] * 2
+
+    def test_transfer_config_from_env(self, monkeypatch):
+        """Test upload concurrency and multipart settings read from env"""
+        monkeypatch.setenv('TESTOMATIO_ARTIFACT_UPLOAD_CONCURRENCY', '3')
+        monkeypatch.setenv('TESTOMATIO_ARTIFACT_MULTIPART_THRESHOLD', '16')
+        monkeypatch.setenv('TESTOMATIO_ARTIFACT_MULTIPART_CHUNKSIZE', '32')
+
+        connector = S3Connector(None, None, None, '', None, None)
+
+        assert connector.upload_concurrency == 3
+        assert connector.transfer_config.multipart_threshold == 16 * MB
+        assert connector.transfer_config.multipart_chunksize == 32 * MB
+
+    def test_transfer_config_defaults(self, monkeypatch):
+        """Test invalid env values fall back to defaults"""
+        monkeypatch.setenv('TESTOMATIO_ARTIFACT_UPLOAD_CONCURRENCY', '0')
+        monkeypatch.delenv('TESTOMATIO_ARTIFACT_MULTIPART_THRESHOLD', raising=False)
+
+        connector = S3Connector(None, None, None, '', None, None)
+
+        assert connector.upload_concurrency == 8
+        assert connector.transfer_config.multipart_threshold == 8 * MB
+
     def test_private_acl_configuration(self):
         """Test config with private ACL"""
         connector = S3Connector(
@@ -269,3 +341,171 @@ class TestS3Connector:
 
             call_args = connector.client.upload_file.call_args
             assert call_args[1]['ExtraArgs']['ACL'] == 'private'
+
+
+class TestContentKeys:
+    """Tests for content hash keys of S3Connector"""
+
+    @pytest.fixture
+    def s3_connector(self, monkeypatch):
+        monkeypatch.setenv('TESTOMATIO_ARTIFACT_CONTENT_KEYS', '1')
+        connector = S3Connector("us-east-1", "key", "secret", "https://s3.amazonaws.com", "test-bucket", "prefix")
+        connector._is_logged_in = True
+        connector.client = Mock()
+        connector.client.head_object.side_effect = ClientError({'Error': {'Code': '404'}}, 'HeadObject')
+        return connector
+
+    @pytest.fixture
+    def screenshot(self, tmp_path):
+        def _screenshot(name, data=b'login page'):
+            path = tmp_path / name
+            path.write_bytes(data)
+            return str(path)
+        return _screenshot
+
+    def test_key_is_content_hash(self, s3_connector, screenshot):
+        """Test object key made of content hash and file extension"""
+        digest = hashlib.sha256(b'login page').hexdigest()
+
+        result = s3_connector.upload_file(screenshot('login.png'))
+
+        assert result == f"https://test-bucket.s3.amazonaws.com/prefix/{digest}.png"
+        assert s3_connector.client.upload_file.call_args[0][2] == f"prefix/{digest}.png"
+        assert s3_connector.client.upload_file.call_args[1]['ExtraArgs']['ContentType'] == 'image/png'
+
+    def test_identical_files_uploaded_once(self, s3_connector, screenshot):
+        """Test identical files share the link and are uploaded once per run"""
+        first = s3_connector.upload_file(screenshot('chrome.png'))
+        second = s3_connector.upload_file(screenshot('firefox.png'))
+
+        assert first == second
+        assert s3_connector.client.upload_file.call_count == 1
+        assert s3_connector.skipped_uploads == 1
+
+    def test_files_with_same_name_not_overwritten(self, s3_connector, tmp_path):
+        """Test different files with the same name get different keys"""
+        for directory, data in [('a', b'first'), ('b', b'second')]:
+            (tmp_path / directory).mkdir()
+            (tmp_path / directory / 'page.png').write_bytes(data)
+
+        first = s3_connector.upload_file(str(tmp_path / 'a' / 'page.png'))
+        second = s3_connector.upload_file(str(tmp_path / 'b' / 'page.png'))
+
+        assert first != second
+        assert s3_connector.client.upload_file.call_count == 2
+
+    def test_existing_object_not_uploaded(self, s3_connector, screenshot):
+        """Test upload skipped when object already exists in bucket"""
+        s3_connector.client.head_object.side_effect = None
+
+        result = s3_connector.upload_file(screenshot('login.png'))
+
+        assert result is not None
+        assert not s3_connector.client.upload_file.called
+
+    def test_failed_upload_retried_next_time(self, s3_connector, screenshot):
+        """Test key released when upload fails"""
+        s3_connector.client.upload_file.side_effect = [Exception('Upload failed'), None]
+
+        assert s3_connector.upload_file(screenshot('login.png')) is None
+        assert s3_connector.upload_file(screenshot('login.png')) is not None
+        assert s3_connector.client.upload_file.call_count == 2
+
+    def test_file_object_deduplicated(self, s3_connector):
+        """Test identical bytes uploaded once"""
+        first = s3_connector.upload_file_object(b'har', 'baseline.har')
+        second = s3_connector.upload_file_object(b'har', 'other.har')
+
+        assert first == second
+        assert first.endswith(f"prefix/{hashlib.sha256(b'har').hexdigest()}.har")
+        assert s3_connector.client.upload_fileobj.call_count == 1
+
+
+class TestUploadStream:
+    """Tests for streaming upload_file_object"""
+
+    @pytest.fixture
+    def s3_connector(self):
+        connector = S3Connector("us-east-1", "key", "secret", "https://s3.amazonaws.com", "test-bucket", "prefix")
+        connector._is_logged_in = True
+        connector.client = Mock()
+        # read uploaded stream by parts, as boto3 does
+        connector.uploaded = []
+        connector.client.upload_fileobj.side_effect = \
+            lambda file, *args, **kwargs: connector.uploaded.append(b''.join(iter(lambda: file.read(1024), b'')))
+        return connector
+
+    def test_iterator_of_chunks(self, s3_connector):
+        """Test iterator of chunks uploaded as one object"""
+        result = s3_connector.upload_file_object((b'chunk' for _ in range(3)), 'video.webm')
+
+        assert result == "https://test-bucket.s3.amazonaws.com/prefix/video.webm"
+        assert s3_connector.uploaded == [b'chunkchunkchunk']
+
+    def test_file_object(self, s3_connector, tmp_path):
+        """Test opened file streamed without reading it into memory"""
+        path = tmp_path / 'trace.zip'
+        path.write_bytes(b'zip' * 1000)
+
+        with open(path, 'rb') as file:
+            s3_connector.upload_file_object(file, 'trace.zip')
+
+        assert s3_connector.uploaded == [b'zip' * 1000]
+
+    def test_text_artifact_compressed(self, s3_connector):
+        """Test text artifact gzipped with content encoding"""
+        s3_connector.compression = 'gzip'
+        data = b'{"entries": []}' * 100
+
+        s3_connector.upload_file_object(data, 'network.har')
+
+        assert gzip.decompress(s3_connector.uploaded[0]) == data
+        assert s3_connector.client.upload_fileobj.call_args[1]['ExtraArgs']['ContentEncoding'] == 'gzip'
+
+    def test_binary_artifact_not_compressed(self, s3_connector):
+        """Test images not compressed"""
+        s3_connector.compression = 'gzip'
+
+        s3_connector.upload_file_object(b'png', 'screen.png')
+
+        assert s3_connector.uploaded == [b'png']
+        assert 'ContentEncoding' not in s3_connector.client.upload_fileobj.call_args[1]['ExtraArgs']
+
+    def test_stream_over_max_size(self, s3_connector):
+        """Test stream larger than max size not uploaded"""
+        s3_connector.max_artifact_size = 10
+
+        result = s3_connector.upload_file_object(iter([b'x' * 8, b'x' * 8]), 'video.webm')
+
+        assert result is None
+
+    def test_file_over_max_size(self, s3_connector, tmp_path):
+        """Test file larger than max size not uploaded"""
+        s3_connector.max_artifact_size = 10
+        path = tmp_path / 'video.webm'
+        path.write_bytes(b'x' * 11)
+
+        assert s3_connector.upload_file(str(path)) is None
+        assert not s3_connector.client.upload_file.called
+
+    def test_stream_with_content_keys(self, s3_connector):
+        """Test stream hashed before upload when content keys are enabled"""
+        s3_connector.content_keys = True
+        s3_connector.client.head_object.side_effect = ClientError({'Error': {'Code': '404'}}, 'HeadObject')
+
+        first = s3_connector.upload_file_object(iter([b'har', b'data']), 'a.har')
+        second = s3_connector.upload_file_object(b'hardata', 'b.har')
+
+        assert first == second
+        assert first.endswith(f"prefix/{hashlib.sha256(b'hardata').hexdigest()}.har")
+        assert s3_connector.uploaded == [b'hardata']
+
+    def test_settings_from_env(self, monkeypatch):
+        """Test max size and compression read from env"""
+        monkeypatch.setenv('TESTOMATIO_ARTIFACT_MAX_SIZE', '100')
+        monkeypatch.setenv('TESTOMATIO_ARTIFACT_COMPRESSION', 'GZIP')
+
+        connector = S3Connector(None, None, None, '', None, None)
+
+        assert connector.max_artifact_size == 100 * MB
+        assert connector.compression == 'gzip'
@@ -0,0 +1,80 @@
+import gzip
+import json
+import pytest
+from unittest.mock import patch
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from pytestomatio.connect.transport import TestomatioAdapter
+
+
+class TestTestomatioAdapter:
+    """Tests for TestomatioAdapter"""
+
+    @pytest.fixture
+    def prepare(self):
+        def _prepare(url, payload):
+            return requests.Request('post', url, json=payload).prepare()
+        return _prepare
+
+    @patch.object(HTTPAdapter, 'send')
+    def test_default_timeout_applied(self, mock_send, prepare):
+        """Test adapter timeout is used when request has no timeout"""
+        adapter = TestomatioAdapter(timeout=(3, 30))
+
+        adapter.send(prepare('https://app.testomat.io/api/reporter', {}), timeout=None)
+
+        assert mock_send.call_args[1]['timeout'] == (3, 30)
+
+    @patch.object(HTTPAdapter, 'send')
+    def test_request_timeout_not_overridden(self, mock_send, prepare):
+        """Test explicit request timeout has precedence"""
+        adapter = TestomatioAdapter(timeout=(3, 30))
+
+        adapter.send(prepare('https://app.testomat.io/api/reporter', {}), timeout=5)
+
+        assert mock_send.call_args[1]['timeout'] == 5
+
+    @pytest.mark.parametrize('url', ['https://app.testomat.io/api/load?api_key=key',
+                                     'https://app.testomat.io/api/reporter/run_1/testrun?api_key=key'])
+    @patch.object(HTTPAdapter, 'send')
+    def test_large_payload_compressed(self, mock_send, url, prepare):
+        """Test large bodies of import and report requests are compressed"""
+        payload = {'tests': [{'code': 'def test_login(): pass'} for _ in range(100)]}
+        adapter = TestomatioAdapter(compress=True)
+
+        adapter.send(prepare(url, payload))
+
+        request = mock_send.call_args[0][0]
+        assert request.headers['Content-Encoding'] == 'gzip'
+        assert request.headers['Content-Length'] == str(len(request.body))
+        assert json.loads(gzip.decompress(request.body)) == payload
+        stats = adapter.stats()
+        assert stats['bytes_after_compression'] < stats['bytes_before_compression']
+
+    @pytest.mark.parametrize('url, compress, size', [
+        ('https://app.testomat.io/api/reporter', True, 100),
+        ('https://app.testomat.io/api/load', True, 1),
+        ('https://app.testomat.io/api/load', False, 100),
+    ])
+    @patch.object(HTTPAdapter, 'send')
+    def test_payload_not_compressed(self, mock_send, url, compress, size, prepare):
+        """Test other endpoints, small bodies and disabled compression are sent as is"""
+        adapter = TestomatioAdapter(compress=compress)
+
+        adapter.send(prepare(url, {'tests': ['test name'] * size}))
+
+        request = mock_send.call_args[0][0]
+        assert 'Content-Encoding' not in request.headers
+
+    @patch.object(HTTPAdapter, 'send')
+    def test_stats_counts_requests(self, mock_send, prepare):
+        """Test stats without opened connections"""
+        adapter = TestomatioAdapter()
+
+        adapter.send(prepare('https://app.testomat.io/api/reporter', {}))
+        adapter.send(prepare('https://app.testomat.io/api/reporter', {}))
+
+        assert adapter.stats()['requests'] == 2
+        assert adapter.stats()['connections'] == 0
@@ -1,7 +1,8 @@
 import os
 from unittest.mock import patch
 
-from pytestomatio.decor.decorator_updater import update_tests
+from pytestomatio.decor.decorator_updater import update_tests, update_files
+from pytestomatio.decor.default import update_tests as update_tests_default
 
 
 class TestUpdateTests:
@@ -65,3 +66,59 @@ class TestUpdateTests:
 
             assert mock_default.call_count == 1
             mock_pep8.assert_not_called()
+
+
+class TestUpdateFiles:
+    """Tests for update_files"""
+
+    def write_tests(self, path, names, decorated=()):
+        lines = ['import pytest', '']
+        for name in names:
+            if name in decorated:
+                lines.append(f'@pytest.mark.testomatio("@T{name}")')
+            lines += [f'def {name}():', '    pass', '']
+        path.write_text('\n'.join(lines))
+        return str(path)
+
+    def test_only_files_with_changes_written(self, tmp_path):
+        """Test decorators added by mapping of the own file, files without changes are not written"""
+        first = self.write_tests(tmp_path / 'test_first.py', ['test_one', 'test_two'])
+        second = self.write_tests(tmp_path / 'test_second.py', ['test_one'], decorated=['test_one'])
+        third = self.write_tests(tmp_path / 'test_third.py', ['test_three'])
+        mapping = [('test_one', '@T1', 'test_first.py'), ('test_two', None, 'test_first.py'),
+                   ('test_one', '@Ttest_one', 'test_second.py'), ('test_three', None, 'test_third.py')]
+
+        with patch.dict(os.environ, {'TESTOMATIO_SYNC_WORKERS': '1'}), \
+                patch('pytestomatio.decor.decorator_updater.update_tests_default',
+                      wraps=update_tests_default) as mock_default:
+            stats = update_files([first, second, third], mapping, ['test_one', 'test_two', 'test_three'],
+                                 'testomatio')
+
+        assert stats == {'files': 3, 'skipped': 1, 'updated': 1}
+        assert [c[0][0] for c in mock_default.call_args_list] == [first, second]
+        assert '@pytest.mark.testomatio("@T1")\ndef test_one' in (tmp_path / 'test_first.py').read_text()
+        assert 'testomatio' not in (tmp_path / 'test_first.py').read_text().split('def test_two')[1]
+
+    def test_remove_skips_files_without_decorator(self, tmp_path):
+        """Test only files with decorators are rewritten on remove"""
+        first = self.write_tests(tmp_path / 'test_first.py', ['test_one'], decorated=['test_one'])
+        second = self.write_tests(tmp_path / 'test_second.py', ['test_two'])
+
+        with patch.dict(os.environ, {'TESTOMATIO_SYNC_WORKERS': '1'}):
+            stats = update_files([first, second], [], [], 'testomatio', remove=True)
+
+        assert stats == {'files': 2, 'skipped': 0, 'updated': 1}
+        assert 'testomatio' not in (tmp_path / 'test_first.py').read_text()
+
+    def test_files_updated_in_process_pool(self, tmp_path):
+        """Test files processed by process pool give the same result"""
+        files = [self.write_tests(tmp_path / f'test_{i}.py', ['test_one']) for i in range(4)]
+        mapping = [('test_one', f'@T{i}', f'test_{i}.py') for i in range(4)]
+
+        with patch.dict(os.environ, {'TESTOMATIO_SYNC_WORKERS': '2'}), \
+                patch('pytestomatio.decor.decorator_updater.PARALLEL_MIN_FILES', 2):
+            stats = update_files(files, mapping, ['test_one'], 'testomatio')
+
+        assert stats['updated'] == 4
+        for i in range(4):
+            assert f'@pytest.mark.testomatio("@T{i}")' in (tmp_path / f'test_{i}.py').read_text()
@@ -195,6 +195,16 @@ def test_subtraction():
         assert "def test_addition():" in result
         assert "def test_subtraction():" in result
 
+    def test_update_tests_file_not_rewritten_without_changes(self, temp_test_file):
+        """Test file is not reformatted when there are no decorators to add"""
+        with open(temp_test_file, 'r') as f:
+            content = f.read()
+
+        assert update_tests(temp_test_file, [], ["test_addition"], "testomatio", remove=False) is False
+
+        with open(temp_test_file, 'r') as f:
+            assert f.read() == content
+
     def test_update_tests_applies_pep8_formatting(self, temp_test_file):
         """Test PEP8 formatting applied"""
         badly_formatted = '''
@@ -2,10 +2,17 @@ from pathlib import Path
 
 import pytest
 import os
+import json
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 
 from unittest.mock import Mock, patch, call, mock_open
 
 from pytestomatio import main
+from pytestomatio.testing.testItem import test_item_key
+from pytestomatio.testomatio.result_record import ResultRecord
+from pytestomatio.connect.exception import ReportFailedException
 
 testomatio = 'testomatio'
 testomatio_url = 'https://app.testomat.io'
@@ -165,6 +172,8 @@ class TestPytestConfigure:
         mock_testomatio.return_value = mock_testomatio_instance
         mock_testomatio_instance.test_run_config.test_run_id = None
         mock_testomatio_instance.test_run_config.to_dict.return_value = {'title': 'Test Run'}
+        mock_testomatio_instance.test_run_config.async_report = False
+        mock_testomatio_instance.test_run_config.result_journal = False
 
         mock_connector_instance = Mock()
         mock_connector.return_value = mock_connector_instance
@@ -175,6 +184,29 @@ class TestPytestConfigure:
         mock_connector_instance.create_test_run.assert_called_once_with(title='Test Run')
         mock_testomatio_instance.test_run_config.save_run_id.assert_called_once_with('run_12345')
 
+    @patch('pytestomatio.main.ResultJournal')
+    @patch('pytestomatio.main.validations.validate_option')
+    @patch('pytestomatio.main.Testomatio')
+    @patch('pytestomatio.main.Connector')
+    @patch.dict(os.environ, {'TESTOMATIO': testomatio_api_key})
+    def test_configure_report_mode_creates_journal(self, mock_connector, mock_testomatio, mock_validate,
+                                                   mock_journal, mock_config):
+        """Test result journal of the run created when enabled"""
+        mock_validate.return_value = 'report'
+        mock_config.getoption.side_effect = lambda x: 'report' if x == 'testomatio' else None
+
+        mock_testomatio_instance = Mock()
+        mock_testomatio.return_value = mock_testomatio_instance
+        mock_testomatio_instance.test_run_config.test_run_id = 'run_12345'
+        mock_testomatio_instance.test_run_config.async_report = False
+        mock_testomatio_instance.test_run_config.result_journal = True
+        mock_testomatio_instance.test_run_config.journal_dir = '/tmp/journal'
+
+        main.pytest_configure(mock_config)
+
+        mock_journal.for_run.assert_called_once_with('/tmp/journal', 'run_12345')
+        assert mock_testomatio_instance.journal is mock_journal.for_run.return_value
+
     @patch('pytestomatio.main.pytest.exit')
     @patch('pytestomatio.main.validations.validate_option')
     @patch('pytestomatio.main.Testomatio')
@@ -191,6 +223,8 @@ class TestPytestConfigure:
         mock_testomatio.return_value = mock_testomatio_instance
         mock_testomatio_instance.test_run_config.test_run_id = None
         mock_testomatio_instance.test_run_config.to_dict.return_value = {'title': 'Test Run'}
+        mock_testomatio_instance.test_run_config.async_report = False
+        mock_testomatio_instance.test_run_config.result_journal = False
 
         mock_connector_instance = Mock()
         mock_connector.return_value = mock_connector_instance
@@ -226,6 +260,61 @@ class TestPytestConfigure:
         mock_connector_instance.finish_test_run.assert_called_once_with('123', True)
         mock_exit.assert_called_once_with('Finish command executed. Exiting without test execution...')
 
+    @patch('pytestomatio.main.pytest.exit', side_effect=SystemExit)
+    @patch('pytestomatio.main.ResultJournal')
+    @patch('pytestomatio.main.validations.validate_option')
+    @patch('pytestomatio.main.Testomatio')
+    @patch('pytestomatio.main.Connector')
+    @patch.dict(os.environ, {'TESTOMATIO': testomatio_api_key})
+    def test_configure_resend_option_uploads_journals_and_finishes_run(self, mock_connector, mock_testomatio,
+                                                                       mock_validate, mock_journal, mock_exit,
+                                                                       mock_config):
+        """Test kept journals of the run uploaded and run finished"""
+        mock_validate.return_value = 'resend'
+        mock_testomatio_instance = Mock()
+        mock_testomatio.return_value = mock_testomatio_instance
+        run = mock_testomatio_instance.test_run_config
+        run.test_run_id = '123'
+        run.journal_dir = '/tmp/journal'
+        run.batch_size = 50
+        run.proceed = False
+        journals = [Mock(), Mock()]
+        for journal in journals:
+            journal.upload.return_value = True
+        mock_journal.find.return_value = journals
+
+        with pytest.raises(SystemExit):
+            main.pytest_configure(mock_config)
+
+        mock_journal.find.assert_called_once_with('/tmp/journal', '123')
+        for journal in journals:
+            journal.upload.assert_called_once_with(mock_testomatio_instance.connector, '123', 50)
+        mock_testomatio_instance.connector.finish_test_run.assert_called_once_with('123', True)
+        mock_exit.assert_called_once_with('Resend command executed. Exiting without test execution...')
+
+    @patch('pytestomatio.main.pytest.exit', side_effect=SystemExit)
+    @patch('pytestomatio.main.ResultJournal')
+    @patch('pytestomatio.main.validations.validate_option')
+    @patch('pytestomatio.main.Testomatio')
+    @patch('pytestomatio.main.Connector')
+    @patch.dict(os.environ, {'TESTOMATIO': testomatio_api_key})
+    def test_configure_resend_option_keeps_run_open_on_failure(self, mock_connector, mock_testomatio,
+                                                               mock_validate, mock_journal, mock_exit, mock_config):
+        """Test run not finished when some batches were not uploaded"""
+        mock_validate.return_value = 'resend'
+        mock_testomatio_instance = Mock()
+        mock_testomatio.return_value = mock_testomatio_instance
+        mock_testomatio_instance.test_run_config.test_run_id = '123'
+        journal = Mock()
+        journal.upload.return_value = False
+        mock_journal.find.return_value = [journal]
+
+        with pytest.raises(SystemExit):
+            main.pytest_configure(mock_config)
+
+        mock_testomatio_instance.connector.finish_test_run.assert_not_called()
+        assert mock_exit.call_args[1] == {'returncode': 1}
+
 
 class TestPytestCollectionModifyItems:
     """Tests for pytest_collection_modifyitems hook"""
@@ -280,6 +369,59 @@ class TestPytestCollectionModifyItems:
             assert mock_add_enrich.call_count == 1
             mock_exit.assert_called_once_with('Sync completed without test execution')
 
+    @patch('pytestomatio.main.pytest.exit', side_effect=SystemExit)
+    def test_incremental_sync_without_changes(self, mock_exit, mock_session, mock_config, multiple_test_items,
+                                              tmp_path):
+        """Test nothing is sent when test files did not change since the last sync"""
+        options = {'testomatio': 'sync', 'incremental': True}
+        mock_config.getoption.side_effect = lambda x: options.get(x)
+        mock_config.getini.return_value = None
+        mock_config.rootpath = tmp_path
+        items = multiple_test_items.copy()
+
+        pytest.testomatio = Mock()
+        manifest = Mock()
+        manifest.files = {'test_file.py': {}}
+        manifest.changed_items.return_value = []
+        manifest.removed_tests.return_value = []
+
+        with patch('pytestomatio.main.SyncManifest') as mock_manifest, pytest.raises(SystemExit):
+            mock_manifest.load.return_value = manifest
+            main.pytest_collection_modifyitems(mock_session, mock_config, items)
+
+        assert mock_manifest.load.call_args[0][0] == str(tmp_path / '.testomatio_sync.json')
+        manifest.changed_items.assert_called_once_with(items)
+        pytest.testomatio.connector.load_tests.assert_not_called()
+        manifest.save.assert_called_once()
+        mock_exit.assert_called_once_with('No changes since the last sync')
+
+    @patch('pytestomatio.main.pytest.exit')
+    def test_incremental_sync_sends_changed_tests_without_detach(self, mock_exit, mock_session, mock_config,
+                                                                 multiple_test_items, tmp_path):
+        """Test only tests of changed files are sent and other tests are not detached"""
+        options = {'testomatio': 'sync', 'incremental': True}
+        mock_config.getoption.side_effect = lambda x: options.get(x)
+        mock_config.getini.return_value = None
+        mock_config.rootpath = tmp_path
+        items = multiple_test_items.copy()
+
+        pytest.testomatio = Mock()
+        manifest = Mock()
+        manifest.files = {'test_file.py': {}}
+        manifest.changed_items.return_value = items[:1]
+        manifest.removed_tests.return_value = []
+
+        with patch('pytestomatio.main.SyncManifest') as mock_manifest, \
+                patch('pytestomatio.main.add_and_enrich_tests'):
+            mock_manifest.load.return_value = manifest
+            main.pytest_collection_modifyitems(mock_session, mock_config, items)
+
+        passed_meta = pytest.testomatio.connector.load_tests.call_args[0][0]
+        assert [test.title for test in passed_meta] == [items[0].name]
+        assert pytest.testomatio.connector.load_tests.call_args[1]['no_detach'] is True
+        manifest.update.assert_called_once()
+        manifest.save.assert_called_once()
+
     @patch('pytestomatio.main.pytest.exit')
     def test_bdd_tests_excluded_from_sync(self, mock_exit, mock_session, mock_config, multiple_test_items):
         """Test sync mode"""
@@ -314,9 +456,9 @@ class TestPytestCollectionModifyItems:
             assert mock_add_enrich.call_count == 1
             mock_exit.assert_called_once_with('Sync completed without test execution')
 
-    @patch('pytestomatio.main.update_tests')
+    @patch('pytestomatio.main.update_files')
     @patch('pytestomatio.main.pytest.exit')
-    def test_remove_mode(self, mock_exit, mock_update_tests, mock_session, mock_config, single_test_item,
+    def test_remove_mode(self, mock_exit, mock_update_files, mock_session, mock_config, single_test_item,
                          multiple_test_items):
         """Test remove mode"""
         mock_config.getoption.side_effect = lambda x: 'remove' if x == 'testomatio' else None
@@ -325,7 +467,9 @@ class TestPytestCollectionModifyItems:
 
         main.pytest_collection_modifyitems(mock_session, mock_config, items)
 
-        assert mock_update_tests.call_count == 2
+        mock_update_files.assert_called_once()
+        assert len(mock_update_files.call_args[0][0]) == 2
+        assert mock_update_files.call_args[1] == {'remove': True}
         mock_exit.assert_called_once_with('Sync completed without test execution')
 
     @patch('pytestomatio.main.read_env_s3_keys')
@@ -340,6 +484,7 @@ class TestPytestCollectionModifyItems:
         pytest.testomatio.test_run_config = Mock()
         pytest.testomatio.test_run_config.get_run_id.return_value = run_id
         pytest.testomatio.test_run_config.to_dict.return_value = {'id': run_id}
+        pytest.testomatio.test_run_config.stream_report = False
         pytest.testomatio.connector = Mock()
         pytest.testomatio.connector.update_test_run.return_value = {'rid': 1234}
 
@@ -367,6 +512,8 @@ class TestPytestCollectionModifyItems:
         pytest.testomatio.test_run_config = Mock()
         pytest.testomatio.test_run_config.get_run_id.return_value = run_id
         pytest.testomatio.test_run_config.to_dict.return_value = {'id': run_id}
+        pytest.testomatio.test_run_config.stream_report = False
+        pytest.testomatio.test_run_config.defer_artifacts = False
         pytest.testomatio.connector = Mock()
         pytest.testomatio.connector.update_test_run.return_value = {'rid': 1234}
 
@@ -383,6 +530,29 @@ class TestPytestCollectionModifyItems:
             mock_s3_connector.assert_called_once_with('region', 'access_key', 'secret_key', 'endpoint', 'bucket', 'path')
             assert pytest.testomatio.s3_connector.login.call_count == 1
 
+    @patch('pytestomatio.main.ArtifactUploader')
+    @patch('pytestomatio.main.read_env_s3_keys')
+    def test_report_mode_with_deferred_artifacts(self, mock_read_s3, mock_uploader, mock_session, mock_config,
+                                                 multiple_test_items):
+        """Test artifact uploader created when deferred artifacts upload enabled"""
+        mock_config.getoption.side_effect = lambda x: 'report' if x == 'testomatio' else None
+        mock_read_s3.return_value = ('region', 'access_key', 'secret_key', 'endpoint', 'bucket', 'path')
+
+        pytest.testomatio = Mock()
+        pytest.testomatio.test_run_config = Mock()
+        pytest.testomatio.test_run_config.get_run_id.return_value = 'E534ere'
+        pytest.testomatio.test_run_config.to_dict.return_value = {'id': 'E534ere'}
+        pytest.testomatio.test_run_config.defer_artifacts = True
+        pytest.testomatio.test_run_config.stream_report = False
+        pytest.testomatio.connector = Mock()
+        pytest.testomatio.connector.update_test_run.return_value = {'rid': 1234}
+
+        with patch('pytestomatio.main.S3Connector'):
+            main.pytest_collection_modifyitems(mock_session, mock_config, multiple_test_items.copy())
+
+        mock_uploader.assert_called_once_with(pytest.testomatio.s3_connector)
+        assert pytest.testomatio.artifact_uploader is mock_uploader.return_value
+
     @patch('builtins.open', new_callable=mock_open)
     @patch('pytestomatio.main.json.dumps')
     @patch('pytestomatio.main.pytest.exit')
@@ -512,6 +682,8 @@ class TestPytestRuntestMakereport:
         pytest.testomatio.test_run_config.exclude_skipped = False
         pytest.testomatio.test_run_config.create_tests = None
         pytest.testomatio.test_run_config.status_request = {}
+        pytest.testomatio.reporter = None
+        pytest.testomatio.journal = None
 
         main.pytest_runtest_makereport(item, mock_call)
 
@@ -568,6 +740,8 @@ class TestPytestRuntestMakereport:
         pytest.testomatio.test_run_config.exclude_skipped = True
         pytest.testomatio.test_run_config.create_tests = None
         pytest.testomatio.test_run_config.status_request = {}
+        pytest.testomatio.reporter = None
+        pytest.testomatio.journal = None
 
         main.pytest_runtest_makereport(item, mock_call)
 
@@ -805,6 +979,9 @@ class TestPytestRuntestMakereport:
         """Test code and overwrite fields in request not updated for bdd test if update_code option disabled"""
         item = single_test_item.copy()[0]
         item.function.__scenario__ = True
+        # collected item is shared between tests, drop TestItem cached before it became bdd
+        if test_item_key in item.stash:
+            del item.stash[test_item_key]
         item.config.option.testomatio = 'report'
 
         mock_call.duration = 1.5
@@ -842,6 +1019,9 @@ class TestPytestRuntestMakereport:
         """Test code and overwrite fields in request not updated for bdd test if update_code option enabled"""
         item = single_test_item.copy()[0]
         item.function.__scenario__ = True
+        # collected item is shared between tests, drop TestItem cached before it became bdd
+        if test_item_key in item.stash:
+            del item.stash[test_item_key]
         item.config.option.testomatio = 'report'
 
         mock_call.duration = 1.5
@@ -1078,6 +1258,9 @@ class TestPytestRuntestMakereport:
         pytest.testomatio.test_run_config.create_tests = None
         pytest.testomatio.test_run_config.disable_artifacts = False
         pytest.testomatio.test_run_config.status_request = {}
+        pytest.testomatio.reporter = None
+        pytest.testomatio.journal = None
+        pytest.testomatio.artifact_uploader = None
         pytest.testomatio.s3_connector = Mock()
 
         urls = ['url1', 'url2']
@@ -1094,6 +1277,37 @@ class TestPytestRuntestMakereport:
         assert 'artifacts' in request.keys()
         assert request['artifacts'] == urls
 
+    @patch('pytestomatio.main.artifact_storage')
+    def test_artifacts_deferred(self, artifact_storage, mock_call, single_test_item):
+        """Test artifacts scheduled on deferred uploader and links attached at once"""
+        item = single_test_item.copy()[0]
+        item.config.option.testomatio = 'report'
+
+        mock_call.duration = 1.5
+        mock_call.when = 'teardown'
+        mock_call.excinfo = None
+
+        pytest.testomatio = Mock()
+        pytest.testomatio.test_run_config = Mock()
+        pytest.testomatio.test_run_config.test_run_id = 'run_123'
+        pytest.testomatio.test_run_config.meta = None
+        pytest.testomatio.test_run_config.create_tests = None
+        pytest.testomatio.test_run_config.disable_artifacts = False
+        pytest.testomatio.test_run_config.status_request = {}
+        pytest.testomatio.reporter = None
+        pytest.testomatio.journal = None
+        pytest.testomatio.s3_connector = Mock()
+        pytest.testomatio.artifact_uploader = Mock()
+        pytest.testomatio.artifact_uploader.submit.return_value = ['url1']
+
+        artifact_storage.get.return_value = ['path/1']
+        main.pytest_runtest_makereport(item, mock_call)
+
+        request = pytest.testomatio.test_run_config.status_request[item.nodeid]
+        pytest.testomatio.artifact_uploader.submit.assert_called_once_with([('path/1', None)])
+        assert not pytest.testomatio.s3_connector.upload_files.called
+        assert request['artifacts'] == ['url1']
+
     @patch('pytestomatio.main.artifact_storage')
     def test_artifacts_not_attached_to_test_if_upload_disabled(self, artifact_storage, mock_call, single_test_item):
         """Test artifacts not attached to test if artifacts uploading is disabled"""
@@ -1111,6 +1325,8 @@ class TestPytestRuntestMakereport:
         pytest.testomatio.test_run_config.create_tests = None
         pytest.testomatio.test_run_config.disable_artifacts = True
         pytest.testomatio.test_run_config.status_request = {}
+        pytest.testomatio.reporter = None
+        pytest.testomatio.journal = None
         pytest.testomatio.s3_connector = Mock()
 
         urls = ['url1', 'url2']
@@ -1144,6 +1360,8 @@ class TestPytestRuntestMakereport:
         pytest.testomatio.test_run_config.create_tests = None
         pytest.testomatio.test_run_config.disable_artifacts = True
         pytest.testomatio.test_run_config.status_request = {}
+        pytest.testomatio.reporter = None
+        pytest.testomatio.journal = None
         pytest.testomatio.s3_connector = None
 
         artifacts = ['path/1', 'path/2']
@@ -1157,6 +1375,212 @@ class TestPytestRuntestMakereport:
         assert not request['artifacts']
 
 
+    def test_finished_test_passed_to_streaming_reporter(self, mock_call, single_test_item):
+        """Test result is moved to streaming reporter in the teardown phase"""
+        item = single_test_item.copy()[0]
+        item.config.option.testomatio = 'report'
+
+        mock_call.duration = 1.5
+        mock_call.when = 'call'
+        mock_call.excinfo = None
+
+        pytest.testomatio = Mock()
+        pytest.testomatio.test_run_config = Mock()
+        pytest.testomatio.test_run_config.test_run_id = 'run_123'
+        pytest.testomatio.test_run_config.meta = None
+        pytest.testomatio.test_run_config.create_tests = None
+        pytest.testomatio.test_run_config.exclude_skipped = False
+        pytest.testomatio.test_run_config.disable_artifacts = True
+        pytest.testomatio.test_run_config.status_request = {}
+        pytest.testomatio.reporter = Mock(error=None)
+
+        main.pytest_runtest_makereport(item, mock_call)
+        pytest.testomatio.reporter.put.assert_not_called()
+
+        mock_call.when = 'teardown'
+        main.pytest_runtest_makereport(item, mock_call)
+
+        assert item.nodeid not in pytest.testomatio.test_run_config.status_request
+        request = pytest.testomatio.reporter.put.call_args[0][0]
+        assert request['status'] == 'passed'
+        assert request['title'] == 'Addition'
+
+    @patch('pytest.exit', side_effect=SystemExit)
+    def test_run_aborted_when_streaming_report_failed(self, mock_exit, mock_call, single_test_item):
+        """Test run aborted like in batch mode when testomat.io rejected a streamed batch"""
+        item = single_test_item.copy()[0]
+        item.config.option.testomatio = 'report'
+
+        mock_call.duration = 1.5
+        mock_call.when = 'teardown'
+        mock_call.excinfo = None
+
+        pytest.testomatio = Mock()
+        pytest.testomatio.test_run_config = Mock()
+        pytest.testomatio.test_run_config.test_run_id = 'run_123'
+        pytest.testomatio.test_run_config.meta = None
+        pytest.testomatio.test_run_config.create_tests = None
+        pytest.testomatio.test_run_config.exclude_skipped = False
+        pytest.testomatio.test_run_config.disable_artifacts = True
+        pytest.testomatio.test_run_config.status_request = {}
+        pytest.testomatio.reporter = Mock(error=ReportFailedException())
+
+        with pytest.raises(SystemExit):
+            main.pytest_runtest_makereport(item, mock_call)
+
+        mock_exit.assert_called_once_with("Aborting test run")
+        pytest.testomatio.reporter.put.assert_not_called()
+
+    def test_finished_test_written_to_journal(self, mock_call, single_test_item):
+        """Test result is moved from memory to the journal in the teardown phase"""
+        item = single_test_item.copy()[0]
+        item.config.option.testomatio = 'report'
+
+        mock_call.duration = 1.5
+        mock_call.when = 'call'
+        mock_call.excinfo = None
+
+        pytest.testomatio = Mock()
+        pytest.testomatio.test_run_config = Mock()
+        pytest.testomatio.test_run_config.test_run_id = 'run_123'
+        pytest.testomatio.test_run_config.meta = None
+        pytest.testomatio.test_run_config.create_tests = None
+        pytest.testomatio.test_run_config.exclude_skipped = False
+        pytest.testomatio.test_run_config.disable_artifacts = True
+        pytest.testomatio.test_run_config.status_request = {}
+        pytest.testomatio.reporter = None
+        pytest.testomatio.journal = Mock()
+
+        main.pytest_runtest_makereport(item, mock_call)
+        pytest.testomatio.journal.append.assert_not_called()
+
+        mock_call.when = 'teardown'
+        main.pytest_runtest_makereport(item, mock_call)
+
+        assert item.nodeid not in pytest.testomatio.test_run_config.status_request
+        result = pytest.testomatio.journal.append.call_args[0][0]
+        assert isinstance(result, dict)
+        assert result['status'] == 'passed'
+        assert 'code' not in result
+
+
+class TestPytestSessionfinish:
+    """Tests for pytest_sessionfinish hook"""
+
+    def teardown_method(self):
+        """Clear pytest namespace after test"""
+        if hasattr(pytest, 'testomatio'):
+            delattr(pytest, 'testomatio')
+
+    @pytest.fixture
+    def worker_session(self):
+        session = Mock()
+        session.config.getoption.side_effect = lambda x: 'report' if x == 'testomatio' else None
+        session.config.workerinput = {'workerid': 'gw1'}
+        session.config.workeroutput = {}
+        return session
+
+    def set_run(self, worker_upload: bool):
+        pytest.testomatio = Mock()
+        pytest.testomatio.artifact_uploader = None
+        pytest.testomatio.reporter = None
+        pytest.testomatio.journal = None
+        pytest.testomatio.async_connector = None
+        run = pytest.testomatio.test_run_config
+        run.disable_batch = False
+        run.worker_upload = worker_upload
+        run.test_run_id = 'run_123'
+        run.batch_size = 50
+        run.batch_start_index = 2
+        run.batch_index_step = 4
+        run.status_request = {'test.py::test_one': ResultRecord(status='passed', title='One')}
+        return run
+
+    def test_worker_passes_results_to_main_process(self, worker_session):
+        """Test xdist worker writes results to worker output"""
+        self.set_run(worker_upload=False)
+
+        main.pytest_sessionfinish(worker_session, 0)
+
+        assert worker_session.config.workeroutput['testrun_results'] == {
+            'test.py::test_one': {'status': 'passed', 'title': 'One'}}
+        pytest.testomatio.connector.batch_tests_upload.assert_not_called()
+
+    def test_worker_uploads_results_in_worker_upload_mode(self, worker_session):
+        """Test xdist worker uploads results itself with its own batch index range"""
+        self.set_run(worker_upload=True)
+
+        main.pytest_sessionfinish(worker_session, 0)
+
+        assert 'testrun_results' not in worker_session.config.workeroutput
+        pytest.testomatio.connector.batch_tests_upload.assert_called_once_with(
+            'run_123', 50, [{'status': 'passed', 'title': 'One'}], start_index=2, index_step=4)
+
+    def test_worker_waits_for_background_uploads(self, worker_session):
+        """Test worker drains streaming reporter before it is reported as finished to the main process"""
+        self.set_run(worker_upload=True)
+        pytest.testomatio.reporter = Mock(error=None)
+        pytest.testomatio.async_connector = Mock()
+
+        main.pytest_sessionfinish(worker_session, 0)
+
+        pytest.testomatio.reporter.put.assert_called_once_with({'status': 'passed', 'title': 'One'})
+        pytest.testomatio.reporter.stop.assert_called_once()
+        pytest.testomatio.async_connector.close.assert_called_once()
+
+
+    @patch('pytest.exit')
+    def test_aborted_when_streaming_report_failed(self, mock_exit, worker_session):
+        """Test session aborted after final drain when testomat.io rejected a streamed batch"""
+        self.set_run(worker_upload=True)
+        pytest.testomatio.reporter = Mock(error=ReportFailedException(), dropped=3)
+
+        main.pytest_sessionfinish(worker_session, 0)
+
+        pytest.testomatio.reporter.stop.assert_called_once()
+        mock_exit.assert_called_once_with("Aborting test run")
+
+
+class TestCollectResult:
+    """Tests for results received from xdist workers"""
+
+    def teardown_method(self):
+        """Clear pytest namespace after test"""
+        if hasattr(pytest, 'testomatio'):
+            delattr(pytest, 'testomatio')
+
+    def test_result_passed_to_streaming_reporter(self):
+        """Test result uploaded by the reporter when streaming is enabled"""
+        pytest.testomatio = Mock()
+        pytest.testomatio.test_run_config.status_request = {}
+
+        main._collect_result('test.py::test_one', {'status': 'passed'})
+
+        pytest.testomatio.reporter.put.assert_called_once_with({'status': 'passed'})
+        pytest.testomatio.journal.append.assert_not_called()
+        assert pytest.testomatio.test_run_config.status_request == {}
+
+    def test_result_written_to_journal(self):
+        """Test result written to the journal when it is enabled"""
+        pytest.testomatio = Mock()
+        pytest.testomatio.reporter = None
+
+        main._collect_result('test.py::test_one', {'status': 'passed'})
+
+        pytest.testomatio.journal.append.assert_called_once_with({'status': 'passed'})
+
+    def test_result_kept_for_batch_upload(self):
+        """Test result kept in memory for upload at the end of the session"""
+        pytest.testomatio = Mock()
+        pytest.testomatio.reporter = None
+        pytest.testomatio.journal = None
+        pytest.testomatio.test_run_config.status_request = {}
+
+        main._collect_result('test.py::test_one', {'status': 'passed'})
+
+        assert pytest.testomatio.test_run_config.status_request == {'test.py::test_one': {'status': 'passed'}}
+
+
 @pytest.mark.smoke
 class TestPytestUnconfigure:
     """Tests for pytest_unconfigure hook"""
@@ -1177,8 +1601,7 @@ class TestPytestUnconfigure:
         result = main.pytest_unconfigure(mock_config)
         assert result is None
 
-    @patch('pytestomatio.main.time.sleep')
-    def test_unconfigure_main_process_cleanup(self, mock_sleep):
+    def test_unconfigure_main_process_cleanup(self):
         """Test cleanup in main process for report command"""
         mock_config = Mock(spec=['addinivalue_line', 'getini', 'getoption', 'pluginmanager'])
         mock_config.getoption.return_value = 'report'
@@ -1192,12 +1615,15 @@ class TestPytestUnconfigure:
 
         main.pytest_unconfigure(mock_config)
 
-        mock_sleep.assert_called_once_with(1)
+        pytest.testomatio.reporter.stop.assert_called_once()
+        pytest.testomatio.async_connector.close.assert_called_once()
         pytest.testomatio.connector.finish_test_run.assert_called_once_with('test_run_123', True)
         assert pytest.testomatio.test_run_config.clear_run_id.call_count == 1
+        # transport stats are logged once all requests are sent
+        assert pytest.testomatio.connector.mock_calls[-1] == call.disconnect()
 
     def test_unconfigure_xdist_worker_cleanup(self):
-        """Test cleanup in xdist worker process for report command"""
+        """Test xdist worker does not finish the run, it is finished once by the main process"""
         mock_config = Mock()
         mock_config.workerinput = Mock()
         mock_config.getoption.return_value = 'report'
@@ -1210,8 +1636,9 @@ class TestPytestUnconfigure:
 
         main.pytest_unconfigure(mock_config)
 
-        pytest.testomatio.connector.finish_test_run.assert_called_once_with('worker_run_456', False)
+        pytest.testomatio.connector.finish_test_run.assert_not_called()
         pytest.testomatio.test_run_config.clear_run_id.assert_not_called()
+        pytest.testomatio.connector.disconnect.assert_called_once()
 
     def test_unconfigure_other_commands(self):
         """Test cleanup for other commands"""
@@ -1230,6 +1657,7 @@ class TestPytestUnconfigure:
 
             pytest.testomatio.connector.finish_test_run.assert_not_called()
             assert pytest.testomatio.test_run_config.clear_run_id.call_count == call_count
+            assert pytest.testomatio.connector.disconnect.call_count == call_count
 
     def test_unconfigure_main_process_for_proceed_run(self):
         """Test cleanup in main process when proceed env set"""
@@ -1248,6 +1676,24 @@ class TestPytestUnconfigure:
         pytest.testomatio.connector.assert_not_called()
         assert pytest.testomatio.test_run_config.clear_run_id.call_count == 1
 
+    def test_unconfigure_proceed_run_with_background_reporting(self):
+        """Test run not finished when proceed env set and results are reported in background"""
+        mock_config = Mock(spec=['addinivalue_line', 'getini', 'getoption', 'pluginmanager'])
+        mock_config.getoption.return_value = 'report'
+
+        pytest.testomatio = Mock()
+        pytest.testomatio.test_run_config = Mock()
+        pytest.testomatio.test_run_config.test_run_id = 'test_run_123'
+        pytest.testomatio.test_run_config.proceed = True
+        pytest.testomatio.connector = Mock()
+
+        main.pytest_unconfigure(mock_config)
+
+        pytest.testomatio.reporter.stop.assert_called_once()
+        pytest.testomatio.async_connector.close.assert_called_once()
+        assert not pytest.testomatio.connector.finish_test_run.called
+        assert pytest.testomatio.test_run_config.clear_run_id.call_count == 1
+
 @pytest.mark.smoke
 class TestPytestRuntestLogfinish:
     """Tests for pytest_runtest_logfinish hook"""
@@ -1295,6 +1741,7 @@ class TestPytestRuntestLogfinish:
         pytest.testomatio.test_run_config = Mock()
         pytest.testomatio.test_run_config.test_run_id = 'run_123'
         pytest.testomatio.connector = Mock()
+        pytest.testomatio.async_connector = None
 
         status_requests = {
             'test1::nodeid': {
@@ -1335,6 +1782,7 @@ class TestPytestRuntestLogfinish:
         pytest.testomatio.test_run_config = Mock()
         pytest.testomatio.test_run_config.test_run_id = 'run_456'
         pytest.testomatio.connector = Mock()
+        pytest.testomatio.async_connector = None
 
         pytest.testomatio.test_run_config.status_request = {
             'test::nodeid': {'status': 'passed', 'title': 'Test'}
@@ -1351,6 +1799,7 @@ class TestPytestRuntestLogfinish:
         pytest.testomatio.test_run_config = Mock()
         pytest.testomatio.test_run_config.test_run_id = 'run_789'
         pytest.testomatio.connector = Mock()
+        pytest.testomatio.async_connector = None
         pytest.testomatio.test_run_config.status_request = {}
 
         main.pytest_runtest_logfinish('nodeid', ('file.py', 1, 'test'))
@@ -1358,3 +1807,113 @@ class TestPytestRuntestLogfinish:
         pytest.testomatio.connector.update_test_status.assert_not_called()
 
         assert pytest.testomatio.test_run_config.status_request == {}
+
+    def test_logfinish_reports_with_async_connector(self):
+        """Test statuses are scheduled on async connector when it is enabled"""
+        pytest.testomatio_config_option = 'report'
+        pytest.testomatio = Mock()
+        pytest.testomatio.test_run_config = Mock()
+        pytest.testomatio.test_run_config.test_run_id = 'run_123'
+        pytest.testomatio.connector = Mock()
+        pytest.testomatio.async_connector = Mock()
+        pytest.testomatio.async_connector.report_failed = False
+        pytest.testomatio.test_run_config.status_request = {
+            'test::nodeid': {'status': 'passed', 'title': 'Test'}
+        }
+
+        main.pytest_runtest_logfinish('nodeid', ('file.py', 1, 'test'))
+
+        pytest.testomatio.async_connector.update_test_status.assert_called_once_with(
+            run_id='run_123', status='passed', title='Test')
+        pytest.testomatio.connector.update_test_status.assert_not_called()
+        assert pytest.testomatio.test_run_config.status_request == {}
+
+    @patch('pytestomatio.main.pytest.exit')
+    def test_logfinish_aborts_when_async_report_failed(self, mock_exit):
+        """Test run aborted when async connector report was rejected"""
+        pytest.testomatio_config_option = 'report'
+        pytest.testomatio = Mock()
+        pytest.testomatio.test_run_config = Mock()
+        pytest.testomatio.test_run_config.test_run_id = 'run_123'
+        pytest.testomatio.async_connector = Mock()
+        pytest.testomatio.async_connector.report_failed = True
+        pytest.testomatio.test_run_config.status_request = {}
+
+        main.pytest_runtest_logfinish('nodeid', ('file.py', 1, 'test'))
+
+        mock_exit.assert_called_with("Aborting test run")
+
+
+class StubTestomatioHandler(BaseHTTPRequestHandler):
+    """Replies to Testomat.io reporter API and records received requests with their time"""
+
+    def _handle(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = json.loads(self.rfile.read(length)) if length else None
+        self.server.requests.append((time.time(), self.command, self.path, body))
+        payload = json.dumps({'uid': 'run_123', 'url': 'http://testomat.io/run_123'}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = _handle
+
+    def log_message(self, *args):
+        pass
+
+
+class TestStreamingReportWithXdist:
+    """Tests for streaming report of tests run by pytest-xdist"""
+
+    @pytest.fixture
+    def server(self):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), StubTestomatioHandler)
+        server.requests = []
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    def test_results_uploaded_by_main_process_while_tests_run(self, pytester, monkeypatch, server):
+        """Test results received from workers are uploaded before the session finishes"""
+        pytest.importorskip('xdist')
+        for name in ('TESTOMATIO_RUN_ID', 'TESTOMATIO_RUN', 'HTTP_PROXY', 'TESTOMATIO_RESULT_JOURNAL'):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv('TESTOMATIO', testomatio_api_key)
+        monkeypatch.setenv('TESTOMATIO_URL', f'http://127.0.0.1:{server.server_address[1]}')
+        monkeypatch.setenv('TESTOMATIO_STREAM_REPORT', '1')
+        monkeypatch.setenv('TESTOMATIO_STREAM_FLUSH_INTERVAL', '1')
+        monkeypatch.setenv('TESTOMATIO_BATCH_SIZE', '1')
+        # run id is passed to workers through a file in the temp directory
+        monkeypatch.setenv('TMPDIR', str(pytester.path))
+        monkeypatch.setenv('PYTHONPATH', str(Path(main.__file__).parent.parent))
+        pytester.makeconftest("""
+            import time
+            import pytest
+
+            @pytest.hookimpl(tryfirst=True)
+            def pytest_sessionfinish(session):
+                if not hasattr(session.config, 'workerinput'):
+                    with open('session_finished', 'w') as file:
+                        file.write(repr(time.time()))
+        """)
+        pytester.makepyfile("""
+            import time
+            import pytest
+
+            @pytest.mark.parametrize('number', range(4))
+            def test_slow(number):
+                time.sleep(1)
+        """)
+
+        result = pytester.runpytest_subprocess('-p', 'pytestomatio.main', '-n', '2', '--testomatio', 'report')
+
+        result.assert_outcomes(passed=4)
+        session_finished = float((pytester.path / 'session_finished').read_text())
+        batches = [(received, body) for received, method, path, body in server.requests
+                   if method == 'POST' and path.startswith('/api/reporter/run_123/testrun')]
+        assert sum(len(body['tests']) for _, body in batches) == 4
+        assert min(received for received, _ in batches) < session_finished
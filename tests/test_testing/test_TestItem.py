@@ -269,41 +269,41 @@ class TestTestItem:
         """Test _resolve_parameter_key_in_test_name"""
         test_item = TestItem(mock_item)
 
-        with patch.object(test_item, '_get_test_parameter_key', return_value=["param1", "param2"]):
-            result = test_item._resolve_parameter_key_in_test_name(mock_item, "Test name[value]")
+        test_item.parameters = ["param1", "param2"]
+        result = test_item._resolve_parameter_key_in_test_name(mock_item, "Test name[value]")
 
-            assert result == "Test name ${param1} ${param2}"
+        assert result == "Test name ${param1} ${param2}"
 
     @patch('inspect.getsource')
     def test_resolve_parameter_key_in_test_name_for_bdd_test(self, mock_source, mock_bdd_item):
         """Test _resolve_parameter_key_in_test_name for bdd test"""
         test_item = TestItem(mock_bdd_item)
 
-        with patch.object(test_item, '_get_test_parameter_key', return_value=["param1", "param2"]):
-            result = test_item._resolve_parameter_key_in_test_name(mock_bdd_item, "Test name[value]")
+        test_item.parameters = ["param1", "param2"]
+        result = test_item._resolve_parameter_key_in_test_name(mock_bdd_item, "Test name[value]")
 
-            assert test_item.type == 'bdd'
-            assert result == "Test name ${param1} ${param2}"
+        assert test_item.type == 'bdd'
+        assert result == "Test name ${param1} ${param2}"
 
     def test_resolve_parameter_key_no_params(self, mock_item):
         """Test _resolve_parameter_key_in_test_name without params"""
         test_item = TestItem.__new__(TestItem)
 
-        with patch.object(test_item, '_get_test_parameter_key', return_value=[]):
-            result = test_item._resolve_parameter_key_in_test_name(mock_item, "Test name")
+        test_item.parameters = []
+        result = test_item._resolve_parameter_key_in_test_name(mock_item, "Test name")
 
-            assert result == "Test name"
+        assert result == "Test name"
 
     @patch('inspect.getsource')
     def test_resolve_parameter_key_no_params_for_bdd_test(self, mock_source, mock_bdd_item):
         """Test _resolve_parameter_key_in_test_name without params for bdd test"""
         test_item = TestItem(mock_bdd_item)
 
-        with patch.object(test_item, '_get_test_parameter_key', return_value=[]):
-            result = test_item._resolve_parameter_key_in_test_name(mock_bdd_item, "Test name")
+        test_item.parameters = []
+        result = test_item._resolve_parameter_key_in_test_name(mock_bdd_item, "Test name")
 
-            assert test_item.type == 'bdd'
-            assert result == "Test name"
+        assert test_item.type == 'bdd'
+        assert result == "Test name"
 
     def test_to_string_value_various_types(self, mock_item):
         """Test _to_string_value with different types"""
@@ -400,12 +400,12 @@ class TestTestItem:
         mock_item.callspec = Mock()
         mock_item.callspec.params = {"param1": "value1", "param2": "value with spaces"}
 
-        with patch.object(test_item, '_get_test_parameter_key', return_value=["param1", "param2"]):
-            with patch.object(test_item, '_get_sync_test_title', return_value="Test ${param1} and ${param2}"):
-                result = test_item._resolve_parameter_value_in_test_name(mock_item, "Test name")
+        test_item.parameters = ["param1", "param2"]
+        test_item.sync_title = "Test ${param1} and ${param2}"
+        result = test_item._resolve_parameter_value_in_test_name(mock_item, "Test name")
 
-                assert "value1" in result
-                assert "value_with_spaces" in result
+        assert "value1" in result
+        assert "value_with_spaces" in result
 
     @patch('inspect.getsource')
     def test_resolve_parameter_value_in_test_name_for_bdd_test(self, mock_source, mock_bdd_item):
@@ -415,13 +415,13 @@ class TestTestItem:
         mock_bdd_item.callspec = Mock()
         mock_bdd_item.callspec.params = {'_pytest_bdd_example': {"param1": "value1", "param2": "value with spaces"}}
 
-        with patch.object(test_item, '_get_test_parameter_key', return_value=["param1", "param2"]):
-            with patch.object(test_item, '_get_sync_test_title', return_value="Test ${param1} and ${param2}"):
-                result = test_item._resolve_parameter_value_in_test_name(mock_bdd_item, "Test name")
+        test_item.parameters = ["param1", "param2"]
+        test_item.sync_title = "Test ${param1} and ${param2}"
+        result = test_item._resolve_parameter_value_in_test_name(mock_bdd_item, "Test name")
 
-                assert test_item.type == 'bdd'
-                assert "value1" in result
-                assert "value_with_spaces" in result
+        assert test_item.type == 'bdd'
+        assert "value1" in result
+        assert "value_with_spaces" in result
 
     @patch("inspect.getsource")
     def test_resolve_parameter_value_no_callspec(self, mock_source, mock_item):
@@ -429,10 +429,23 @@ class TestTestItem:
         test_item = TestItem(mock_item)
         mock_item.callspec = None
 
-        with patch.object(test_item, '_get_test_parameter_key', return_value=["param1"]):
-            result = test_item._resolve_parameter_value_in_test_name(mock_item, "Test name")
+        test_item.parameters = ["param1"]
+        result = test_item._resolve_parameter_value_in_test_name(mock_item, "Test name")
+
+        assert result == "Test name"
+
+    @patch("inspect.getsource")
+    def test_parameter_keys_resolved_once_per_test(self, mock_source, mock_item):
+        """Test sync and execution titles share parameter keys of the test"""
+        test_item = TestItem(mock_item)
+        mock_item.callspec = Mock()
+        mock_item.callspec.params = {"param1": "value1"}
+
+        with patch.object(test_item, '_get_test_parameter_key', return_value=["param1"]) as get_keys:
+            test_item.sync_title
+            test_item.exec_title
 
-            assert result == "Test name"
+        get_keys.assert_called_once()
 
     @patch('inspect.getsource')
     def test_get_regular_type(self, mock_getsource, mock_item):
@@ -608,3 +621,35 @@ class TestTestItem:
         result = test_item._get_test_tags(mock_item)
 
         assert result == ["smoke", "regression", "api"]
+
+    @patch('inspect.getsource')
+    def test_attributes_computed_lazily(self, mock_getsource, mock_item):
+        """Test source code and titles computed on first access only"""
+        mock_getsource.return_value = "def test_example(): pass"
+
+        test_item = TestItem(mock_item)
+
+        assert not mock_getsource.called
+        assert test_item.source_code == "def test_example(): pass"
+        assert test_item.source_code == "def test_example(): pass"
+        assert mock_getsource.call_count == 1
+
+    def test_source_code_can_be_set(self, mock_item):
+        """Test assigned source code is used without inspecting function"""
+        test_item = TestItem(mock_item)
+
+        with patch('inspect.getsource') as mock_getsource:
+            test_item.source_code = "def test_example(): pass"
+
+            assert test_item.source_code == "def test_example(): pass"
+            assert not mock_getsource.called
+
+    def test_from_item_cached_in_stash(self, pytester):
+        """Test the same TestItem returned for the item in all phases"""
+        pytester.makepyfile(test_cached="def test_cached():\n    pass\n")
+        item = pytester.getitems(pytester.path / 'test_cached.py')[0]
+
+        test_item = TestItem.from_item(item)
+
+        assert TestItem.from_item(item) is test_item
+        assert test_item.exec_title == 'Cached'
@@ -1,3 +1,4 @@
+import os
 from pytestomatio.utils.helper import get_functions_source_by_name
 
 
@@ -38,3 +39,62 @@ class TestGetFunctionsSourceByName:
         results = list(get_functions_source_by_name(path, all_tests))
 
         assert len(results) == 0
+
+    def test_module_not_executed(self, tmp_path):
+        """Test file parsed without importing it"""
+        path = tmp_path / 'test_module.py'
+        path.write_text('raise RuntimeError("module executed")\n\n'
+                        'def test_login():\n'
+                        '    assert True\n')
+
+        results = list(get_functions_source_by_name(str(path), ['test_login']))
+
+        assert results == [('test_login', 'def test_login():\n    assert True\n')]
+
+    def test_class_methods_with_decorators(self, tmp_path):
+        """Test class methods and async functions returned with decorators and original indentation"""
+        path = tmp_path / 'test_class.py'
+        path.write_text('import pytest\n\n\n'
+                        'class TestLogin:\n'
+                        '    @pytest.mark.smoke\n'
+                        '    @pytest.mark.parametrize("user", ["admin"])\n'
+                        '    def test_login(self, user):\n'
+                        '        assert user\n\n'
+                        '    def helper(self):\n'
+                        '        pass\n\n\n'
+                        'async def test_async():\n'
+                        '    pass\n')
+
+        results = dict(get_functions_source_by_name(str(path), ['test_login', 'test_async']))
+
+        assert results == {
+            'test_login': '    @pytest.mark.smoke\n'
+                          '    @pytest.mark.parametrize("user", ["admin"])\n'
+                          '    def test_login(self, user):\n'
+                          '        assert user\n',
+            'test_async': 'async def test_async():\n    pass\n',
+        }
+
+    def test_redefined_function(self, tmp_path):
+        """Test the last definition of module function is used"""
+        path = tmp_path / 'test_redefined.py'
+        path.write_text('def test_login():\n    assert 1\n\n'
+                        'def test_login():\n    assert 2\n')
+
+        results = list(get_functions_source_by_name(str(path), ['test_login']))
+
+        assert results == [('test_login', 'def test_login():\n    assert 2\n')]
+
+    def test_cache_invalidated_on_change(self, tmp_path):
+        """Test file parsed again after it is modified"""
+        path = tmp_path / 'test_changed.py'
+        path.write_text('def test_login():\n    assert 1\n')
+        list(get_functions_source_by_name(str(path), ['test_login']))
+
+        path.write_text('def test_login():\n    assert 2\n')
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        results = list(get_functions_source_by_name(str(path), ['test_login']))
+
+        assert results == [('test_login', 'def test_login():\n    assert 2\n')]
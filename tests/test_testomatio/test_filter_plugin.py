@@ -306,3 +306,19 @@ class TestTestomatioFilterPlugin:
 
         assert items == [item]
         assert len(items) == 1
+
+    def test_match_tests_by_id_keeps_order(self, plugin):
+        """Test items matched by any of their marker ids in original order"""
+        first = self.create_mock_item_with_marker("test_first", "@T00000002")
+        skipped = self.create_mock_item_with_marker("test_skipped", "@T00000003")
+        unmarked = self.create_mock_item_without_marker("test_unmarked")
+        second = Mock()
+        second.iter_markers.return_value = iter([Mock(args=["@T00000009"]), Mock(args=["@T00000001"])])
+
+        matched = plugin.match_tests_by_id(["00000001", "00000002"], [first, skipped, unmarked, second])
+
+        assert matched == [first, second]
+
+    def test_get_matched_test_ids_unique(self, plugin):
+        """Test duplicated ids of test_id filter returned once without prefix"""
+        assert plugin.get_matched_test_ids('test_id', '@T00000001|00000001|@T00000002') == {'00000001', '00000002'}
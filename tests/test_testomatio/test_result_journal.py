@@ -0,0 +1,132 @@
+import os
+import pytest
+from unittest.mock import Mock
+
+from pytestomatio.connect.exception import ReportFailedException
+
+from pytestomatio.testomatio.result_journal import ResultJournal, CHUNK_BATCHES
+
+
+def fake_upload(*summaries):
+    """Returns side effect of batch_tests_upload that acknowledges sent batches one by one
+    and returns given summaries. Exception in summaries is raised after its sent batches are acknowledged"""
+    summaries = list(summaries)
+
+    def upload(run_id, batch_size, tests, start_index, on_sent):
+        summary = summaries.pop(0)
+        for index in summary['sent']:
+            on_sent(index)
+        if 'error' in summary:
+            raise summary['error']
+        return summary
+    return upload
+
+
+class TestResultJournal:
+    """Tests for ResultJournal"""
+
+    def test_for_run(self, tmp_path):
+        """Test journal file named by run id in given directory"""
+        journal = ResultJournal.for_run(str(tmp_path / 'journals'), 'run_123')
+
+        assert os.path.dirname(journal.path) == str(tmp_path / 'journals')
+        assert os.path.basename(journal.path).startswith('testomatio-results-run_123-')
+
+    def test_append_and_read_chunks(self, tmp_path):
+        """Test results read back in chunks in order"""
+        journal = ResultJournal(str(tmp_path / 'results.jsonl'))
+        for i in range(5):
+            journal.append({'title': f'Test {i}', 'status': 'passed'})
+
+        chunks = list(journal.read_chunks(2))
+
+        assert journal.count == 5
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert chunks[2] == [{'title': 'Test 4', 'status': 'passed'}]
+
+    def test_broken_line_skipped(self, tmp_path):
+        """Test incomplete line written on crash is skipped"""
+        path = tmp_path / 'results.jsonl'
+        path.write_text('{"title": "Test 1"}\n{"title": "Te')
+
+        chunks = list(ResultJournal(str(path)).read_chunks(10))
+
+        assert chunks == [[{'title': 'Test 1'}]]
+
+    def test_upload_removes_journal(self, tmp_path):
+        """Test journal uploaded by chunks with continuous batch indexes and removed after upload"""
+        journal = ResultJournal(str(tmp_path / 'results.jsonl'))
+        for i in range(2 * CHUNK_BATCHES + 1):
+            journal.append({'title': f'Test {i}'})
+        connector = Mock()
+        connector.batch_tests_upload.side_effect = \
+            lambda run_id, batch_size, tests, start_index, on_sent: {'sent': list(range(len(tests))),
+                                                                     'failed': [], 'skipped': []}
+
+        assert journal.upload(connector, 'run_123', 2) is True
+
+        calls = connector.batch_tests_upload.call_args_list
+        assert [len(c[0][2]) for c in calls] == [2 * CHUNK_BATCHES, 1]
+        assert [c[1]['start_index'] for c in calls] == [1, CHUNK_BATCHES + 1]
+        assert not os.path.exists(journal.path)
+
+    def test_upload_failed_keeps_journal(self, tmp_path):
+        """Test journal kept on disk when batches failed"""
+        journal = ResultJournal(str(tmp_path / 'results.jsonl'))
+        journal.append({'title': 'Test'})
+        connector = Mock()
+        connector.batch_tests_upload.return_value = {'sent': [], 'failed': [1], 'skipped': []}
+
+        assert journal.upload(connector, 'run_123', 50) is False
+        assert os.path.exists(journal.path)
+
+    def test_upload_resends_only_not_acknowledged_batches(self, tmp_path):
+        """Test batches acknowledged before are not sent again with batch size they were split with"""
+        journal = ResultJournal(str(tmp_path / 'results.jsonl'))
+        for i in range(7):
+            journal.append({'title': f'Test {i}'})
+        connector = Mock()
+        connector.batch_tests_upload.side_effect = fake_upload(
+            {'sent': [1, 3], 'failed': [2], 'skipped': [4]},
+            {'sent': [2], 'failed': [], 'skipped': []},
+            {'sent': [4], 'failed': [], 'skipped': []},
+        )
+
+        assert journal.upload(connector, 'run_123', 2) is False
+        assert journal.read_acks() == ({1, 3}, 2)
+
+        assert ResultJournal(journal.path).upload(connector, 'run_123', 50) is True
+
+        calls = connector.batch_tests_upload.call_args_list[1:]
+        assert [(c[0][1], c[0][2], c[1]['start_index']) for c in calls] == [
+            (2, [{'title': 'Test 2'}, {'title': 'Test 3'}], 2),
+            (2, [{'title': 'Test 6'}], 4),
+        ]
+        assert not os.path.exists(journal.path)
+        assert not os.path.exists(journal.ack_path)
+
+    def test_batches_sent_before_report_failed_acknowledged(self, tmp_path):
+        """Test batches accepted before upload was aborted are not sent again"""
+        journal = ResultJournal(str(tmp_path / 'results.jsonl'))
+        for i in range(6):
+            journal.append({'title': f'Test {i}'})
+        connector = Mock()
+        connector.batch_tests_upload.side_effect = fake_upload(
+            {'sent': [1, 2], 'error': ReportFailedException()})
+
+        with pytest.raises(ReportFailedException):
+            journal.upload(connector, 'run_123', 2)
+
+        assert journal.read_acks() == ({1, 2}, 2)
+        assert os.path.exists(journal.path)
+
+    def test_find(self, tmp_path):
+        """Test journals of all processes of the run found"""
+        for name in ('testomatio-results-run_1-10.jsonl', 'testomatio-results-run_1-11.jsonl',
+                     'testomatio-results-run_2-10.jsonl', 'testomatio-results-run_1-10.jsonl.ack'):
+            (tmp_path / name).write_text('')
+
+        journals = ResultJournal.find(str(tmp_path), 'run_1')
+
+        assert [os.path.basename(journal.path) for journal in journals] == [
+            'testomatio-results-run_1-10.jsonl', 'testomatio-results-run_1-11.jsonl']
@@ -0,0 +1,56 @@
+import pytest
+
+from pytestomatio.testomatio.result_record import ResultRecord
+
+
+class TestResultRecord:
+    """Tests for ResultRecord"""
+
+    def test_no_instance_dict(self):
+        """Test record stores fields in slots"""
+        record = ResultRecord(title='Login')
+
+        assert not hasattr(record, '__dict__')
+        with pytest.raises(AttributeError):
+            record.extra = 1
+
+    def test_to_dict_drops_none(self):
+        """Test only set fields serialized"""
+        record = ResultRecord(title='Login', status='passed', artifacts=[], run_time=0.0)
+
+        assert record.to_dict() == {'title': 'Login', 'status': 'passed', 'artifacts': [], 'run_time': 0.0}
+
+    def test_unknown_field(self):
+        """Test unknown fields rejected"""
+        with pytest.raises(TypeError):
+            ResultRecord(title='Login', unknown='value')
+        with pytest.raises(KeyError):
+            ResultRecord()['unknown'] = 'value'
+
+    def test_mapping_access(self):
+        """Test record read, written and unpacked as request dict"""
+        record = ResultRecord(title='Login')
+        record['status'] = 'failed'
+
+        assert record['status'] == 'failed'
+        assert record.get('message') is None
+        assert record.get('unknown', 'default') == 'default'
+        assert 'code' in record
+        assert set(record.keys()) == set(ResultRecord.FIELDS)
+        assert dict(**record)['title'] == 'Login'
+
+    def test_merge(self):
+        """Test fields set in other record copied, except excluded"""
+        record = ResultRecord(title='Login', status='passed', run_time=1.0)
+        teardown = ResultRecord(title='Teardown title', run_time=0.5, artifacts=['url'])
+
+        record.merge(teardown, exclude=('title',))
+
+        assert record.to_dict() == {'title': 'Login', 'status': 'passed', 'run_time': 0.5, 'artifacts': ['url']}
+
+    def test_from_dict_round_trip(self):
+        """Test record restored from serialized dict"""
+        record = ResultRecord(title='Login', status='passed', meta={'browser': 'chrome'})
+
+        assert ResultRecord.from_dict(record.to_dict()) == record
+        assert record == {'title': 'Login', 'status': 'passed', 'meta': {'browser': 'chrome'}, 'code': None}
@@ -0,0 +1,92 @@
+from unittest.mock import Mock, patch
+
+from _pytest.reports import TestReport
+
+from pytestomatio.testomatio.result_record import ResultRecord
+from pytestomatio.connect.connector import Connector
+from pytestomatio.connect.reporter import StreamingReporter
+from pytestomatio.testomatio.result_transport import WorkerResultSender, ResultReceiver, RESULT_PROPERTY, \
+    worker_batch_indexes
+
+
+def make_report(when='teardown', user_properties=None):
+    return TestReport('test_file.py::test_one', ('test_file.py', 1, 'test_one'), {}, 'passed', None, when,
+                      user_properties=user_properties or [])
+
+
+class TestResultTransport:
+    """Tests for result transport between xdist worker and main process"""
+
+    def test_worker_attaches_result_to_teardown_report(self):
+        """Test result moved from status request to teardown report"""
+        run = Mock()
+        run.status_request = {'test_file.py::test_one': ResultRecord(status='passed', title='One')}
+        sender = WorkerResultSender(run)
+        call_report = make_report('call')
+        teardown_report = make_report()
+
+        sender.pytest_runtest_logreport(call_report)
+        assert call_report.user_properties == []
+
+        sender.pytest_runtest_logreport(teardown_report)
+        assert run.status_request == {}
+        assert teardown_report.user_properties == [(RESULT_PROPERTY, {'status': 'passed', 'title': 'One'})]
+
+    def test_result_received_after_serialization(self):
+        """Test result delivered to handler from report serialized as xdist does and removed from report"""
+        run = Mock()
+        run.status_request = {'test_file.py::test_one': ResultRecord(status='failed', title='One')}
+        worker_report = make_report(user_properties=[('owner', 'team')])
+        WorkerResultSender(run).pytest_runtest_logreport(worker_report)
+        handler = Mock()
+        receiver = ResultReceiver(handler)
+
+        report = TestReport._from_json(worker_report._to_json())
+        receiver.pytest_runtest_logreport(report)
+
+        handler.assert_called_once_with('test_file.py::test_one', {'status': 'failed', 'title': 'One'})
+        assert [tuple(prop) for prop in report.user_properties] == [('owner', 'team')]
+        assert receiver.received == 1
+
+    def test_report_without_result_ignored(self):
+        """Test reports of single process run are not handled"""
+        handler = Mock()
+
+        ResultReceiver(handler).pytest_runtest_logreport(make_report(user_properties=[('owner', 'team')]))
+
+        handler.assert_not_called()
+
+    def test_worker_batch_indexes(self):
+        """Test workers interleave batch indexes starting from the first one"""
+        assert worker_batch_indexes('gw0', 4) == (1, 4)
+        assert worker_batch_indexes('gw3', 4) == (4, 4)
+        assert worker_batch_indexes('gw0', 1) == (1, 1)
+
+    def test_batch_indexes_of_two_workers_do_not_overlap(self):
+        """Test batches uploaded by two workers at the end of the session and streamed by them
+        get distinct indexes that together form a contiguous sequence"""
+        sent = {}
+        for worker_id in ('gw0', 'gw1'):
+            start_index, index_step = worker_batch_indexes(worker_id, 2)
+            connector = Connector('https://app.testomat.io', 'api_key')
+            with patch.object(Connector, 'send_batch', return_value=True) as send_batch:
+                connector.batch_tests_upload('run_123', 2, [{'title': str(i)} for i in range(7)],
+                                             start_index=start_index, index_step=index_step)
+            sent[worker_id] = [c[0][2] for c in send_batch.call_args_list]
+
+        assert sent == {'gw0': [1, 3, 5, 7], 'gw1': [2, 4, 6, 8]}
+
+        streamed = {}
+        for worker_id in ('gw0', 'gw1'):
+            start_index, index_step = worker_batch_indexes(worker_id, 2)
+            connector = Mock()
+            connector.send_batch.return_value = True
+            reporter = StreamingReporter(connector, 'run_123', 2, start_index=start_index, index_step=index_step)
+            reporter.start()
+            for i in range(6):
+                reporter.put({'title': str(i)})
+            reporter.stop(timeout=5)
+            streamed[worker_id] = [c[0][2] for c in connector.send_batch.call_args_list]
+
+        assert not set(streamed['gw0']) & set(streamed['gw1'])
+        assert sorted(streamed['gw0'] + streamed['gw1']) == list(range(1, 7))
@@ -2,7 +2,8 @@ import pytest
 import os
 from unittest.mock import patch, mock_open
 
-from pytestomatio.testomatio.testRunConfig import TestRunConfig, TESTOMATIO_TEST_RUN_LOCK_FILE, DEFAULT_BATCH_SIZE
+from pytestomatio.testomatio.testRunConfig import TestRunConfig, TESTOMATIO_TEST_RUN_LOCK_FILE, DEFAULT_BATCH_SIZE, \
+    DEFAULT_STREAM_QUEUE_SIZE
 from pytestomatio.utils.constants import RUN_KINDS
 
 
@@ -129,6 +130,14 @@ class TestTestRunConfig:
 
             assert config.disable_artifacts is False
 
+    @pytest.mark.parametrize('value', ['True', 'true', '1'])
+    def test_init_defer_artifacts(self, value):
+        """Test different true values for TESTOMATIO_DEFER_ARTIFACTS"""
+        with patch.dict(os.environ, {'TESTOMATIO_DEFER_ARTIFACTS': value}, clear=True):
+            config = TestRunConfig()
+
+            assert config.defer_artifacts is True
+
     @pytest.mark.parametrize('value', ['True', 'true', '1'])
     def test_init_stack_passed_true_variations(self, value):
         """Test different true values for TESTOMATIO_STACK_PASSED"""
@@ -273,6 +282,55 @@ class TestTestRunConfig:
 
             assert config.batch_size == DEFAULT_BATCH_SIZE
 
+    @pytest.mark.parametrize('value', ['True', 'true', '1'])
+    def test_init_stream_report_true_variations(self, value):
+        """Test different true values for TESTOMATIO_STREAM_REPORT"""
+        with patch.dict(os.environ, {'TESTOMATIO_STREAM_REPORT': value}, clear=True):
+            config = TestRunConfig()
+
+            assert config.stream_report is True
+
+    @pytest.mark.parametrize('value', ['False', 'false', '0', 'anything'])
+    def test_init_stream_report_false_variations(self, value):
+        """Test different false values TESTOMATIO_STREAM_REPORT"""
+        with patch.dict(os.environ, {'TESTOMATIO_STREAM_REPORT': value}, clear=True):
+            config = TestRunConfig()
+
+            assert config.stream_report is False
+
+    def test_init_stream_report_disabled_without_batch_upload(self):
+        """Test streaming is not used when batch upload is disabled"""
+        env_vars = {'TESTOMATIO_STREAM_REPORT': '1', 'TESTOMATIO_DISABLE_BATCH_UPLOAD': '1'}
+        with patch.dict(os.environ, env_vars, clear=True):
+            config = TestRunConfig()
+
+            assert config.stream_report is False
+
+    def test_init_worker_upload(self):
+        """Test worker upload enabled with TESTOMATIO_WORKER_UPLOAD and batches start from the first index"""
+        with patch.dict(os.environ, {'TESTOMATIO_WORKER_UPLOAD': '1'}, clear=True):
+            config = TestRunConfig()
+
+            assert config.worker_upload is True
+            assert config.batch_start_index == 1
+            assert config.batch_index_step == 1
+
+    def test_init_worker_upload_disabled_without_batch_upload(self):
+        """Test worker upload is not used when batch upload is disabled"""
+        env_vars = {'TESTOMATIO_WORKER_UPLOAD': '1', 'TESTOMATIO_DISABLE_BATCH_UPLOAD': '1'}
+        with patch.dict(os.environ, env_vars, clear=True):
+            config = TestRunConfig()
+
+            assert config.worker_upload is False
+
+    @pytest.mark.parametrize('value', ['0', '-5', 'anything'])
+    def test_init_stream_queue_size_false_variations(self, value):
+        """Test different false values TESTOMATIO_STREAM_QUEUE_SIZE"""
+        with patch.dict(os.environ, {'TESTOMATIO_STREAM_QUEUE_SIZE': value}, clear=True):
+            config = TestRunConfig()
+
+            assert config.stream_queue_size == DEFAULT_STREAM_QUEUE_SIZE
+
     @pytest.mark.parametrize("run_kind", RUN_KINDS)
     def test_to_dict_full_data(self, run_kind):
         """Test to_dict with full data and different run kinds"""
@@ -31,6 +31,9 @@ class TestTestomatio:
         assert testomatio.s3_connector is None
         assert testomatio.test_run_config is None
         assert testomatio.connector is None
+        assert testomatio.reporter is None
+        assert testomatio.async_connector is None
+        assert testomatio.artifact_uploader is None
 
     def test_init_with_parameters(self, mock_test_run_config, mock_s3_connector):
         """Test init with params"""
@@ -133,6 +133,24 @@ class TestCollectTests:
             assert test_item.abs_path is not None
             assert test_item.abs_path in test_files
 
+    def test_collect_tests_source_matched_by_file(self, single_test_item, multiple_test_items):
+        """Test each file is asked only for its own tests and source assigned by file and title"""
+        all_items = single_test_item + multiple_test_items
+
+        with patch('pytestomatio.utils.helper.get_functions_source_by_name') as mock_get_source:
+            def side_effect(file_path, test_names):
+                return [(name, f'{os.path.basename(file_path)}::{name}') for name in test_names]
+
+            mock_get_source.side_effect = side_effect
+            meta, test_files, test_names = collect_tests(all_items)
+
+        requested = {os.path.basename(args[0]): sorted(args[1]) for args, _ in mock_get_source.call_args_list}
+        assert requested == {
+            'test_single.py': ['test_addition'],
+            'test_multiple.py': ['test_division', 'test_first', 'test_parametrized'],
+        }
+        assert all(ti.source_code == f'{os.path.basename(ti.abs_path)}::{ti.title}' for ti in meta)
+
     def test_collect_tests_return_types(self, single_test_item):
         """Test collected types"""
 
@@ -309,7 +327,7 @@ class TestParseTestList:
 class TestAddAndEnrichTests:
     """Test for add_and_enrich_tests function"""
 
-    @patch('pytestomatio.utils.helper.update_tests')
+    @patch('pytestomatio.utils.helper.update_files')
     @patch('pytestomatio.utils.helper.get_test_mapping')
     @patch('pytestomatio.utils.helper.parse_test_list')
     def test_add_and_enrich_tests_no_matches(self, mock_parse, mock_mapping, mock_update):
@@ -340,13 +358,13 @@ class TestAddAndEnrichTests:
         mock_parse.assert_called_once_with({"tests": {}})
         mock_mapping.assert_called_once_with([mock_meta_item])
         mock_update.assert_called_once_with(
-            "/path/to/test_file1.py",
+            {"/path/to/test_file1.py"},
             [("Test One", None)],
             ["Test One"],
             "testomatio"
         )
 
-    @patch('pytestomatio.utils.helper.update_tests')
+    @patch('pytestomatio.utils.helper.update_files')
     @patch('pytestomatio.utils.helper.get_test_mapping')
     @patch('pytestomatio.utils.helper.parse_test_list')
     def test_add_and_enrich_tests_exact_match(self, mock_parse, mock_mapping, mock_update):
@@ -375,9 +393,9 @@ class TestAddAndEnrichTests:
         )
 
         assert mock_meta_item.id == "@T12345678"
-        assert not mock_parse.return_value
+        assert mock_parse.return_value == [mock_tcm_item]
 
-    @patch('pytestomatio.utils.helper.update_tests')
+    @patch('pytestomatio.utils.helper.update_files')
     @patch('pytestomatio.utils.helper.get_test_mapping')
     @patch('pytestomatio.utils.helper.parse_test_list')
     @patch('pytestomatio.utils.helper.basename')
@@ -414,7 +432,7 @@ class TestAddAndEnrichTests:
 
         assert mock_meta_item.id == "@T87654321"
 
-    @patch('pytestomatio.utils.helper.update_tests')
+    @patch('pytestomatio.utils.helper.update_files')
     @patch('pytestomatio.utils.helper.get_test_mapping')
     @patch('pytestomatio.utils.helper.parse_test_list')
     def test_add_and_enrich_tests_skip_no_file_name(self, mock_parse, mock_mapping, mock_update):
@@ -442,7 +460,7 @@ class TestAddAndEnrichTests:
 
         assert mock_meta_item.id is None
 
-    @patch('pytestomatio.utils.helper.update_tests')
+    @patch('pytestomatio.utils.helper.update_files')
     @patch('pytestomatio.utils.helper.get_test_mapping')
     @patch('pytestomatio.utils.helper.parse_test_list')
     def test_add_and_enrich_tests_multiple_files_and_tests(self, mock_parse, mock_mapping, mock_update):
@@ -479,15 +497,41 @@ class TestAddAndEnrichTests:
         assert meta_items[0].id == "@T111"
         assert meta_items[1].id == "@T222"
 
-        assert mock_update.call_count == 2
+        mock_update.assert_called_once_with(test_files, [("Test A", "@T111"), ("Test B", "@T222")],
+                                            ["Test A", "Test B"], "testomatio")
 
-        expected_calls = [
-            call("file1.py", [("Test A", "@T111"), ("Test B", "@T222")], ["Test A", "Test B"], "testomatio"),
-            call("file2.py", [("Test A", "@T111"), ("Test B", "@T222")], ["Test A", "Test B"], "testomatio")
-        ]
-        mock_update.assert_has_calls(expected_calls, any_order=True)
+    @patch('pytestomatio.utils.helper.update_files')
+    @patch('pytestomatio.utils.helper.get_test_mapping')
+    @patch('pytestomatio.utils.helper.parse_test_list')
+    def test_add_and_enrich_tests_duplicate_titles(self, mock_parse, mock_mapping, mock_update):
+        """Test duplicate titles matched in order and reported as ambiguous"""
+        meta_items = []
+        for title, file_name in [("Login", "test_auth.py"), ("Login", "test_auth.py"), ("Logout", "test_auth.py")]:
+            item = Mock(spec=TestItem)
+            item.resync_title = title
+            item.file_name = file_name
+            item.id = None
+            meta_items.append(item)
+
+        tcm_items = []
+        for title, file_name, test_id in [("Login", "test_auth.py", "@T1"), ("Other", "test_auth.py", "@T3"),
+                                          ("Login", "test_auth.py", "@T2")]:
+            tcm_items.append(TestomatItem(test_id, title, file_name))
+        mock_parse.return_value = tcm_items
+
+        stats = add_and_enrich_tests(
+            meta=meta_items,
+            test_files={"test_auth.py"},
+            test_names=["Login", "Logout"],
+            testomatio_tests={"tests": {}},
+            decorator_name="testomatio"
+        )
+
+        assert [item.id for item in meta_items] == ["@T1", "@T2", None]
+        assert stats == {'matched': 2, 'unmatched': 1, 'ambiguous': 2}
+        assert [item.id for item in mock_parse.return_value] == ["@T1", "@T3", "@T2"]
 
-    @patch('pytestomatio.utils.helper.update_tests')
+    @patch('pytestomatio.utils.helper.update_files')
     @patch('pytestomatio.utils.helper.get_test_mapping')
     @patch('pytestomatio.utils.helper.parse_test_list')
     def test_add_and_enrich_tests_partial_matches(self, mock_parse, mock_mapping, mock_update):
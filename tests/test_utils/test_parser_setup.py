@@ -169,6 +169,16 @@ class TestParserOptions:
             help=expected_help
         )
 
+    def test_parser_options_adds_incremental_option(self, mock_parser):
+        """Test --incremental option is added"""
+        mock_group = mock_parser.getgroup.return_value
+
+        parser_options(mock_parser)
+
+        options = {c[0][0]: c[1] for c in mock_group.addoption.call_args_list}
+        assert options['--incremental']['action'] == 'store_true'
+        assert options['--incremental']['dest'] == 'incremental'
+
     def test_parser_options_adds_testomatio_filter_option(self, mock_parser):
         """Test --testomatio-filter option is added"""
         mock_group = mock_parser.getgroup.return_value
@@ -218,7 +228,7 @@ class TestParserOptions:
 
         parser_options(mock_parser)
 
-        assert mock_group.addoption.call_count == 10
+        assert mock_group.addoption.call_count == 11
         assert mock_parser.addini.call_count == 1
 
 
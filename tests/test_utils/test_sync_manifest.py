@@ -0,0 +1,89 @@
+import json
+from pathlib import Path
+from unittest.mock import Mock
+
+from pytestomatio.utils.sync_manifest import SyncManifest, MANIFEST_FILE, MANIFEST_VERSION
+
+
+def make_test(path, title, test_id=None):
+    test = Mock()
+    test.abs_path = str(path)
+    test.title = title
+    test.id = test_id
+    return test
+
+
+def make_item(path):
+    item = Mock()
+    item.path = Path(path)
+    return item
+
+
+class TestSyncManifest:
+    """Tests for SyncManifest"""
+
+    def test_changed_items(self, tmp_path):
+        """Test only items of new, modified files and files with tests without id are changed"""
+        synced, modified, not_synced, new = (tmp_path / name for name in ('a.py', 'b.py', 'c.py', 'd.py'))
+        for path in (synced, modified, not_synced, new):
+            path.write_text(f'# {path.name}')
+        manifest = SyncManifest(str(tmp_path / MANIFEST_FILE), 'fp')
+        manifest.update([str(synced), str(modified), str(not_synced)],
+                        [make_test(synced, 'test_a', '@T1'), make_test(modified, 'test_b', '@T2'),
+                         make_test(not_synced, 'test_c')])
+        modified.write_text('# changed')
+        items = [make_item(path) for path in (synced, modified, not_synced, new, synced)]
+
+        changed = SyncManifest(manifest.path, 'fp', manifest.files).changed_items(items)
+
+        assert changed == [items[1], items[2], items[3]]
+
+    def test_removed_tests(self, tmp_path):
+        """Test tests removed from changed files and tests of deleted files are found"""
+        changed, deleted = tmp_path / 'a.py', tmp_path / 'b.py'
+        changed.write_text('')
+        deleted.write_text('')
+        manifest = SyncManifest(str(tmp_path / MANIFEST_FILE), 'fp')
+        manifest.update([str(changed), str(deleted)],
+                        [make_test(changed, 'test_one', '@T1'), make_test(changed, 'test_two', '@T2'),
+                         make_test(deleted, 'test_three', '@T3')])
+        deleted.unlink()
+
+        removed = manifest.removed_tests([make_test(changed, 'test_one', '@T1')])
+
+        assert sorted(removed) == ['test_three', 'test_two']
+
+    def test_save_and_load(self, tmp_path):
+        """Test manifest saved with relative paths and loaded with the same fingerprint"""
+        test_file = tmp_path / 'tests' / 'test_a.py'
+        test_file.parent.mkdir()
+        test_file.write_text('')
+        path = str(tmp_path / MANIFEST_FILE)
+        manifest = SyncManifest(path, 'fp')
+        manifest.update([str(test_file)], [make_test(test_file, 'test_a', '@T1')])
+        manifest.save()
+
+        data = json.loads(Path(path).read_text())
+        assert data['version'] == MANIFEST_VERSION
+        assert data['files'][str(Path('tests') / 'test_a.py')]['tests'] == [['test_a', '@T1']]
+        assert SyncManifest.load(path, 'fp').files == manifest.files
+
+    def test_load_with_other_fingerprint(self, tmp_path):
+        """Test manifest built with other settings is not used"""
+        path = tmp_path / MANIFEST_FILE
+        path.write_text(json.dumps({'version': MANIFEST_VERSION, 'fingerprint': 'old', 'files': {'a.py': {}}}))
+
+        assert SyncManifest.load(str(path), 'new').files == {}
+
+    def test_load_broken_manifest(self, tmp_path):
+        """Test broken manifest is ignored"""
+        path = tmp_path / MANIFEST_FILE
+        path.write_text('{"version"')
+
+        assert SyncManifest.load(str(path), 'fp').files == {}
+
+    def test_make_fingerprint(self):
+        """Test fingerprint depends on settings"""
+        assert SyncManifest.make_fingerprint(project='a', directory=None) == \
+            SyncManifest.make_fingerprint(directory=None, project='a')
+        assert SyncManifest.make_fingerprint(project='a') != SyncManifest.make_fingerprint(project='b')
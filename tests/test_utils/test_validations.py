@@ -29,7 +29,7 @@ class TestValidateOption:
         assert result is None
         assert 'testomatio' in mock_config.mock_calls[0].args
 
-    @pytest.mark.parametrize("option_value", ['sync', 'report', 'remove', 'launch', 'finish'])
+    @pytest.mark.parametrize("option_value", ['sync', 'report', 'remove', 'launch', 'finish', 'resend'])
     def test_validate_option_raises_error_when_no_testomatio_env(self, mock_config, option_value):
         """Test ValueError raised when no TESTOMATIO env"""
         mock_config.getoption.return_value = option_value
@@ -123,9 +123,10 @@ class TestValidateOption:
             with pytest.raises(ValueError, match='Test Run id was passed. Please unset TESTOMATIO_RUN_ID or TESTOMATIO_RUN env variablses to create an empty run'):
                 validate_option(mock_config)
 
-    def test_validate_finish_option_error_if_run_id_not_set(self, mock_config):
-        """Test validation for finish option failed if test run id not set"""
-        mock_config.getoption.return_value = 'finish'
+    @pytest.mark.parametrize("option_value", ['finish', 'resend'])
+    def test_validate_finish_option_error_if_run_id_not_set(self, mock_config, option_value):
+        """Test validation for finish and resend options failed if test run id not set"""
+        mock_config.getoption.return_value = option_value
 
         with patch.dict(os.environ, {'TESTOMATIO': 'ds'}, clear=True):
             with pytest.raises(ValueError, match='TESTOMATIO_RUN_ID env variable is not set'):